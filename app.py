@@ -3,7 +3,7 @@ import os
 from utils.openai_utils import get_ai_response
 from utils.resume_parsar import extract_resume_text
 from utils.data_analysis import get_skill_gap_analysis
-import uuid
+from utils.job_store import resolve_user_id
 from PIL import Image
 import requests
 from io import BytesIO
@@ -20,8 +20,8 @@ st.set_page_config(
 if "messages" not in st.session_state:
     st.session_state.messages = []
 
-if "user_id" not in st.session_state:
-    st.session_state.user_id = str(uuid.uuid4())
+# Reuse the id from the URL so saved jobs and applications survive a reload
+resolve_user_id(st.session_state, st.query_params)
     
 if "resume_text" not in st.session_state:
     st.session_state.resume_text = None
@@ -199,14 +199,10 @@ def display_chat_interface():
                 "chat_history": st.session_state.messages[:-1]  # Exclude the current message
             }
             
-            response = get_ai_response(prompt, context)
-            
-            # Show the response with a typing effect
-            for chunk in response.split():
-                full_response += chunk + " "
+            # Render chunks as they arrive from the model
+            for chunk in get_ai_response(prompt, context, stream=True):
+                full_response += chunk
                 message_placeholder.markdown(full_response + "▌")
-                import time
-                time.sleep(0.01)
             
             message_placeholder.markdown(full_response)
         
@@ -0,0 +1,91 @@
+"""
+Benchmark the work the application tracker tab does on every rerun.
+
+Compares rebuilding the status counts, table and chart from every
+application (what each Streamlit interaction used to cost) with the
+ApplicationTracker, which keeps running counts and rebuilds the table and
+chart only after a change (a rerun still checks the store for changes
+made by other sessions). Run from the repository root:
+    python -m benchmarks.bench_application_tracker
+"""
+import os
+import random
+import statistics
+import tempfile
+import time
+
+import pandas as pd
+import plotly.express as px
+
+from utils.application_tracker import ApplicationTracker
+from utils.job_store import APPLICATION_STATUSES, JobStore
+
+def sample_applications(count, seed=8):
+    rng = random.Random(seed)
+    return [
+        {
+            "company": f"Company {index}",
+            "title": rng.choice(["Data Scientist", "Software Engineer", "Product Manager"]),
+            "application_date": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "status": rng.choice(APPLICATION_STATUSES),
+            "notes": "Applied through the company website.",
+        }
+        for index in range(count)
+    ]
+
+def rebuild_everything(applications):
+    """The previous per-rerun work: counts, metrics, table and chart from scratch."""
+    status_counts = {}
+    for app in applications:
+        status = app.get("status", "Applied")
+        status_counts[status] = status_counts.get(status, 0) + 1
+    status_df = pd.DataFrame({"Status": list(status_counts.keys()), "Count": list(status_counts.values())})
+    figure = px.bar(status_df, x="Status", y="Count", color="Status", title="Application Status Overview")
+
+    total = len(applications)
+    active = sum(1 for app in applications if app.get("status") not in ["Rejected", "Accepted"])
+    response_rate = sum(1 for app in applications if app.get("status") != "Applied") / total if total else 0
+
+    apps_df = pd.DataFrame(applications)
+    apps_df["application_date"] = pd.to_datetime(apps_df["application_date"])
+    apps_df = apps_df.sort_values(by="application_date", ascending=False)
+    return figure, apps_df, active, response_rate
+
+def tracker_rerun(tracker):
+    assert not tracker.is_stale()
+    return tracker.status_figure(), tracker.table(), tracker.active, tracker.response_rate
+
+def median_ms(function, *args, repeat=20):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+def main():
+    for count in (100, 1_000, 5_000):
+        with tempfile.TemporaryDirectory() as directory:
+            store = JobStore(os.path.join(directory, "store.sqlite3"))
+            store.add_applications("bench", sample_applications(count))
+            tracker = ApplicationTracker(store, "bench")
+            applications = tracker.applications
+
+            # Both must report the same statistics
+            _, _, active, response_rate = rebuild_everything(applications)
+            assert (active, response_rate) == (tracker.active, tracker.response_rate)
+
+            full = median_ms(rebuild_everything, applications)
+            cached = median_ms(tracker_rerun, tracker)
+
+            def update_and_rerun():
+                tracker.update(applications[0]["id"], status=random.choice(APPLICATION_STATUSES))
+                tracker_rerun(tracker)
+
+            changed = median_ms(update_and_rerun)
+
+        print(f"{count:>6,} applications: full rebuild {full:8.2f} ms  "
+              f"tracker rerun {cached:6.3f} ms  after an update {changed:8.2f} ms")
+
+if __name__ == "__main__":
+    main()
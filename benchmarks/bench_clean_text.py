@@ -0,0 +1,29 @@
+"""
+Benchmark clean_text against the five-pass implementation it replaced.
+
+That both produce identical output is checked by tests/test_clean_text.py.
+Run from the repository root:
+    python -m benchmarks.bench_clean_text
+"""
+import random
+import time
+
+from benchmarks.sample_resumes import generate_corpus
+from tests.clean_text_reference import raw_extraction, reference_clean_text
+from utils.resume_parsar import clean_text
+
+def main():
+    rng = random.Random(3)
+    corpus = [raw_extraction(text, rng) for text in generate_corpus(count=100, pages=5)]
+    print(f"Corpus: {len(corpus)} resumes, {sum(len(t) for t in corpus) / 1e6:.1f}M characters")
+
+    for name, fn in (("five-pass", reference_clean_text), ("precompiled", clean_text)):
+        start = time.perf_counter()
+        for _ in range(3):
+            for text in corpus:
+                fn(text)
+        elapsed = (time.perf_counter() - start) / (3 * len(corpus))
+        print(f"{name:>11}: {elapsed * 1000:6.2f} ms/resume")
+
+if __name__ == "__main__":
+    main()
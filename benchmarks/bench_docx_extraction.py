@@ -0,0 +1,67 @@
+"""
+Benchmark streaming DOCX extraction against the python-docx object model.
+
+Builds DOCX resumes with python-docx (needed only for this script), checks
+that every paragraph the old extractor found is still extracted, in the
+same order, and that skills tables are now included, then times both.
+Run from the repository root:
+    python -m benchmarks.bench_docx_extraction
+"""
+import io
+import random
+import time
+
+from docx import Document
+
+from benchmarks.sample_resumes import SKILLS, generate_resume
+from utils.resume_parsar import clean_text, extract_from_docx
+
+class Upload(io.BytesIO):
+    """Minimal stand-in for a Streamlit UploadedFile."""
+    name = "resume.docx"
+
+def build_docx(pages, seed=5):
+    """A resume of roughly ``pages`` pages with a skills table after every page of text."""
+    rng = random.Random(seed)
+    doc = Document()
+    for _ in range(pages):
+        for line in generate_resume(rng, 1).split("\n"):
+            doc.add_paragraph(line)
+        table = doc.add_table(rows=4, cols=2)
+        for row in table.rows:
+            row.cells[0].text = rng.choice(SKILLS)
+            row.cells[1].text = rng.choice(["Expert", "Advanced", "Intermediate"])
+    out = io.BytesIO()
+    doc.save(out)
+    return out.getvalue()
+
+def extract_object_model(data):
+    """The previous extract_from_docx."""
+    doc = Document(io.BytesIO(data))
+    return clean_text("\n".join(para.text for para in doc.paragraphs if para.text.strip()))
+
+def is_subsequence(lines, other_lines):
+    remaining = iter(other_lines)
+    return all(line in remaining for line in lines)
+
+def measure(fn, data, repeat=3):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn(data)
+    return result, (time.perf_counter() - start) / repeat
+
+def main():
+    for pages in (2, 20, 200):
+        data = build_docx(pages)
+        old_text, old_time = measure(extract_object_model, data)
+        new_text, new_time = measure(lambda d: extract_from_docx(Upload(d)), data)
+
+        assert is_subsequence(old_text.split("\n"), new_text.split("\n")), "streaming extraction lost paragraphs"
+        assert "Expert" in new_text or "Advanced" in new_text, "table cells were not extracted"
+        print(
+            f"{pages:>4} pages ({len(data) / 1024:6.0f} KiB): python-docx {old_time * 1000:8.1f} ms | "
+            f"streaming {new_time * 1000:7.1f} ms | {old_time / new_time:4.1f}x"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Benchmark the local job search index.
+
+Times JobIndex builds over synthetic postings and queries with and
+without filters; tests/test_job_index.py checks the ranking. Run from the
+repository root:
+    python -m benchmarks.bench_job_index
+"""
+import statistics
+import time
+
+from benchmarks.sample_postings import generate_postings
+from utils.job_index import JobIndex, normalize_posting
+
+QUERIES = [
+    ("Software Engineer", {}),
+    ("data scientist python", {}),
+    ("cloud architect", {"location": "Remote"}),
+    ("Financial Analyst", {"industry": "Finance", "experience_level": "Senior"}),
+    ("machine learning engineer tensorflow", {"location": "New York"}),
+]
+
+def main():
+    for count in (10_000, 100_000):
+        postings = [normalize_posting(raw, i) for i, raw in enumerate(generate_postings(count))]
+
+        start = time.perf_counter()
+        index = JobIndex(postings)
+        build_time = time.perf_counter() - start
+
+        print(f"{count:,} postings: index built in {build_time:.2f}s")
+        for query, filters in QUERIES:
+            timings = []
+            for page in (1, 2, 3) * 10:
+                start = time.perf_counter()
+                results = index.search(query, page=page, **filters)
+                timings.append(time.perf_counter() - start)
+            label = query + (f" {filters}" if filters else "")
+            print(f"  {label:<70} {results.total:>7,} hits  "
+                  f"median {statistics.median(timings) * 1000:6.2f} ms  max {max(timings) * 1000:6.2f} ms")
+        print()
+
+if __name__ == "__main__":
+    main()
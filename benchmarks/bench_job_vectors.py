@@ -0,0 +1,54 @@
+"""
+Benchmark resume-to-job matching with the posting vector index.
+
+Times building, saving and opening the index and ranking resumes against
+100k synthetic postings; tests/test_job_vectors.py checks its accuracy.
+Run from the repository root:
+    python -m benchmarks.bench_job_vectors
+"""
+import statistics
+import tempfile
+import time
+
+from benchmarks.sample_postings import generate_postings
+from benchmarks.sample_resumes import generate_corpus
+from utils.job_index import normalize_posting
+from utils.job_vectors import JobVectorIndex
+
+def main():
+    resumes = generate_corpus(20, seed=4)
+    for count in (10_000, 100_000):
+        postings = [normalize_posting(raw, i) for i, raw in enumerate(generate_postings(count))]
+
+        start = time.perf_counter()
+        index = JobVectorIndex.build(postings)
+        build_time = time.perf_counter() - start
+
+        with tempfile.TemporaryDirectory() as directory:
+            index.save(directory, source="benchmark")
+            start = time.perf_counter()
+            loaded, _ = JobVectorIndex.load(directory)
+            load_time = time.perf_counter() - start
+
+            embed_times = []
+            search_times = []
+            for text in resumes:
+                start = time.perf_counter()
+                query = loaded.embed(text)
+                embed_times.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                loaded.top_k(query, 20)
+                search_times.append(time.perf_counter() - start)
+            del loaded
+
+        print(f"{count:,} postings ({index.vectors.shape[1]} dimensions, {len(index.vocabulary):,} terms)")
+        print(f"  build            {build_time:8.2f} s")
+        print(f"  open (mmap)      {load_time * 1000:8.2f} ms")
+        print(f"  embed resume     {statistics.median(embed_times) * 1000:8.2f} ms median")
+        print(f"  top 20 postings  {statistics.median(search_times) * 1000:8.2f} ms median, "
+              f"{max(search_times) * 1000:.2f} ms max")
+        print()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Benchmark serial and process-pool PDF text extraction.
+
+Checks that both modes return the same text, then times them on
+synthetic PDFs of increasing length. Run from the repository root:
+    python -m benchmarks.bench_pdf_extraction
+"""
+import io
+import os
+import time
+
+from benchmarks.sample_resumes import generate_pdf
+from utils import resume_parsar
+
+class Upload(io.BytesIO):
+    """Minimal stand-in for a Streamlit UploadedFile."""
+    name = "resume.pdf"
+
+def timed_extract(pdf_bytes, min_pages):
+    resume_parsar.PDF_PARALLEL_MIN_PAGES = min_pages
+    start = time.perf_counter()
+    text = resume_parsar.extract_from_pdf(Upload(pdf_bytes))
+    return text, time.perf_counter() - start
+
+def main():
+    print(f"Workers: {resume_parsar.PDF_EXTRACT_WORKERS} (CPUs: {os.cpu_count()})")
+    # Start the pool outside the timings
+    resume_parsar._get_pdf_pool().submit(int).result()
+
+    for pages in (4, 16, 64, 256):
+        pdf_bytes = generate_pdf(pages)
+        serial_text, serial_time = timed_extract(pdf_bytes, min_pages=pages + 1)
+        parallel_text, parallel_time = timed_extract(pdf_bytes, min_pages=1)
+        assert serial_text == parallel_text, "parallel extraction changed the text"
+        print(
+            f"{pages:>4} pages: serial {serial_time * 1000:8.1f} ms | "
+            f"parallel {parallel_time * 1000:8.1f} ms | speedup {serial_time / parallel_time:4.2f}x"
+        )
+
+if __name__ == "__main__":
+    main()
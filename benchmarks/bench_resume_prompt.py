@@ -0,0 +1,67 @@
+"""
+Compare analyze_resume prompt sizes before and after section-aware compression.
+
+Reports the tokens sent for the resume content with the old 15,000
+character cut and with build_resume_prompt_text(), and checks that the
+experience section is still present with its dated role lines and that
+page headers and footers appear only once. Token counts use tiktoken when it is
+installed and the four-characters-per-token estimate otherwise. Run from
+the repository root:
+    python -m benchmarks.bench_resume_prompt
+"""
+import time
+
+from benchmarks.sample_resumes import generate_corpus
+from utils.resume_prompt import RESUME_TOKEN_BUDGET, _get_encoder, build_resume_prompt_text, count_tokens
+
+def check_prompt_content():
+    """Dated role lines and repeated bullets survive; running headers and footers do not."""
+    resume = "\n".join([
+        "Alex Morgan | alex@example.com",
+        "Summary",
+        "Engineer with ten years of experience.",
+        "Experience",
+        "Senior Engineer - TechCorp Inc. (2019 - 2023)",
+        "• Led the migration to Kubernetes.",
+        "Alex Morgan | alex@example.com",
+        "Page 1 of 2",
+        "Engineer - Data Analytics Partners (2015 - 2019)",
+        "• Led the migration to Kubernetes.",
+        "Education",
+        "2014 BSc Computer Science, State University",
+        "Alex Morgan | alex@example.com",
+    ])
+    prompt = build_resume_prompt_text(resume)
+    for line in ("Senior Engineer - TechCorp Inc. (2019 - 2023)",
+                 "Engineer - Data Analytics Partners (2015 - 2019)",
+                 "2014 BSc Computer Science, State University"):
+        assert line in prompt, f"dropped: {line}"
+    assert prompt.count("• Led the migration to Kubernetes.") == 2, "bullet repeated under two roles dropped"
+    assert prompt.count("Alex Morgan | alex@example.com") == 1, "page header kept"
+    assert "Page 1 of 2" not in prompt, "page footer kept"
+
+def main():
+    check_prompt_content()
+    print(f"Budget: {RESUME_TOKEN_BUDGET} tokens ({'tiktoken' if _get_encoder() else 'estimated'} counts)")
+    for pages in (1, 2, 5, 10):
+        corpus = generate_corpus(count=20, pages=pages)
+        old_tokens = sum(count_tokens(text[:15000]) for text in corpus) / len(corpus)
+
+        start = time.perf_counter()
+        prompts = [build_resume_prompt_text(text) for text in corpus]
+        build_time = (time.perf_counter() - start) / len(corpus)
+
+        new_tokens = sum(count_tokens(prompt) for prompt in prompts) / len(corpus)
+        assert all(count_tokens(prompt) <= RESUME_TOKEN_BUDGET for prompt in prompts), "prompt over budget"
+        assert all("Experience:" in prompt for prompt in prompts), "experience section dropped"
+        # The most recent role (the first line under Experience) keeps its dates
+        assert all(
+            text.split("Experience\n", 1)[1].split("\n", 1)[0] in prompt for text, prompt in zip(corpus, prompts)
+        ), "dated role line dropped"
+        print(
+            f"{pages:>3} pages: truncated {old_tokens:7.0f} tokens | compressed {new_tokens:7.0f} tokens "
+            f"({1 - new_tokens / old_tokens:5.1%} fewer) | build {build_time * 1000:5.1f} ms"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark SkillMatcher against the per-skill regex loop it replaced.
+
+Both approaches must find exactly the same skills; the script checks this
+for every resume before reporting timings. Run from the repository root:
+    python -m benchmarks.bench_skill_matcher
+"""
+import random
+import re
+import time
+
+from benchmarks.sample_resumes import generate_corpus
+from utils.skill_matcher import SkillMatcher
+from utils.skill_taxonomy import SkillTaxonomy
+
+def build_taxonomy(size, seed=7):
+    """Real skills padded with synthetic multi-word skill names."""
+    rng = random.Random(seed)
+    skills = dict.fromkeys(skill.name.lower() for skill in SkillTaxonomy.builtin())
+    syllables = [
+        "data", "cloud", "net", "sec", "ops", "ml", "graph", "stream", "edge", "quant", "bio", "geo",
+        "web", "dev", "sys", "lab", "core", "flow", "grid", "micro", "nano", "auto", "info", "tele",
+    ]
+    while len(skills) < size:
+        words = [rng.choice(syllables) + rng.choice(syllables) for _ in range(rng.randint(1, 3))]
+        skills[" ".join(words)] = None
+    return list(skills)[:size]
+
+def regex_loop(skills, text):
+    """The original extract_skills matching loop."""
+    return {skill for skill in skills if re.search(r'\b' + re.escape(skill) + r'\b', text)}
+
+def main():
+    corpus = [text.lower() for text in generate_corpus(count=50, pages=2)]
+    print(f"Corpus: {len(corpus)} resumes")
+
+    for size in (70, 1_000, 10_000, 50_000):
+        skills = build_taxonomy(size)
+
+        start = time.perf_counter()
+        matcher = SkillMatcher(skills)
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        matched = [matcher.find(text) for text in corpus]
+        matcher_time = time.perf_counter() - start
+
+        # The regex loop gets slow quickly; time it on a subset for big taxonomies
+        sample = corpus if size <= 1_000 else corpus[:5]
+        start = time.perf_counter()
+        expected = [regex_loop(skills, text) for text in sample]
+        regex_time = (time.perf_counter() - start) * len(corpus) / len(sample)
+
+        assert expected == matched[:len(sample)], "SkillMatcher disagrees with the regex loop"
+        print(
+            f"{len(skills):>6} skills: build {build_time * 1000:8.1f} ms | "
+            f"automaton {matcher_time / len(corpus) * 1000:7.2f} ms/resume | "
+            f"regex loop {regex_time / len(corpus) * 1000:9.2f} ms/resume"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark loading a large skill taxonomy from its SQLite file.
+
+Writes a synthetic 50k-skill taxonomy (with aliases and industry tags) to a
+temporary file and times SkillTaxonomy.load(), the first matcher build and
+a lookup pass. Run from the repository root:
+    python -m benchmarks.bench_skill_taxonomy
+"""
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.bench_skill_matcher import build_taxonomy
+from benchmarks.sample_resumes import generate_corpus
+from utils.skill_taxonomy import Skill, SkillTaxonomy
+
+INDUSTRIES = ["Technology", "Healthcare", "Finance", "Education", "Manufacturing", "Retail"]
+
+def synthetic_taxonomy(size, seed=11):
+    """Synthetic skills, a third with an alias and a tenth tagged with an industry."""
+    rng = random.Random(seed)
+    skills = []
+    for index, name in enumerate(build_taxonomy(size)):
+        aliases = (name.replace(" ", "-"),) if " " in name and index % 3 == 0 else ()
+        industries = (rng.choice(INDUSTRIES),) if index % 10 == 0 else ()
+        skills.append(Skill(name.title(), "Synthetic", aliases, industries))
+    return SkillTaxonomy(skills)
+
+def main():
+    for size in (1_000, 10_000, 50_000):
+        taxonomy = synthetic_taxonomy(size)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "taxonomy.sqlite3")
+            taxonomy.save(path)
+            file_size = os.path.getsize(path)
+
+            start = time.perf_counter()
+            loaded = SkillTaxonomy.load(path)
+            load_time = time.perf_counter() - start
+
+        assert len(loaded) == len(taxonomy)
+
+        start = time.perf_counter()
+        loaded.matcher
+        matcher_time = time.perf_counter() - start
+
+        corpus = generate_corpus(count=20, pages=2)
+        start = time.perf_counter()
+        for text in corpus:
+            loaded.find_skills(text)
+        find_time = (time.perf_counter() - start) / len(corpus)
+
+        print(
+            f"{size:>6} skills ({file_size / 1024:7.0f} KiB): load {load_time * 1000:7.1f} ms | "
+            f"matcher build {matcher_time * 1000:7.1f} ms | find {find_time * 1000:6.2f} ms/resume"
+        )
+
+if __name__ == "__main__":
+    main()
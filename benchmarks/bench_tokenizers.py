@@ -0,0 +1,48 @@
+"""
+Benchmark the nlp_utils tokenizer backends on a corpus of sample resumes.
+
+Run from the repository root:
+    python -m benchmarks.bench_tokenizers
+"""
+import string
+import time
+
+from benchmarks.sample_resumes import generate_corpus
+from utils.nlp_utils import TOKENIZERS
+from utils.nltk_resources import get_stopwords
+
+def filtered_tokens(tokens, stop_words):
+    """Apply the same filtering as extract_keywords."""
+    return [t for t in tokens if t not in stop_words and t not in string.punctuation and len(t) > 2]
+
+def main():
+    corpus = [text.lower() for text in generate_corpus(count=200, pages=3)]
+    print(f"Corpus: {len(corpus)} resumes, {sum(len(t) for t in corpus) / 1e6:.1f}M characters")
+
+    outputs = {}
+    for name, tokenizer in TOKENIZERS.items():
+        try:
+            tokenizer(corpus[0])  # Warm up (resolves NLTK models on first use)
+        except LookupError as e:
+            print(f"{name:>6}: skipped ({e})")
+            continue
+
+        start = time.perf_counter()
+        outputs[name] = [tokenizer(text) for text in corpus]
+        elapsed = time.perf_counter() - start
+        token_count = sum(len(tokens) for tokens in outputs[name])
+        print(f"{name:>6}: {token_count / elapsed:>12,.0f} tokens/sec ({elapsed:.3f}s for {token_count:,} tokens)")
+
+    if len(outputs) == 2:
+        try:
+            stop_words = get_stopwords()
+        except LookupError:
+            stop_words = frozenset()
+        agree = sum(
+            filtered_tokens(a, stop_words) == filtered_tokens(b, stop_words)
+            for a, b in zip(outputs["regex"], outputs["nltk"])
+        )
+        print(f"Identical filtered token streams: {agree}/{len(corpus)} resumes")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Measure peak RSS while extracting text from a large uploaded PDF (Linux only).
+
+Each mode runs in a fresh interpreter. The upload is loaded into an
+in-memory file (as Streamlit does) before the baseline is taken, so the
+reported growth is what extraction itself allocates. The pool modes use
+four worker processes and also report the largest worker's peak RSS. Run from the
+repository root:
+    python -m benchmarks.bench_upload_memory [size_mb]
+"""
+import io
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.sample_resumes import generate_pdf
+
+MODES = ("copying", "streaming", "copying-pool", "streaming-pool")
+
+class Upload(io.BytesIO):
+    """Minimal stand-in for a Streamlit UploadedFile."""
+    name = "resume.pdf"
+
+    def __init__(self, data):
+        # Mutable copy, so BytesIO cannot share the bytes object it was given
+        super().__init__(bytearray(data))
+        self.size = len(data)
+
+def _status_mb(field):
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) / 1024  # Reported in kB
+    raise KeyError(field)
+
+def reset_peak_rss():
+    """Reset the process high-water mark (Linux), so earlier transient allocations do not count."""
+    with open("/proc/self/clear_refs", "w") as f:
+        f.write("5")
+
+def peak_rss_mb():
+    return _status_mb("VmHWM")
+
+def extract_copying(upload):
+    """The previous extract_from_pdf: copy the upload, wrap it again and concatenate pages."""
+    import PyPDF2
+    from utils.resume_parsar import clean_text
+
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(upload.getvalue()))
+    text = ""
+    for page in pdf_reader.pages:
+        page_text = page.extract_text()
+        if page_text:
+            text += page_text + "\n"
+    return clean_text(text)
+
+def _extract_range_from_bytes(pdf_bytes, start, end):
+    """The previous page-range worker, which received the whole PDF pickled."""
+    import PyPDF2
+
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+    return [pdf_reader.pages[index].extract_text() or "" for index in range(start, end)]
+
+def extract_copying_pool(upload, resume_parsar):
+    """The previous process-pool path: every page range is submitted with a copy of the bytes."""
+    import PyPDF2
+
+    pdf_bytes = upload.getvalue()
+    page_count = len(PyPDF2.PdfReader(io.BytesIO(pdf_bytes)).pages)
+    chunk_size = max(1, -(-page_count // (resume_parsar.PDF_EXTRACT_WORKERS * 4)))
+    pool = resume_parsar._get_pdf_pool()
+    futures = [
+        pool.submit(_extract_range_from_bytes, pdf_bytes, start, min(start + chunk_size, page_count))
+        for start in range(0, page_count, chunk_size)
+    ]
+    return resume_parsar.clean_text("".join(t + "\n" for f in futures for t in f.result() if t))
+
+def run_child(mode, path):
+    from utils import resume_parsar
+
+    with open(path, "rb") as f:
+        upload = Upload(f.read())
+    reset_peak_rss()
+    baseline = _status_mb("VmRSS")
+
+    if mode == "copying":
+        extract_copying(upload)
+    elif mode == "streaming":
+        resume_parsar.PDF_PARALLEL_MIN_PAGES = sys.maxsize  # Serial path
+        resume_parsar.extract_resume_text(upload)
+    elif mode == "copying-pool":
+        extract_copying_pool(upload, resume_parsar)
+    else:
+        resume_parsar.PDF_PARALLEL_MIN_PAGES = 1
+        resume_parsar.extract_resume_text(upload)
+
+    parent_peak = peak_rss_mb() - baseline
+    resume_parsar._get_pdf_pool().shutdown()
+    worker_peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024  # KiB on Linux
+    print(f"{parent_peak:.1f} {worker_peak:.1f}")
+
+def main():
+    size_mb = float(sys.argv[1]) if len(sys.argv) > 1 else 20
+    pdf_bytes = generate_pdf(pages=40, padding_bytes=int(size_mb * 2**20))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "upload.pdf")
+        with open(path, "wb") as f:
+            f.write(pdf_bytes)
+        print(f"PDF: {len(pdf_bytes) / 2**20:.1f} MB, 40 pages")
+
+        env = dict(os.environ, MAX_UPLOAD_BYTES=str(len(pdf_bytes)), PDF_EXTRACT_WORKERS="4")
+        for mode in MODES:
+            result = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_upload_memory", "--child", mode, path],
+                capture_output=True, text=True, check=True, env=env
+            )
+            parent_peak, worker_peak = result.stdout.split()
+            print(f"{mode:>14}: peak RSS grew {parent_peak:>6} MB during extraction | largest worker {worker_peak:>6} MB")
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--child":
+        run_child(sys.argv[2], sys.argv[3])
+    else:
+        main()
@@ -0,0 +1,54 @@
+import random
+from typing import Dict, List
+
+from benchmarks.sample_resumes import SKILLS
+
+# Building blocks for synthetic job postings used by the benchmarks
+TITLES = [
+    "Software Engineer", "Senior Software Engineer", "Data Scientist", "Data Engineer", "DevOps Engineer",
+    "Cloud Architect", "Machine Learning Engineer", "Product Manager", "Frontend Developer",
+    "Backend Developer", "Financial Analyst", "Risk Manager", "Nurse Practitioner", "Instructional Designer",
+    "Supply Chain Analyst", "Digital Marketing Specialist", "Cybersecurity Specialist", "QA Engineer",
+]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises", "Cyberdyne"]
+LOCATIONS = ["Remote", "New York, NY", "San Francisco, CA", "London, UK", "Austin, TX", "Berlin, Germany", "Toronto, Canada"]
+INDUSTRIES = ["Technology", "Healthcare", "Finance", "Education", "Manufacturing", "Retail"]
+LEVELS = ["Entry Level", "Mid Level", "Senior", "Executive"]
+SENTENCES = [
+    "We are looking for a {title} to join our growing {industry} team.",
+    "You will design, build and operate systems using {skill} and {skill2}.",
+    "Experience with {skill} in production environments is a strong plus.",
+    "Collaborate with product, design and engineering stakeholders to deliver high quality results.",
+    "Mentor teammates, review code and help shape our engineering culture.",
+    "Own projects end to end, from requirements to launch and iteration.",
+    "Work with large datasets and drive decisions with clear analysis.",
+    "Competitive salary, flexible hours and a generous learning budget.",
+]
+
+def generate_posting(rng: random.Random, index: int) -> Dict:
+    """Build one synthetic job posting."""
+    title = rng.choice(TITLES)
+    industry = rng.choice(INDUSTRIES)
+    skills = rng.sample(SKILLS, rng.randint(4, 8))
+    description = " ".join(
+        sentence.format(title=title, industry=industry, skill=rng.choice(skills), skill2=rng.choice(skills))
+        for sentence in rng.sample(SENTENCES, 5)
+    )
+    return {
+        "id": f"job-{index}",
+        "title": title,
+        "company": f"{rng.choice(COMPANIES)} {rng.randint(1, 500)}",
+        "location": rng.choice(LOCATIONS),
+        "industry": industry,
+        "experience_level": rng.choice(LEVELS),
+        "job_type": rng.choice(["Full-time", "Part-time", "Contract"]),
+        "salary_range": f"${rng.randint(50, 120)}k - ${rng.randint(121, 250)}k",
+        "description": description,
+        "required_skills": skills,
+        "posted_date": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+    }
+
+def generate_postings(count: int = 10_000, seed: int = 42) -> List[Dict]:
+    """Deterministic list of synthetic job postings."""
+    rng = random.Random(seed)
+    return [generate_posting(rng, index) for index in range(count)]
@@ -0,0 +1,116 @@
+import os
+import random
+from typing import List
+
+# Building blocks for synthetic resumes used by the benchmarks
+NAMES = ["Alex Morgan", "Priya Sharma", "Jordan Lee", "Maria Garcia", "Chen Wei", "Samuel Okafor"]
+ROLES = ["Software Engineer", "Data Scientist", "DevOps Engineer", "Product Manager", "Cloud Architect"]
+COMPANIES = ["TechCorp Inc.", "Data Analytics Partners", "Global Finance Solutions", "Innovative Healthcare"]
+SKILLS = [
+    "Python", "Java", "JavaScript", "TypeScript", "C++", "Go", "React", "Node.js", "Django", "Flask",
+    "SQL", "PostgreSQL", "MongoDB", "Spark", "Pandas", "NumPy", "PyTorch", "TensorFlow", "AWS", "Azure",
+    "GCP", "Docker", "Kubernetes", "Terraform", "Jenkins", "CI/CD", "Git", "Linux", "Tableau", "Power BI",
+    "Agile", "Scrum", "Microservices", "Leadership", "Communication", "Problem Solving",
+]
+BULLETS = [
+    "Developed and maintained {skill} services handling 1,000,000+ requests per day.",
+    "Led a team of {n} engineers to deliver a {skill}-based analytics platform ahead of schedule.",
+    "Implemented automated {skill} pipelines, which reduced deployment time by {n}0%.",
+    "Designed microservices in {skill} and improved system reliability; didn't compromise latency.",
+    "Collaborated with cross-functional teams (product, design & QA) to launch the company's new portal.",
+    "Optimized {skill} queries, decreasing report generation time from {n} hours to minutes.",
+    "Mentored junior developers on {skill} best practices, code reviews and problem-solving.",
+    "Spearheaded migration to {skill}, e.g. moving 40+ legacy jobs with zero downtime.",
+]
+
+def generate_resume(rng: random.Random, pages: int = 2) -> str:
+    """Build one synthetic resume of roughly ``pages`` pages of text."""
+    lines = [
+        rng.choice(NAMES),
+        "Contact Information",
+        "Email: candidate@example.com | Phone: (555) 123-4567 | https://linkedin.com/in/candidate",
+        "",
+        "Summary",
+        f"Experienced {rng.choice(ROLES)} with {rng.randint(2, 15)} years of experience building "
+        "scalable, reliable systems. Passionate about clean code and mentoring.",
+        "",
+        "Skills",
+        ", ".join(rng.sample(SKILLS, 12)),
+        "",
+        "Experience",
+    ]
+    for _ in range(pages * 3):
+        lines.append(f"{rng.choice(ROLES)} - {rng.choice(COMPANIES)} (Jan 2018 - Present, {rng.randint(1, 8)} years)")
+        for _ in range(5):
+            lines.append("• " + rng.choice(BULLETS).format(skill=rng.choice(SKILLS), n=rng.randint(2, 9)))
+        lines.append("")
+    lines += [
+        "Education",
+        "Bachelor of Science in Computer Science, State University, 2014",
+        "",
+        "Certifications",
+        "AWS Certified Solutions Architect; Certified Scrum Master",
+    ]
+    return "\n".join(lines)
+
+def generate_corpus(count: int = 200, pages: int = 2, seed: int = 42) -> List[str]:
+    """Deterministic corpus of synthetic resumes."""
+    rng = random.Random(seed)
+    return [generate_resume(rng, pages) for _ in range(count)]
+
+def _pdf_escape(line: str) -> str:
+    ascii_line = line.encode("ascii", "replace").decode("ascii")
+    return ascii_line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+def generate_pdf(pages: int = 20, seed: int = 42, padding_bytes: int = 0) -> bytes:
+    """
+    Build a text PDF of ``pages`` pages from synthetic resume text.
+
+    ``padding_bytes`` of incompressible image data are spread across the
+    pages (as they would be by embedded photos or scans) to produce large
+    files without adding text.
+    """
+    rng = random.Random(seed)
+    lines = []
+    while len(lines) < pages * 45:
+        lines.extend(line for line in generate_resume(rng, 2).split("\n") if line)
+
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_refs = []
+    image_size = padding_bytes // pages if padding_bytes else 0
+    for page in range(pages):
+        body = ["BT /F1 10 Tf 12 TL 50 800 Td"]
+        body += [f"({_pdf_escape(line)}) '" for line in lines[page * 45:(page + 1) * 45]]
+        body.append("ET")
+        content = "\n".join(body).encode("ascii")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+        content_ref = len(objects)
+
+        resources = b"/Font << /F1 3 0 R >>"
+        if image_size:
+            data = os.urandom(image_size)
+            objects.append(
+                b"<< /Type /XObject /Subtype /Image /Width %d /Height 1 /ColorSpace /DeviceGray "
+                b"/BitsPerComponent 8 /Length %d >>\nstream\n%s\nendstream" % (image_size, image_size, data)
+            )
+            resources += b" /XObject << /Im0 %d 0 R >>" % len(objects)
+
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Contents %d 0 R /Resources << %s >> >>"
+            % (content_ref, resources)
+        )
+        page_refs.append(len(objects))
+
+    kids = b" ".join(b"%d 0 R" % ref for ref in page_refs)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, pages)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, obj)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
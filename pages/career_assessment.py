@@ -362,7 +362,7 @@ from typing import Dict
 sys.path.append(str(Path(__file__).parent.parent))
 
 try:
-    from utils.openai_utils import get_openai_client, get_career_path_recommendations
+    from utils.openai_utils import request_json_completion, get_career_path_recommendations
 except ImportError as e:
     st.error(f"Failed to import required modules: {str(e)}")
     st.stop()
@@ -405,8 +405,6 @@ def display_assessment_form():
 
 def analyze_assessment(assessment_data: Dict) -> Dict:
     """Analyze assessment data using OpenAI"""
-    client = get_openai_client()
-    
     prompt = f"""Analyze this career assessment data and provide recommendations:
     {json.dumps(assessment_data, indent=2)}
     
@@ -426,16 +424,14 @@ def analyze_assessment(assessment_data: Dict) -> Dict:
     """
     
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o",
+        return request_json_completion(
             messages=[
                 {"role": "system", "content": "You are an expert career counselor."},
                 {"role": "user", "content": prompt}
             ],
-            response_format={"type": "json_object"},
-            temperature=0.7
+            temperature=0.7,
+            call_site="assessment"
         )
-        return json.loads(response.choices[0].message.content)
     except Exception as e:
         return {
             "error": str(e),
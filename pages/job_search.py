@@ -1,22 +1,20 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-from utils.openai_utils import get_openai_client
+from utils.openai_utils import request_json_completion
+from utils.application_tracker import ApplicationTracker
+from utils.job_index import get_job_index
+from utils.job_store import APPLICATION_STATUSES, get_job_store, resolve_user_id
+from utils.job_vectors import get_job_vectors
+from utils.skill_taxonomy import get_taxonomy
 import json
 from datetime import datetime
 import random
 
+JOBS_PER_PAGE = 10
+
 def app():
     st.title("Job Search Assistant")
     
-    # Initialize session state for saved jobs
-    if "saved_jobs" not in st.session_state:
-        st.session_state.saved_jobs = []
-    
-    # Initialize session state for job search history
-    if "search_history" not in st.session_state:
-        st.session_state.search_history = []
-    
     # Tabs for different job search functions
     tabs = st.tabs(["Search Jobs", "Saved Jobs", "Job Application Tracker"])
     
@@ -62,33 +60,47 @@ def display_job_search():
         
         if search_button and job_title:
             # Add search to history
-            st.session_state.search_history.append({
+            get_job_store().add_search(get_user_id(), {
                 "job_title": job_title,
                 "industry": industry,
                 "location": location,
-                "experience_level": experience_level,
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                "experience_level": experience_level
             })
             
-            # Perform job search
+            # Perform job search; results are kept so paging and saving survive reruns
+            st.session_state.job_search = {
+                "job_title": job_title,
+                "industry": industry,
+                "location": location,
+                "experience_level": experience_level,
+            }
             with st.spinner("Searching for jobs..."):
-                jobs = search_jobs(job_title, industry, location, experience_level)
-                
-                if "error" in jobs:
-                    st.error(jobs["error"])
-                else:
-                    display_job_results(jobs)
+                st.session_state.job_results = search_jobs(job_title, industry, location, experience_level)
+    
+    # Rank every posting against the resume (or the profile's skills)
+    if st.button("Find Jobs Matching My Profile"):
+        with st.spinner("Matching jobs to your profile..."):
+            st.session_state.job_results = recommend_jobs()
+    
+    if st.session_state.get("job_results"):
+        jobs = st.session_state.job_results
+        
+        if "error" in jobs:
+            st.error(jobs["error"])
+        else:
+            display_job_results(jobs)
     
     # Recent searches
-    if st.session_state.search_history:
+    search_history = get_job_store().list_searches(get_user_id())
+    if search_history:
         with st.expander("Recent Searches"):
             # Display recent searches in a dataframe
-            searches_df = pd.DataFrame(st.session_state.search_history)
+            searches_df = pd.DataFrame(search_history)
             st.dataframe(searches_df[["job_title", "industry", "location", "timestamp"]])
             
             # Option to clear search history
             if st.button("Clear Search History"):
-                st.session_state.search_history = []
+                get_job_store().clear_searches(get_user_id())
                 st.rerun()
     
     # Job search tips
@@ -136,7 +148,15 @@ def display_job_results(jobs_data):
         return
     
     # Display jobs
-    st.subheader(f"Found {len(jobs)} matching jobs")
+    total = jobs_data.get("total", len(jobs))
+    st.subheader(f"Found {total} matching jobs")
+    
+    if jobs_data.get("source") in ("index", "match"):
+        if st.checkbox("Add AI company summaries to this page", key="enrich_jobs"):
+            with st.spinner("Summarizing companies..."):
+                jobs = enrich_jobs(jobs)
+    
+    match_scores = profile_match_scores(jobs)
     
     for i, job in enumerate(jobs):
         with st.expander(f"{job.get('title')} - {job.get('company')}"):
@@ -150,15 +170,20 @@ def display_job_results(jobs_data):
                     st.markdown(f"**Salary Range:** {job.get('salary_range')}")
                 
                 st.markdown(f"**Posted:** {job.get('posted_date', 'Not specified')}")
+                
+                if job.get("id") in match_scores:
+                    st.markdown(f"**Profile Match:** {max(0.0, match_scores[job['id']]):.0%}")
+                
                 st.markdown("---")
                 st.markdown("**Job Description:**")
                 st.write(job.get('description', 'No description available.'))
                 
                 # Skills match
-                if "skills_match" in job:
+                if job.get("required_skills"):
                     st.markdown("**Skills Match:**")
                     user_skills = st.session_state.user_profile.get("skills", [])
-                    matching_skills = set(job["skills_match"]).intersection(set(user_skills))
+                    # Compare canonical names so "postgres" matches "PostgreSQL"
+                    matching_skills = get_taxonomy().match_skills(user_skills, job["required_skills"])
                     
                     if matching_skills:
                         st.markdown("Your matching skills:")
@@ -169,29 +194,63 @@ def display_job_results(jobs_data):
             
             with col2:
                 # Add to saved jobs button
-                if st.button("Save Job", key=f"save_{i}"):
-                    save_job(job)
-                    st.success("Job saved!")
+                if st.button("Save Job", key=f"save_{job.get('id', i)}"):
+                    if save_job(job):
+                        st.success("Job saved!")
+                    else:
+                        st.info("You already saved this job.")
                 
                 # Apply button
-                st.markdown(f"[Apply Now](https://example.com/jobs/{i}) 🔗")
+                st.markdown(f"[Apply Now]({job.get('url') or f'https://example.com/jobs/{i}'}) 🔗")
                 
                 # Company info
                 st.markdown("**About the Company:**")
-                st.write(job.get('company_description', 'No company information available.'))
+                st.write(job.get('company_description') or 'No company information available.')
+    
+    # Pagination
+    page = jobs_data.get("page", 1)
+    page_count = jobs_data.get("page_count", 1)
+    if page_count > 1:
+        col1, col2, col3 = st.columns([1, 2, 1])
+        
+        with col1:
+            if page > 1 and st.button("Previous Page"):
+                show_results_page(page - 1)
+        
+        with col2:
+            st.markdown(f"Page {page} of {page_count}")
+        
+        with col3:
+            if page < page_count and st.button("Next Page"):
+                show_results_page(page + 1)
+
+def show_results_page(page):
+    """
+    Re-run the last search for another page of results.
+    
+    Args:
+        page (int): 1-based page number
+    """
+    st.session_state.job_results = search_jobs(**st.session_state.job_search, page=page)
+    st.rerun()
 
 def display_saved_jobs():
     """Display the user's saved jobs."""
     st.header("Saved Jobs")
     
-    saved_jobs = st.session_state.saved_jobs
+    store = get_job_store()
+    user_id = get_user_id()
+    saved_jobs = store.list_saved_jobs(user_id)
     
     if not saved_jobs:
         st.info("You haven't saved any jobs yet. Use the Search tab to find and save jobs.")
         return
     
+    tracker = get_tracker()
+    
     # Display saved jobs
-    for i, job in enumerate(saved_jobs):
+    for job in saved_jobs:
+        i = job["id"]
         with st.expander(f"{job.get('title')} - {job.get('company')}"):
             col1, col2 = st.columns([3, 1])
             
@@ -211,17 +270,16 @@ def display_saved_jobs():
             with col2:
                 # Remove from saved jobs button
                 if st.button("Remove", key=f"remove_{i}"):
-                    st.session_state.saved_jobs.pop(i)
+                    store.remove_saved_job(user_id, i)
                     st.rerun()
                 
                 # Apply button
-                st.markdown(f"[Apply Now](https://example.com/jobs/{i}) 🔗")
+                st.markdown(f"[Apply Now]({job.get('url') or f'https://example.com/jobs/{i}'}) 🔗")
                 
                 # Show status if tracked
-                for application in st.session_state.get("job_applications", []):
-                    if are_jobs_same(job, application):
-                        st.success(f"Status: {application.get('status', 'Applied')}")
-                        break
+                status = tracker.status_of(job)
+                if status is not None:
+                    st.success(f"Status: {status}")
                 else:
                     # Add to job tracker button
                     if st.button("Track Application", key=f"track_{i}"):
@@ -233,9 +291,7 @@ def display_job_tracker():
     """Display the job application tracker."""
     st.header("Job Application Tracker")
     
-    # Initialize job applications in session state if needed
-    if "job_applications" not in st.session_state:
-        st.session_state.job_applications = []
+    tracker = get_tracker()
     
     # Add new application form
     with st.expander("Add New Application"):
@@ -243,10 +299,7 @@ def display_job_tracker():
             company = st.text_input("Company Name")
             job_title = st.text_input("Job Title")
             application_date = st.date_input("Application Date")
-            status = st.selectbox(
-                "Status",
-                ["Applied", "Screening", "Interview", "Technical Test", "Offer", "Rejected", "Accepted"]
-            )
+            status = st.selectbox("Status", APPLICATION_STATUSES)
             notes = st.text_area("Notes")
             
             if st.form_submit_button("Add Application"):
@@ -259,93 +312,39 @@ def display_job_tracker():
                         "notes": notes,
                         "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                     }
-                    st.session_state.job_applications.append(new_application)
+                    tracker.add([new_application])
                     st.success("Application added!")
                     st.rerun()
                 else:
                     st.error("Company name and job title are required!")
     
-    # Display application statistics
-    applications = st.session_state.job_applications
-    
-    if applications:
+    # Display application statistics; counts are kept up to date by the tracker
+    # and the chart and table are only rebuilt after the applications change
+    if len(tracker):
+        applications = tracker.applications
         col1, col2 = st.columns(2)
         
         with col1:
-            # Count applications by status
-            status_counts = {}
-            for app in applications:
-                status = app.get("status", "Applied")
-                status_counts[status] = status_counts.get(status, 0) + 1
-            
-            # Create a DataFrame for the status counts
-            status_df = pd.DataFrame({
-                "Status": list(status_counts.keys()),
-                "Count": list(status_counts.values())
-            })
-            
-            # Create a bar chart
-            fig = px.bar(
-                status_df,
-                x="Status",
-                y="Count",
-                color="Status",
-                title="Application Status Overview"
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(tracker.status_figure(), use_container_width=True)
         
         with col2:
-            # Calculate metrics
-            total_applications = len(applications)
-            active_applications = sum(1 for app in applications if app.get("status") not in ["Rejected", "Accepted"])
-            response_rate = sum(1 for app in applications if app.get("status") != "Applied") / total_applications if total_applications > 0 else 0
-            
             # Display metrics
-            st.metric("Total Applications", total_applications)
-            st.metric("Active Applications", active_applications)
-            st.metric("Response Rate", f"{response_rate:.0%}")
+            st.metric("Total Applications", len(tracker))
+            st.metric("Active Applications", tracker.active)
+            st.metric("Response Rate", f"{tracker.response_rate:.0%}")
         
         # Display applications table
         st.subheader("Your Applications")
+        st.dataframe(tracker.table(), use_container_width=True)
         
-        # Create an applications table
-        apps_df = pd.DataFrame(applications)
-        
-        # Sort by application date (most recent first)
-        if not apps_df.empty and "application_date" in apps_df.columns:
-            apps_df["application_date"] = pd.to_datetime(apps_df["application_date"])
-            apps_df = apps_df.sort_values(by="application_date", ascending=False)
+        # Application details
+        selected_index = st.selectbox(
+            "Select application to view/edit details:", 
+            range(len(applications)),
+            format_func=lambda i: f"{applications[i].get('company')} - {applications[i].get('title')}"
+        )
         
-        # Display applications as an interactive table
-        if not apps_df.empty:
-            # Show only certain columns in the table
-            display_columns = ["company", "title", "application_date", "status", "last_updated"]
-            available_columns = [col for col in display_columns if col in apps_df.columns]
-            
-            # Rename columns for better display
-            column_map = {
-                "company": "Company",
-                "title": "Job Title",
-                "application_date": "Applied On",
-                "status": "Status",
-                "last_updated": "Last Updated"
-            }
-            
-            # Create the display dataframe
-            display_df = apps_df[available_columns].rename(columns=column_map)
-            st.dataframe(display_df, use_container_width=True)
-            
-            # Application details
-            selected_index = st.selectbox(
-                "Select application to view/edit details:", 
-                range(len(applications)),
-                format_func=lambda i: f"{applications[i].get('company')} - {applications[i].get('title')}"
-            )
-            
-            display_application_details(selected_index)
-        else:
-            st.info("No applications to display.")
+        display_application_details(applications[selected_index])
     else:
         st.info("No job applications tracked yet. Add an application or track from your saved jobs.")
         
@@ -354,99 +353,115 @@ def display_job_tracker():
             add_sample_applications()
             st.rerun()
 
-def display_application_details(index):
+def display_application_details(application):
     """
     Display details for a single job application with ability to edit.
     
     Args:
-        index (int): Index of the application in the session state list
+        application (dict): The application, as returned by the job store
     """
-    applications = st.session_state.job_applications
+    tracker = get_tracker()
+    application_id = application["id"]
     
-    if 0 <= index < len(applications):
-        application = applications[index]
+    with st.expander("Application Details", expanded=True):
+        col1, col2 = st.columns(2)
         
-        with st.expander("Application Details", expanded=True):
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown(f"**Company:** {application.get('company')}")
-                st.markdown(f"**Job Title:** {application.get('title')}")
-                st.markdown(f"**Applied On:** {application.get('application_date')}")
-                st.markdown(f"**Current Status:** {application.get('status')}")
-            
-            with col2:
-                # Update status
-                new_status = st.selectbox(
-                    "Update Status:",
-                    ["Applied", "Screening", "Interview", "Technical Test", "Offer", "Rejected", "Accepted"],
-                    index=["Applied", "Screening", "Interview", "Technical Test", "Offer", "Rejected", "Accepted"].index(application.get("status", "Applied"))
-                )
-                
-                if new_status != application.get("status") and st.button("Update Status"):
-                    applications[index]["status"] = new_status
-                    applications[index]["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    st.success("Status updated!")
-                    st.rerun()
-            
-            # Notes section
-            st.subheader("Notes")
-            new_notes = st.text_area("Application Notes", value=application.get("notes", ""))
+        with col1:
+            st.markdown(f"**Company:** {application.get('company')}")
+            st.markdown(f"**Job Title:** {application.get('title')}")
+            st.markdown(f"**Applied On:** {application.get('application_date')}")
+            st.markdown(f"**Current Status:** {application.get('status')}")
+        
+        with col2:
+            # Update status
+            new_status = st.selectbox(
+                "Update Status:",
+                APPLICATION_STATUSES,
+                index=APPLICATION_STATUSES.index(application.get("status", "Applied"))
+            )
             
-            if new_notes != application.get("notes", "") and st.button("Update Notes"):
-                applications[index]["notes"] = new_notes
-                applications[index]["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                st.success("Notes updated!")
+            if new_status != application.get("status") and st.button("Update Status"):
+                tracker.update(application_id, status=new_status)
+                st.success("Status updated!")
                 st.rerun()
+        
+        # Notes section
+        st.subheader("Notes")
+        new_notes = st.text_area("Application Notes", value=application.get("notes", ""))
+        
+        if new_notes != application.get("notes", "") and st.button("Update Notes"):
+            tracker.update(application_id, notes=new_notes)
+            st.success("Notes updated!")
+            st.rerun()
+        
+        # Interview preparation
+        if application.get("status") in ["Screening", "Interview", "Technical Test"]:
+            st.markdown("### Prepare for Your Interview")
+            st.markdown("""
+            It looks like you're in the interview process! Would you like to prepare for your interview?
+            """)
             
-            # Interview preparation
-            if application.get("status") in ["Screening", "Interview", "Technical Test"]:
-                st.markdown("### Prepare for Your Interview")
-                st.markdown("""
-                It looks like you're in the interview process! Would you like to prepare for your interview?
-                """)
-                
-                if st.button("Prepare for Interview"):
-                    st.switch_page("pages/interview_prep.py")
-            
-            # Delete application
-            if st.button("Delete This Application", key=f"delete_{index}"):
-                if st.checkbox("Confirm deletion?", key=f"confirm_{index}"):
-                    applications.pop(index)
-                    st.success("Application deleted!")
-                    st.rerun()
+            if st.button("Prepare for Interview"):
+                st.switch_page("pages/interview_prep.py")
+        
+        # Delete application
+        if st.button("Delete This Application", key=f"delete_{application_id}"):
+            if st.checkbox("Confirm deletion?", key=f"confirm_{application_id}"):
+                tracker.delete(application_id)
+                st.success("Application deleted!")
+                st.rerun()
 
 # Utility functions
 
-def search_jobs(job_title, industry=None, location=None, experience_level=None):
+def search_jobs(job_title, industry=None, location=None, experience_level=None, page=1, page_size=JOBS_PER_PAGE):
     """
-    Search for jobs based on criteria using OpenAI to generate mock results.
+    Search the local job postings index.
+    
+    Falls back to generating sample listings with OpenAI when no postings
+    file has been ingested (see utils.job_index.JOB_POSTINGS_PATH).
     
     Args:
         job_title (str): The job title to search for
         industry (str): Optional industry filter
         location (str): Optional location filter
         experience_level (str): Optional experience level filter
+        page (int): 1-based results page
+        page_size (int): Results per page
     
     Returns:
-        dict: Job search results
+        dict: Job search results with "jobs", "total", "page", "page_count" and "source"
     """
     try:
-        client = get_openai_client()
-        # ... existing code ...
-    except Exception as e:
-        if "insufficient_quota" in str(e):
-            return {
-                "error": "API quota exceeded. Please check your OpenAI billing.",
-                "jobs": [{
-                    "title": "Sample Job - API Quota Exceeded",
-                    "company": "Your OpenAI Account",
-                    "location": "platform.openai.com/account",
-                    "description": "Please check your OpenAI billing and quota",
-                    "salary_range": "N/A"
-                }]
-            }
+        index = get_job_index()
+    except (OSError, ValueError) as e:
+        print(f"Job index unavailable: {str(e)}")
+        index = None
+    
+    if index is None:
+        return generate_job_listings(job_title, industry, location, experience_level)
+    
+    results = index.search(job_title, industry, location, experience_level, page, page_size)
+    return {
+        "jobs": results.jobs,
+        "total": results.total,
+        "page": results.page,
+        "page_count": results.page_count,
+        "source": "index"
+    }
+
+def generate_job_listings(job_title, industry=None, location=None, experience_level=None):
+    """
+    Generate sample job listings with OpenAI.
     
+    Args:
+        job_title (str): The job title to search for
+        industry (str): Optional industry filter
+        location (str): Optional location filter
+        experience_level (str): Optional experience level filter
+    
+    Returns:
+        dict: Job search results
+    """
     # Get user skills for matching
     user_skills = st.session_state.user_profile.get("skills", [])
     skills_str = ", ".join(user_skills) if user_skills else "None provided"
@@ -471,53 +486,186 @@ def search_jobs(job_title, industry=None, location=None, experience_level=None):
                 "description": "Job description",
                 "company_description": "Brief company info",
                 "required_skills": ["Skill 1", "Skill 2", ...],
-                "skills_match": ["User skill that matches", ...],
                 "posted_date": "Posted date (recent)"
             }},
             ...
         ]
     }}
     
-    Provide 5-8 realistic job listings. For the skills_match field, include any of the user's skills that match the job requirements.
+    Provide 5-8 realistic job listings.
     All job listings should be different positions at different companies. Make the job descriptions realistic and detailed.
     """
     
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o",
+        result = request_json_completion(
             messages=[
                 {"role": "system", "content": "You are a job search engine that provides realistic job listings based on search criteria."},
                 {"role": "user", "content": prompt}
             ],
-            response_format={"type": "json_object"},
-            temperature=0.7
+            temperature=0.7,
+            call_site="job_search"
         )
-        
-        result = json.loads(response.choices[0].message.content)
+        result["source"] = "ai"
         return result
     except Exception as e:
+        if "insufficient_quota" in str(e):
+            return {
+                "error": "API quota exceeded. Please check your OpenAI billing.",
+                "jobs": [{
+                    "title": "Sample Job - API Quota Exceeded",
+                    "company": "Your OpenAI Account",
+                    "location": "platform.openai.com/account",
+                    "description": "Please check your OpenAI billing and quota",
+                    "salary_range": "N/A"
+                }]
+            }
         return {
             "error": f"Failed to search for jobs: {str(e)}",
             "jobs": []
         }
 
+def get_profile_text():
+    """
+    Text describing the user for job matching.
+    
+    Returns:
+        str: The uploaded resume if there is one, otherwise the profile's skills
+    """
+    return st.session_state.get("resume_text") or ", ".join(st.session_state.user_profile.get("skills", []))
+
+def profile_match_scores(jobs):
+    """
+    Similarity between the user's profile and each posting.
+    
+    Args:
+        jobs (list): Postings from the local index
+    
+    Returns:
+        dict: Posting id -> cosine similarity; empty without a profile or postings index
+    """
+    profile_text = get_profile_text()
+    if not profile_text or not any(job.get("id") for job in jobs):
+        return {}
+    
+    try:
+        vectors = get_job_vectors()
+    except (OSError, ValueError) as e:
+        print(f"Job vectors unavailable: {str(e)}")
+        return {}
+    if vectors is None:
+        return {}
+    
+    return vectors.similarity(vectors.embed(profile_text), [job.get("id") for job in jobs])
+
+def recommend_jobs(limit=20):
+    """
+    Postings most similar to the user's resume or skills.
+    
+    Args:
+        limit (int): Number of postings to return
+    
+    Returns:
+        dict: Job search results in the same shape as search_jobs()
+    """
+    profile_text = get_profile_text()
+    if not profile_text:
+        return {"error": "Upload a resume or add skills to your profile to find matching jobs.", "jobs": []}
+    
+    try:
+        index = get_job_index()
+        vectors = get_job_vectors()
+    except (OSError, ValueError) as e:
+        return {"error": f"Job matching is unavailable: {str(e)}", "jobs": []}
+    if index is None or vectors is None:
+        return {"error": "No job postings have been loaded yet.", "jobs": []}
+    
+    jobs = []
+    for posting_id, score in vectors.top_k(vectors.embed(profile_text), limit):
+        posting = index.get(posting_id)
+        if posting is not None:
+            jobs.append({**posting, "score": score})
+    
+    return {"jobs": jobs, "total": len(jobs), "page": 1, "page_count": 1, "source": "match"}
+
+def enrich_jobs(jobs):
+    """
+    Add AI-written company descriptions to postings that lack one.
+    
+    Args:
+        jobs (list): Postings on the current results page
+    
+    Returns:
+        list: The postings, with "company_description" filled in where possible
+    """
+    missing = sorted({job.get("company") for job in jobs if job.get("company") and not job.get("company_description")})
+    if not missing:
+        return jobs
+    
+    prompt = f"""
+    Write a one or two sentence description of each of these companies for a job seeker.
+    Companies: {json.dumps(missing)}
+    
+    Please provide a JSON response with the following structure:
+    {{
+        "companies": {{"Company Name": "Description", ...}}
+    }}
+    """
+    
+    try:
+        result = request_json_completion(
+            messages=[
+                {"role": "system", "content": "You are a career advisor who briefly describes employers."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.3,
+            call_site="job_search_enrich"
+        )
+    except Exception as e:
+        st.warning(f"Could not add company summaries: {str(e)}")
+        return jobs
+    
+    descriptions = result.get("companies", {})
+    return [
+        {**job, "company_description": job.get("company_description") or descriptions.get(job.get("company"), "")}
+        for job in jobs
+    ]
+
+def get_user_id():
+    """
+    Id the user's saved jobs, searches and applications are stored under.
+    
+    The id is kept in the page URL (?uid=...) so the data survives a reload.
+    
+    Returns:
+        str: The user id
+    """
+    return resolve_user_id(st.session_state, st.query_params)
+
+def get_tracker():
+    """
+    The user's application tracker, kept for the session and reloaded from
+    the job store when another tab or worker has changed the applications.
+    
+    Returns:
+        ApplicationTracker: The tracker
+    """
+    tracker = st.session_state.get("application_tracker")
+    if tracker is None or tracker.user_id != get_user_id() or tracker.is_stale():
+        tracker = ApplicationTracker(get_job_store(), get_user_id())
+        st.session_state.application_tracker = tracker
+    return tracker
+
 def save_job(job):
     """
     Save a job to the user's saved jobs list.
     
     Args:
         job (dict): The job to save
-    """
-    # Add saved date
-    job["saved_date"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    # Check if already saved
-    for saved_job in st.session_state.saved_jobs:
-        if are_jobs_same(job, saved_job):
-            return
     
-    # Add to saved jobs
-    st.session_state.saved_jobs.append(job)
+    Returns:
+        bool: False if the job was already saved
+    """
+    return get_job_store().save_job(get_user_id(), job)
 
 def add_to_job_tracker(job):
     """
@@ -526,10 +674,6 @@ def add_to_job_tracker(job):
     Args:
         job (dict): The job to add to the tracker
     """
-    # Initialize job applications if needed
-    if "job_applications" not in st.session_state:
-        st.session_state.job_applications = []
-    
     # Create a new application entry
     new_application = {
         "company": job.get("company", "Unknown Company"),
@@ -540,30 +684,8 @@ def add_to_job_tracker(job):
         "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     }
     
-    # Check if already tracked
-    for app in st.session_state.job_applications:
-        if are_jobs_same(job, app):
-            return
-    
-    # Add to applications
-    st.session_state.job_applications.append(new_application)
-
-def are_jobs_same(job1, job2):
-    """
-    Check if two job entries refer to the same job.
-    
-    Args:
-        job1 (dict): First job entry
-        job2 (dict): Second job entry
-    
-    Returns:
-        bool: True if they appear to be the same job
-    """
-    # Check company and title
-    same_company = job1.get("company", "").lower() == job2.get("company", "").lower()
-    same_title = job1.get("title", "").lower() == job2.get("title", "").lower()
-    
-    return same_company and same_title
+    # Add to applications unless the job is already tracked
+    get_tracker().add([new_application], skip_tracked=True)
 
 def add_sample_applications():
     """Add sample job applications for demonstration purposes."""
@@ -610,10 +732,7 @@ def add_sample_applications():
         }
     ]
     
-    if "job_applications" not in st.session_state:
-        st.session_state.job_applications = []
-    
-    st.session_state.job_applications.extend(sample_applications)
+    get_tracker().add(sample_applications)
 
 if __name__ == "__main__":
     app()
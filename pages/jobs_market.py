@@ -3,9 +3,13 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
+from concurrent.futures import as_completed
 from utils.data_analysis import get_job_market_insights, generate_job_growth_chart, generate_salary_range_chart
-from utils.openai_utils import get_openai_client
-import json
+from utils.llm_gateway import get_fetch_executor
+from utils.openai_utils import request_json_completion, PRIORITY_BACKGROUND
+
+# Number of top growing roles whose analyses are fetched alongside the trends
+PREFETCH_ROLE_COUNT = 3
 
 def app():
     st.title("Job Market Insights")
@@ -31,6 +35,15 @@ def app():
     
     # Get job market insights for the selected industry
     industry_data = get_job_market_insights(selected_industry)
+    growing_roles = industry_data.get("growing_roles", [])
+    
+    # Start the independent LLM calls now so they overlap with chart rendering;
+    # their placeholders are filled below as each one completes
+    trends_future = get_fetch_executor().submit(get_industry_trends, selected_industry)
+    role_futures = {
+        role: get_fetch_executor().submit(get_role_analysis, role, selected_industry)
+        for role in growing_roles[:PREFETCH_ROLE_COUNT]
+    }
     
     # Display industry insights
     st.header(f"{selected_industry} Industry Insights")
@@ -66,7 +79,6 @@ def app():
     st.subheader("Salary Trends")
     
     # Get roles to compare
-    growing_roles = industry_data.get("growing_roles", [])
     if growing_roles:
         # Limit to top 5 roles to avoid overcrowding
         roles_to_compare = growing_roles[:5]
@@ -87,44 +99,116 @@ def app():
     else:
         selected_role = st.text_input("Enter a role to analyze")
     
+    # Maps each pending future to the callbacks that render its result
+    pending = {}
+    
     if selected_role and st.button("Analyze Role"):
-        with st.spinner(f"Analyzing the {selected_role} role..."):
-            role_analysis = get_role_analysis(selected_role, selected_industry)
-            
-            if "error" in role_analysis:
-                st.error(role_analysis["error"])
-            else:
-                # Display role analysis
-                st.subheader(f"{selected_role} Role Analysis")
-                
-                # Role description
-                st.markdown("**Role Description:**")
-                st.write(role_analysis.get("description", "No description available."))
-                
-                # Required skills
-                st.markdown("**Key Skills Required:**")
-                for skill in role_analysis.get("required_skills", []):
-                    st.markdown(f"- {skill}")
-                
-                # Education and qualifications
-                st.markdown("**Typical Education/Qualifications:**")
-                for qual in role_analysis.get("qualifications", []):
-                    st.markdown(f"- {qual}")
-                
-                # Future outlook
-                st.markdown("**Future Outlook:**")
-                st.write(role_analysis.get("future_outlook", "No outlook data available."))
-                
-                # Career progression
-                st.markdown("**Typical Career Progression:**")
-                for step in role_analysis.get("career_progression", []):
-                    st.markdown(f"- {step}")
+        if selected_role not in role_futures:
+            role_futures[selected_role] = get_fetch_executor().submit(get_role_analysis, selected_role, selected_industry)
+        
+        selected_placeholder = st.empty()
+        selected_placeholder.info(f"Analyzing the {selected_role} role...")
+        pending.setdefault(role_futures[selected_role], []).append(
+            lambda analysis, placeholder=selected_placeholder, role=selected_role:
+                display_role_analysis(placeholder, role, analysis)
+        )
+    
+    # Snapshots of the top growing roles, fetched in parallel with the trends
+    if growing_roles:
+        st.subheader("Top Growing Roles")
+        for role in growing_roles[:PREFETCH_ROLE_COUNT]:
+            placeholder = st.empty()
+            placeholder.info(f"Loading analysis for {role}...")
+            pending.setdefault(role_futures[role], []).append(
+                lambda analysis, placeholder=placeholder, role=role:
+                    display_role_snapshot(placeholder, role, analysis)
+            )
     
     # Industry trends and news
     st.header("Industry Trends and News")
-    with st.spinner("Loading industry trends..."):
-        trends = get_industry_trends(selected_industry)
+    trends_placeholder = st.empty()
+    trends_placeholder.info("Loading industry trends...")
+    pending.setdefault(trends_future, []).append(
+        lambda trends: display_industry_trends(trends_placeholder, trends)
+    )
+    
+    # Render results in completion order, so the page waits only for the slowest call
+    for future in as_completed(pending):
+        result = future.result()
+        for render in pending[future]:
+            render(result)
+
+def display_role_analysis(placeholder, role, role_analysis):
+    """
+    Render a full role analysis into a placeholder.
+    
+    Args:
+        placeholder: Streamlit placeholder to fill
+        role (str): The analyzed role
+        role_analysis (dict): Result of get_role_analysis
+    """
+    with placeholder.container():
+        if "error" in role_analysis:
+            st.error(role_analysis["error"])
+            return
+        
+        # Display role analysis
+        st.subheader(f"{role} Role Analysis")
+        
+        # Role description
+        st.markdown("**Role Description:**")
+        st.write(role_analysis.get("description", "No description available."))
         
+        # Required skills
+        st.markdown("**Key Skills Required:**")
+        for skill in role_analysis.get("required_skills", []):
+            st.markdown(f"- {skill}")
+        
+        # Education and qualifications
+        st.markdown("**Typical Education/Qualifications:**")
+        for qual in role_analysis.get("qualifications", []):
+            st.markdown(f"- {qual}")
+        
+        # Future outlook
+        st.markdown("**Future Outlook:**")
+        st.write(role_analysis.get("future_outlook", "No outlook data available."))
+        
+        # Career progression
+        st.markdown("**Typical Career Progression:**")
+        for step in role_analysis.get("career_progression", []):
+            st.markdown(f"- {step}")
+
+def display_role_snapshot(placeholder, role, role_analysis):
+    """
+    Render a compact, expandable role summary into a placeholder.
+    
+    Args:
+        placeholder: Streamlit placeholder to fill
+        role (str): The analyzed role
+        role_analysis (dict): Result of get_role_analysis
+    """
+    with placeholder.container():
+        with st.expander(role):
+            if "error" in role_analysis:
+                st.warning(role_analysis.get("description", "Analysis unavailable."))
+                return
+            
+            st.write(role_analysis.get("description", "No description available."))
+            skills = role_analysis.get("required_skills", [])
+            if skills:
+                st.markdown("**Key Skills:** " + ", ".join(skills))
+            st.markdown("**Future Outlook:**")
+            st.write(role_analysis.get("future_outlook", "No outlook data available."))
+
+def display_industry_trends(placeholder, trends):
+    """
+    Render industry trends and resources into a placeholder.
+    
+    Args:
+        placeholder: Streamlit placeholder to fill
+        trends (dict): Result of get_industry_trends
+    """
+    with placeholder.container():
         # Display trends
         for trend in trends.get("trends", []):
             st.subheader(trend.get("title", ""))
@@ -146,8 +230,6 @@ def get_role_analysis(role, industry):
     Returns:
         dict: Role analysis data
     """
-    client = get_openai_client()
-    
     prompt = f"""
     Provide a detailed analysis of the {role} role in the {industry} industry.
     
@@ -162,17 +244,14 @@ def get_role_analysis(role, industry):
     """
     
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o",
+        result = request_json_completion(
             messages=[
                 {"role": "system", "content": "You are an expert career and job market analyst."},
                 {"role": "user", "content": prompt}
             ],
-            response_format={"type": "json_object"},
-            temperature=0.7
+            temperature=0.7,
+            call_site="role_analysis"
         )
-        
-        result = json.loads(response.choices[0].message.content)
         return result
     except Exception as e:
         return {
@@ -190,8 +269,6 @@ def get_industry_trends(industry):
     Returns:
         dict: Industry trends and news
     """
-    client = get_openai_client()
-    
     prompt = f"""
     Provide an overview of current trends and developments in the {industry} industry.
     
@@ -217,17 +294,15 @@ def get_industry_trends(industry):
     """
     
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o",
+        result = request_json_completion(
             messages=[
                 {"role": "system", "content": "You are an industry analyst with knowledge of current market trends."},
                 {"role": "user", "content": prompt}
             ],
-            response_format={"type": "json_object"},
-            temperature=0.7
+            temperature=0.7,
+            call_site="industry_trends",
+            priority=PRIORITY_BACKGROUND
         )
-        
-        result = json.loads(response.choices[0].message.content)
         return result
     except Exception as e:
         return {
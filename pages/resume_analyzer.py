@@ -262,7 +262,6 @@ import plotly.express as px
 import base64
 import sys
 from pathlib import Path
-import nltk
 
 # Initialize session state variables
 if 'resume_text' not in st.session_state:
@@ -270,34 +269,16 @@ if 'resume_text' not in st.session_state:
 if 'analysis_results' not in st.session_state:
     st.session_state.analysis_results = None
 
-# Initialize NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    try:
-        # Handle SSL certificate issues
-        import ssl
-        try:
-            _create_unverified_https_context = ssl._create_unverified_context
-        except AttributeError:
-            pass
-        else:
-            ssl._create_default_https_context = _create_unverified_https_context
-        
-        nltk.download('punkt')
-        nltk.download('stopwords')
-    except Exception as e:
-        st.error(f"Failed to download NLTK data: {str(e)}")
-        st.stop()
+# NLTK data is resolved lazily by utils.nltk_resources the first time text is tokenized
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
 try:
-    from utils.resume_parsar import extract_resume_text, extract_skills
+    from utils.resume_parsar import extract_skills
+    from utils.resume_cache import load_resume, get_resume_analysis
     from utils.openai_utils import analyze_resume
-    from utils.nlp_utils import extract_keywords, extract_action_verbs
+    from utils.nlp_utils import TextAnalysis
 except ImportError as e:
     st.error(f"Failed to import required modules: {str(e)}")
     st.stop()
@@ -315,13 +296,22 @@ def app():
     if uploaded_file is not None:
         with st.spinner("Analyzing your resume..."):
             try:
-                # Extract text from the uploaded resume
-                resume_text = extract_resume_text(uploaded_file)
+                # Parse the uploaded resume (cached by content hash), showing progress for long PDFs
+                progress_bar = st.progress(0.0, text="Extracting text...")
+                parsed_resume = load_resume(
+                    uploaded_file,
+                    progress_callback=lambda done, total: progress_bar.progress(
+                        done / total, text=f"Extracted page {done} of {total}"
+                    )
+                )
+                progress_bar.empty()
                 
-                if not resume_text:
+                if not parsed_resume:
                     st.error("Could not extract text from the uploaded file.")
                     return
                 
+                resume_text = parsed_resume["text"]
+                
                 # Store in session state for other pages to use
                 st.session_state.resume_text = resume_text
                 
@@ -329,15 +319,15 @@ def app():
                 with st.expander("View Extracted Text"):
                     st.text_area("Resume Content", resume_text, height=300)
                 
-                # Analyze the resume using OpenAI
-                analysis = analyze_resume(resume_text)
+                # Analyze the resume using OpenAI (reused for a previously analyzed file)
+                analysis = get_resume_analysis(parsed_resume)
                 
                 if "error" in analysis:
                     st.error(analysis["error"])
                     return
                 
                 # Display analysis results
-                display_analysis_results(analysis, resume_text)
+                display_analysis_results(analysis, resume_text, parsed_resume["skills"])
                 
             except Exception as e:
                 st.error(f"Error analyzing resume: {str(e)}")
@@ -357,7 +347,7 @@ def app():
         else:
             st.info("Please upload your resume to get a detailed analysis.")
 
-def display_analysis_results(analysis, resume_text):
+def display_analysis_results(analysis, resume_text, extracted_skills=None):
     """Display the analysis results"""
     # Overview section
     st.header("Resume Analysis")
@@ -399,7 +389,8 @@ def display_analysis_results(analysis, resume_text):
     st.subheader("Skills Analysis")
     
     # Extracted vs. recognized skills
-    extracted_skills = extract_skills(resume_text)
+    if extracted_skills is None:
+        extracted_skills = extract_skills(resume_text)
     recognized_skills = analysis.get("skills_analysis", {}).get("present", [])
     
     col1, col2 = st.columns(2)
@@ -425,9 +416,10 @@ def display_analysis_results(analysis, resume_text):
     st.subheader("Word Usage Analysis")
     
     try:
-        # Extract action verbs and keywords
-        action_verbs = extract_action_verbs(resume_text)
-        keywords = extract_keywords(resume_text, 15)
+        # Extract action verbs and keywords from a single (memoized) tokenization
+        text_analysis = TextAnalysis.for_text(resume_text)
+        action_verbs = text_analysis.action_verbs
+        keywords = text_analysis.keywords(15)
         
         col1, col2 = st.columns(2)
         
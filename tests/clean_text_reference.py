@@ -0,0 +1,24 @@
+"""The clean_text implementation replaced in the precompiled-pattern rewrite, and raw-looking input for it."""
+import re
+
+def reference_clean_text(text):
+    """The original clean_text."""
+    if not text:
+        return ""
+    text = re.sub(r'\r\n', '\n', text)
+    text = re.sub(r'[ \t]+', ' ', text)
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = re.sub(r'[^\w\s.,;:()\-\'"/]', '', text)
+    text = re.sub(r'\b(?:page|phone|email|http[s]?://\S+)\b', '', text, flags=re.IGNORECASE)
+    return text.strip()
+
+def raw_extraction(text, rng):
+    """Make clean sample text look like raw PDF output: CRLF, tabs, bullets, blank runs."""
+    lines = []
+    for line in text.split("\n"):
+        if line and rng.random() < 0.5:
+            line = rng.choice(["• ", "▪\t", "*  ", "– "]) + line.replace(" ", rng.choice([" ", "  ", " \t"]), 2)
+        lines.append(line + " " * rng.randint(0, 3))
+        if rng.random() < 0.1:
+            lines.extend([""] * rng.randint(2, 4))
+    return "\r\n".join(lines) + f"\r\nPage {rng.randint(1, 9)} of 9 © 2024"
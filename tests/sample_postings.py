@@ -0,0 +1,39 @@
+"""Small deterministic job postings for the search and matching tests."""
+import random
+
+from utils.job_index import normalize_posting
+
+TITLES = [
+    "Software Engineer", "Data Scientist", "Data Engineer", "DevOps Engineer", "Cloud Architect",
+    "Machine Learning Engineer", "Product Manager", "Financial Analyst", "Nurse Practitioner", "QA Engineer",
+]
+SKILLS = [
+    "Python", "Java", "SQL", "Spark", "Pandas", "PyTorch", "TensorFlow", "AWS", "Azure", "Docker",
+    "Kubernetes", "Terraform", "React", "Excel", "Tableau", "Agile", "Leadership", "Communication",
+]
+WORDS = [
+    "build", "design", "operate", "systems", "data", "pipelines", "customers", "team", "analysis",
+    "production", "reliable", "models", "reports", "growth", "security", "mentor", "launch", "quality",
+]
+LOCATIONS = ["Remote", "New York, NY", "San Francisco, CA", "London, UK", "Austin, TX"]
+INDUSTRIES = ["Technology", "Healthcare", "Finance", "Education"]
+LEVELS = ["Entry Level", "Mid Level", "Senior", "Executive"]
+
+def generate_postings(count, seed=3):
+    """Normalized postings with ids job-0, job-1, ..."""
+    rng = random.Random(seed)
+    postings = []
+    for index in range(count):
+        skills = rng.sample(SKILLS, rng.randint(3, 6))
+        words = [rng.choice(WORDS + skills) for _ in range(rng.randint(15, 40))]
+        postings.append(normalize_posting({
+            "id": f"job-{index}",
+            "title": rng.choice(TITLES),
+            "company": f"Company {rng.randint(1, 50)}",
+            "location": rng.choice(LOCATIONS),
+            "industry": rng.choice(INDUSTRIES),
+            "experience_level": rng.choice(LEVELS),
+            "description": " ".join(words),
+            "required_skills": skills,
+        }, index))
+    return postings
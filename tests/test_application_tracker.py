@@ -0,0 +1,52 @@
+import pytest
+
+from utils.application_tracker import ApplicationTracker
+from utils.job_store import JobStore
+
+@pytest.fixture
+def store(tmp_path):
+    return JobStore(str(tmp_path / "store.sqlite3"))
+
+def test_statistics_follow_writes(store):
+    tracker = ApplicationTracker(store, "user")
+    first, second = tracker.add([{"company": "Acme", "title": "Engineer"}, {"company": "Globex", "title": "Analyst"}])
+    tracker.update(first, status="Interview")
+    tracker.update(second, status="Rejected")
+
+    assert tracker.status_counts == {"Interview": 1, "Rejected": 1}
+    assert tracker.active == 1
+    assert tracker.response_rate == 1
+    assert tracker.status_of({"company": " ACME", "title": "engineer "}) == "Interview"
+
+    tracker.delete(first)
+    assert len(tracker) == 1
+    assert tracker.status_of({"company": "Acme", "title": "Engineer"}) is None
+    assert not tracker.is_stale()
+
+def test_update_of_untracked_application(store):
+    tracker = ApplicationTracker(store, "user")
+    other = ApplicationTracker(store, "user")
+    [application_id] = other.add([{"company": "Acme", "title": "Engineer"}])
+
+    tracker.update(application_id, status="Offer")
+    assert tracker.get(application_id)["status"] == "Offer"
+
+    tracker.update(12345, status="Offer")  # Not in the store either
+    assert tracker.get(12345) is None
+
+def test_own_write_does_not_hide_another_sessions_change(store):
+    tracker = ApplicationTracker(store, "user")
+    other = ApplicationTracker(store, "user")
+
+    other.add([{"company": "Acme", "title": "Engineer"}])
+    tracker.add([{"company": "Globex", "title": "Analyst"}])
+
+    assert tracker.is_stale()
+    assert other.is_stale()
+    assert len(ApplicationTracker(store, "user")) == 2
+
+def test_own_writes_keep_tracker_fresh(store):
+    tracker = ApplicationTracker(store, "user")
+    [application_id] = tracker.add([{"company": "Acme", "title": "Engineer"}])
+    tracker.update(application_id, status="Screening")
+    assert not tracker.is_stale()
@@ -0,0 +1,53 @@
+"""
+clean_text must produce exactly what the five-pass implementation it
+replaced did (tests.clean_text_reference.reference_clean_text).
+"""
+import random
+
+import pytest
+
+from tests.clean_text_reference import raw_extraction, reference_clean_text
+from utils.resume_parsar import clean_text
+
+# Characters clean_text treats specially, plus ordinary text
+FUZZ_ALPHABET = list("ab1_ .,;:()-'\"/\t\n\r\x0b\x0c •–*#@&!?%+=|<>[]{}é中\U0001f600") + [
+    "page", "Phone", "EMAIL", "http://x.io/a", "https://y.com/b?c=1", "\r\n", "\n\n\n",
+]
+
+SAMPLE_RESUME = """Jordan Lee
+Contact Information
+Email: candidate@example.com | Phone: (555) 123-4567 | https://linkedin.com/in/candidate
+
+Summary
+Experienced Data Scientist with 7 years of experience building scalable, reliable systems.
+
+Skills
+Python, SQL, Pandas, PyTorch, AWS, Docker, CI/CD, Problem Solving
+
+Experience
+Data Scientist - TechCorp Inc. (Jan 2018 - Present, 5 years)
+Developed and maintained Python services handling 1,000,000+ requests per day.
+Collaborated with cross-functional teams (product, design & QA) to launch the company's new portal.
+Spearheaded migration to Spark, e.g. moving 40+ legacy jobs with zero downtime.
+
+Education
+Bachelor of Science in Computer Science, State University, 2014"""
+
+def fuzz_strings(count, seed=3):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield "".join(rng.choice(FUZZ_ALPHABET) for _ in range(rng.randint(0, 40)))
+
+@pytest.mark.parametrize("text", ["", None, "Page 1", "a\r\n\r\n\r\n\r\nb", " \t• Python\t\tSQL \n"])
+def test_matches_reference_on_edge_cases(text):
+    assert clean_text(text) == reference_clean_text(text)
+
+def test_matches_reference_on_resumes():
+    rng = random.Random(3)
+    for _ in range(50):
+        raw = raw_extraction(SAMPLE_RESUME, rng)
+        assert clean_text(raw) == reference_clean_text(raw)
+
+def test_matches_reference_on_fuzz():
+    for text in fuzz_strings(20_000):
+        assert clean_text(text) == reference_clean_text(text), f"clean_text differs on {text!r}"
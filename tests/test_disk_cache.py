@@ -0,0 +1,52 @@
+import sqlite3
+
+from utils import disk_cache
+from utils.disk_cache import DiskCache
+
+def table_bytes(cache):
+    with sqlite3.connect(cache.path) as conn:
+        return conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+def test_running_total_matches_table(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.sqlite3"), max_bytes=1_000)
+    cache.set("a", "x" * 100)
+    cache.set("b", "y" * 200)
+    cache.set("a", "z" * 50)  # Replacing an entry counts only its new size
+    cache.delete("b")
+    assert cache.stats()["bytes"] == table_bytes(cache) == 50
+
+    cache.clear()
+    assert cache.stats() == {"entries": 0, "bytes": 0, "max_bytes": 1_000}
+
+def test_evicts_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "ACCESS_UPDATE_INTERVAL", 0)
+    cache = DiskCache(str(tmp_path / "cache.sqlite3"), max_bytes=300)
+    for key in ("a", "b", "c"):
+        cache.set(key, key * 100)
+    cache.get("a")
+    cache.set("d", "d" * 100)
+
+    assert cache.get("b") is None
+    assert [cache.get(key) is not None for key in ("a", "c", "d")] == [True, True, True]
+    assert cache.stats()["bytes"] == table_bytes(cache) == 300
+
+def test_recent_hits_do_not_write(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.sqlite3"), max_bytes=1_000)
+    cache.set("a", "value")
+    conn = cache._connect()
+    changes = conn.total_changes
+    assert cache.get("a") == "value"
+    assert conn.total_changes == changes
+
+def test_total_seeded_for_existing_cache(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE entries (key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+                     "expires_at REAL, last_access REAL NOT NULL)")
+        conn.execute("INSERT INTO entries VALUES ('old', 'v', 120, NULL, 0)")
+    conn.close()
+
+    cache = DiskCache(path, max_bytes=1_000)
+    assert cache.stats()["bytes"] == 120
+    cache.set("new", "x" * 30)
+    assert cache.stats()["bytes"] == table_bytes(cache) == 150
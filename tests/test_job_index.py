@@ -0,0 +1,109 @@
+import json
+import math
+from collections import Counter
+
+import pytest
+
+from tests.sample_postings import generate_postings
+from utils.job_index import (
+    BM25_B, BM25_K1, FIELD_WEIGHTS, JobIndex, index_terms, load_postings, normalize_posting,
+)
+
+QUERIES = ["Software Engineer", "data scientist python", "cloud architect aws", "excel tableau reports"]
+
+@pytest.fixture(scope="module")
+def postings():
+    return generate_postings(500)
+
+@pytest.fixture(scope="module")
+def index(postings):
+    return JobIndex(postings)
+
+def reference_scores(postings, query, stopwords):
+    """BM25 computed document by document."""
+    documents = []
+    for posting in postings:
+        weighted = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            value = posting[field]
+            text = " ".join(value) if isinstance(value, list) else value
+            for term in index_terms(text, stopwords):
+                weighted[term] += weight
+        documents.append(weighted)
+
+    average_length = sum(sum(doc.values()) for doc in documents) / len(documents)
+    scores = []
+    for doc in documents:
+        length = sum(doc.values())
+        score = 0.0
+        for term in set(index_terms(query, stopwords)):
+            freq = doc.get(term)
+            if not freq:
+                continue
+            df = sum(1 for other in documents if term in other)
+            idf = math.log(1 + (len(documents) - df + 0.5) / (df + 0.5))
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+            score += idf * freq * (BM25_K1 + 1) / (freq + norm)
+        scores.append(score)
+    return scores
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_ranking_matches_reference_bm25(postings, index, query):
+    expected = reference_scores(postings, query, index._stopwords)
+    results = index.search(query, page_size=20)
+
+    for job in results.jobs:
+        assert math.isclose(job["score"], expected[int(job["id"].split("-")[1])], rel_tol=1e-4), job["id"]
+    best = sorted(expected, reverse=True)[:20]
+    assert all(math.isclose(score, job["score"], rel_tol=1e-4) for score, job in zip(best, results.jobs))
+    assert results.total == sum(1 for score in expected if score > 0)
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_pages_continue_the_ranking(index, query):
+    full = index.search(query, page_size=1_000).jobs
+    paged = []
+    for page in range(1, index.search(query, page_size=7).page_count + 1):
+        results = index.search(query, page=page, page_size=7)
+        assert results.total == len(full)
+        paged.extend(results.jobs)
+    assert [job["id"] for job in paged] == [job["id"] for job in full]
+    assert index.search(query, page=1_000, page_size=7).jobs == []
+
+def test_filters_restrict_results(postings, index):
+    expected = reference_scores(postings, "python", index._stopwords)
+    results = index.search("python", industry="finance", location="new york", experience_level="Senior",
+                           page_size=1_000)
+
+    matching = [
+        posting["id"] for posting, score in zip(postings, expected)
+        if score > 0 and posting["industry"] == "Finance" and posting["location"] == "New York, NY"
+        and posting["experience_level"] == "Senior"
+    ]
+    assert matching
+    assert sorted(job["id"] for job in results.jobs) == sorted(matching)
+    assert index.search("", experience_level="Any", page_size=1).total == len(postings)
+
+def test_normalize_posting_coerces_non_text_values():
+    posting = normalize_posting({
+        "id": 7, "title": "Data Scientist", "company": 42, "industry": 3, "location": 10001,
+        "experience_level": None, "salary_range": 120000, "required_skills": 5,
+    }, 0)
+    assert posting["id"] == "7"
+    assert posting["company"] == "42"
+    assert posting["industry"] == "3"
+    assert posting["location"] == "10001"
+    assert posting["experience_level"] == ""
+    assert posting["salary_range"] == "120000"
+    assert all(isinstance(posting[field], str) for field in posting if field != "required_skills")
+
+def test_search_with_numeric_fields(tmp_path):
+    path = tmp_path / "postings.jsonl"
+    path.write_text("\n".join(json.dumps(raw) for raw in [
+        {"id": 1, "title": "Data Scientist", "industry": 3, "location": 10001, "description": "Python"},
+        {"id": 2, "title": "Accountant", "industry": "Finance", "location": "Boston", "description": "Excel"},
+    ]))
+    index = JobIndex(load_postings(str(path)))
+
+    results = index.search("data scientist", industry="3", location="10001")
+    assert [job["id"] for job in results.jobs] == ["1"]
+    assert index.search("accountant", industry="Finance").total == 1
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from tests.sample_postings import generate_postings
+from utils import job_vectors
+from utils.job_index import normalize_posting
+from utils.job_vectors import JobVectorIndex
+
+POSTINGS = [
+    {"title": "Data Scientist", "required_skills": "Python, Pandas, Machine Learning",
+     "description": "Build machine learning models in Python."},
+    {"title": "Data Analyst", "required_skills": "SQL, Excel, Tableau",
+     "description": "Analyze sales data and build dashboards."},
+    {"title": "Software Engineer", "required_skills": "Java, Spring, Docker",
+     "description": "Develop backend services in Java."},
+    {"title": "Frontend Developer", "required_skills": "JavaScript, React, CSS",
+     "description": "Build web interfaces in React."},
+    {"title": "Accountant", "required_skills": "Excel, Accounting",
+     "description": "Prepare monthly financial statements."},
+]
+
+@pytest.fixture(scope="module")
+def vectors():
+    return JobVectorIndex.build([normalize_posting(raw, i) for i, raw in enumerate(POSTINGS)])
+
+def test_unknown_words_match_nothing(vectors):
+    query = vectors.embed("zzzz qqqq")
+    assert not query.any()
+    assert vectors.top_k(query, 3) == []
+
+def test_top_k_keeps_only_positive_matches(vectors):
+    results = vectors.top_k(vectors.embed("python machine learning"), 3)
+    assert results[0][0] == "0"
+    assert all(score > 0 for _, score in results)
+
+@pytest.fixture(scope="module")
+def large_vectors():
+    postings = generate_postings(2_000, seed=5)
+    return postings, JobVectorIndex.build(postings, dimensions=32)
+
+def test_randomized_svd_matches_exact(large_vectors):
+    postings, index = large_vectors
+    # Rebuild the TF-IDF matrix densely from the model and compare spectra
+    dense = np.zeros((len(postings), len(index.vocabulary)), dtype=np.float64)
+    for row, posting in enumerate(postings):
+        vector = np.zeros(len(index.vocabulary))
+        for term, freq in job_vectors.weighted_terms(posting, index._stopwords).items():
+            column = index.vocabulary.get(term)
+            if column is not None:
+                vector[column] = (1 + np.log(freq)) * index.idf[column]
+        dense[row] = vector / (np.linalg.norm(vector) or 1.0)
+    exact = np.linalg.svd(dense, compute_uv=False)[:32]
+    approximate = np.linalg.svd(dense @ index.components.T, compute_uv=False)
+    assert np.max(np.abs(approximate - exact) / exact) < 0.05
+
+@pytest.mark.parametrize("text", [
+    "Python SQL Spark data pipelines",
+    "Kubernetes Docker Terraform AWS operate production systems",
+    "Excel Tableau reports analysis",
+])
+def test_batched_top_k_matches_full_sort(large_vectors, monkeypatch, text):
+    _, index = large_vectors
+    monkeypatch.setattr(job_vectors, "SEARCH_BATCH_ROWS", 300)
+    query = index.embed(text)
+    expected = np.argsort(-(index.vectors @ query), kind="stable")[:20]
+    found = [index.rows[posting_id] for posting_id, _ in index.top_k(query, 20)]
+    assert np.allclose(index.vectors[found] @ query, index.vectors[expected] @ query)
@@ -0,0 +1,26 @@
+import threading
+
+from utils.llm_gateway import LLMGateway
+
+def test_slot_counts_against_the_limit():
+    gateway = LLMGateway(max_concurrency=1)
+    finished = threading.Event()
+
+    with gateway.slot(call_site="stream"):
+        assert gateway.metrics()["in_flight"] == 1
+        future = gateway.submit(finished.set)
+        assert not finished.wait(0.2)
+
+    future.result(timeout=5)
+    assert finished.is_set()
+    assert gateway.metrics()["in_flight"] == 0
+    assert gateway.metrics()["requests_by_call_site"] == {"stream": 1, "default": 1}
+
+def test_slot_is_released_on_error():
+    gateway = LLMGateway(max_concurrency=1)
+    try:
+        with gateway.slot():
+            raise ValueError("stream failed")
+    except ValueError:
+        pass
+    assert gateway.call(lambda: "ok") == "ok"
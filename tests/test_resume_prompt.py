@@ -0,0 +1,27 @@
+from utils import resume_prompt
+from utils.resume_prompt import build_resume_prompt_text, count_tokens
+
+class CharEncoding:
+    """One token per character, as dense as URLs or non-English text can get."""
+
+    def encode(self, text):
+        return [ord(char) for char in text]
+
+    def decode(self, tokens):
+        return "".join(chr(token) for token in tokens)
+
+def test_overlong_line_is_cut_with_the_encoder(monkeypatch):
+    monkeypatch.setattr(resume_prompt, "_get_encoder", CharEncoding)
+    resume = "Experience\n" + " ".join(f"https://example.com/project/{n}" for n in range(200))
+
+    prompt = build_resume_prompt_text(resume, token_budget=300)
+    assert count_tokens(prompt) <= 300
+    assert "https://example.com/project/0" in prompt
+
+def test_prompt_within_budget_with_the_encoder(monkeypatch):
+    monkeypatch.setattr(resume_prompt, "_get_encoder", CharEncoding)
+    resume = "\n".join(["Summary", "数据科学家 " * 40, "Experience"] + [f"Role {n} (2019 - 2023)" for n in range(100)])
+
+    prompt = build_resume_prompt_text(resume, token_budget=500)
+    assert count_tokens(prompt) <= 500
+    assert "Role 0 (2019 - 2023)" in prompt
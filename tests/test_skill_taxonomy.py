@@ -0,0 +1,8 @@
+from utils.skill_taxonomy import Skill, SkillTaxonomy
+
+def test_skills_for_industry_limit():
+    taxonomy = SkillTaxonomy([Skill(f"Skill {n}", "Tools", industries=("Technology",)) for n in range(5_000)])
+
+    assert len(taxonomy.skills_for_industry("Technology")) == 5_000
+    assert taxonomy.skills_for_industry("Technology", limit=3) == ["Skill 0", "Skill 1", "Skill 2"]
+    assert taxonomy.skills_for_industry("Retail", limit=3) == []
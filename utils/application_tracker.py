@@ -0,0 +1,192 @@
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+import plotly.express as px
+
+from utils.job_store import CLOSED_STATUSES, JobStore, job_key
+
+# Tracker table columns and their display names
+TABLE_COLUMNS = {
+    "company": "Company",
+    "title": "Job Title",
+    "application_date": "Applied On",
+    "status": "Status",
+    "last_updated": "Last Updated",
+}
+
+class ApplicationTracker:
+    """
+    One user's tracked applications with running statistics.
+
+    Applications are loaded from the store once; after that add(), update()
+    and delete() write through to the store and adjust the status counts
+    and job key index in place, so reading statistics costs nothing. The
+    table and chart are rebuilt only when ``version`` has changed since
+    they were last built. is_stale() tells whether another session has
+    changed the applications since.
+    """
+
+    def __init__(self, store: JobStore, user_id: str):
+        """
+        Args:
+            store: Repository the applications are persisted in
+            user_id: Owner of the applications
+        """
+        self.store = store
+        self.user_id = user_id
+        self.version = 0
+        self._applications: Dict[int, Dict] = {}
+        self._status_counts = Counter()
+        self._ids_by_key: Dict[tuple, List[int]] = {}
+        self._sorted = None  # (version, applications)
+        self._table = None  # (version, DataFrame)
+        self._figure = None  # (version, Figure)
+
+        # Taken before loading, so a write racing the load shows up as stale
+        self._store_version = store.applications_version(user_id)
+        for application in store.list_applications(user_id):
+            self._track(application)
+
+    def _track(self, application: Dict) -> None:
+        self._applications[application["id"]] = application
+        self._status_counts[application["status"]] += 1
+        self._ids_by_key.setdefault(job_key(application), []).append(application["id"])
+
+    def _untrack(self, application: Dict) -> None:
+        self._status_counts[application["status"]] -= 1
+        if not self._status_counts[application["status"]]:
+            del self._status_counts[application["status"]]
+        ids = self._ids_by_key[job_key(application)]
+        ids.remove(application["id"])
+        if not ids:
+            del self._ids_by_key[job_key(application)]
+
+    def is_stale(self) -> bool:
+        """True if the store's applications changed other than through this tracker."""
+        return self.store.applications_version(self.user_id) != self._store_version
+
+    def __len__(self) -> int:
+        return len(self._applications)
+
+    @property
+    def applications(self) -> List[Dict]:
+        """Applications, most recently applied first; cached per version."""
+        if self._sorted is None or self._sorted[0] != self.version:
+            applications = sorted(
+                self._applications.values(),
+                key=lambda application: (application.get("application_date") or "", application["id"]),
+                reverse=True
+            )
+            self._sorted = (self.version, applications)
+        return self._sorted[1]
+
+    def get(self, application_id: int) -> Optional[Dict]:
+        return self._applications.get(application_id)
+
+    @property
+    def status_counts(self) -> Dict[str, int]:
+        return dict(self._status_counts)
+
+    @property
+    def active(self) -> int:
+        """Applications that are neither rejected nor accepted."""
+        return len(self) - sum(self._status_counts[status] for status in CLOSED_STATUSES)
+
+    @property
+    def response_rate(self) -> float:
+        """Share of applications that moved past Applied."""
+        return (len(self) - self._status_counts["Applied"]) / len(self) if len(self) else 0
+
+    def status_of(self, job: Dict) -> Optional[str]:
+        """Status of the earliest application for a job, or None if it is not tracked."""
+        ids = self._ids_by_key.get(job_key(job))
+        return self._applications[min(ids)]["status"] if ids else None
+
+    def _reload(self, application_id: int) -> None:
+        """Replace the tracked copy of an application with the store's (dropping it if gone)."""
+        application = self._applications.pop(application_id, None)
+        if application is not None:
+            self._untrack(application)
+        application = self.store.get_application(self.user_id, application_id)
+        if application is not None:
+            self._track(application)
+        self.version += 1
+
+    def _wrote(self, store_version: tuple) -> None:
+        """
+        Record the store's version after this tracker's write.
+
+        Only adopted if the store was still at the version this tracker was
+        built from before the write; otherwise another session's change is
+        pending and the tracker must stay stale so it gets reloaded.
+        """
+        if store_version == self._store_version:
+            self._store_version = self.store.applications_version(self.user_id)
+
+    def add(self, applications: Iterable[Dict], skip_tracked: bool = False) -> List[int]:
+        """
+        Track new applications (see JobStore.add_applications).
+
+        Returns:
+            list: Ids of the added applications
+        """
+        applications = list(applications)
+        store_version = self.store.applications_version(self.user_id)
+        ids = self.store.add_applications(self.user_id, applications, skip_tracked)
+        for application_id in ids:
+            self._reload(application_id)
+        if ids:
+            self._wrote(store_version)
+        return ids
+
+    def update(self, application_id: int, **fields) -> None:
+        """
+        Change fields of an application (see JobStore.update_application).
+
+        An id this tracker does not know (e.g. added in another session) is
+        updated in the store and picked up from there.
+        """
+        store_version = self.store.applications_version(self.user_id)
+        self.store.update_application(self.user_id, application_id, **fields)
+        self._reload(application_id)
+        self._wrote(store_version)
+
+    def delete(self, application_id: int) -> None:
+        store_version = self.store.applications_version(self.user_id)
+        self.store.delete_application(self.user_id, application_id)
+        if application_id in self._applications:
+            self._reload(application_id)
+        self._wrote(store_version)
+
+    def table(self) -> pd.DataFrame:
+        """Applications table for display, most recent first; cached per version."""
+        if self._table is None or self._table[0] != self.version:
+            frame = pd.DataFrame(self.applications, columns=list(TABLE_COLUMNS))
+            frame["application_date"] = pd.to_datetime(frame["application_date"])
+            self._table = (self.version, frame.rename(columns=TABLE_COLUMNS))
+        return self._table[1]
+
+    def status_figure(self):
+        """Bar chart of applications by status; cached per version."""
+        if self._figure is not None and self._figure[0] != self.version:
+            figure = self._figure[1]
+            if {trace.name for trace in figure.data} == set(self._status_counts):
+                # Same bars, new heights: much cheaper than building a new chart
+                figure.for_each_trace(lambda trace: trace.update(y=[self._status_counts[trace.name]]))
+                self._figure = (self.version, figure)
+
+        if self._figure is None or self._figure[0] != self.version:
+            status_df = pd.DataFrame({
+                "Status": list(self._status_counts.keys()),
+                "Count": list(self._status_counts.values())
+            })
+            figure = px.bar(
+                status_df,
+                x="Status",
+                y="Count",
+                color="Status",
+                title="Application Status Overview"
+            )
+            self._figure = (self.version, figure)
+        return self._figure[1]
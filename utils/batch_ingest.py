@@ -0,0 +1,281 @@
+import argparse
+import io
+import json
+import os
+import sys
+import time
+import zipfile
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from utils import resume_parsar
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx", ".txt")
+STAGES = ("read", "extract", "skills", "experience")
+PROGRESS_INTERVAL = 5.0  # Seconds between progress lines
+
+class NamedBytesIO(io.BytesIO):
+    """In-memory file with the ``name`` and ``size`` extract_resume_text expects of uploads."""
+
+    def __init__(self, data: bytes, name: str):
+        super().__init__(data)
+        self.name = name
+        self.size = len(data)
+
+def iter_source(source: str) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    List the resumes in a directory or zip archive without reading them.
+
+    Yields:
+        tuple: (source, member) where member is the archive entry name, or
+        (path, None) for files in a directory
+    """
+    if os.path.isdir(source):
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for name in sorted(files):
+                if name.lower().endswith(SUPPORTED_EXTENSIONS):
+                    yield os.path.join(root, name), None
+    elif zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and info.filename.lower().endswith(SUPPORTED_EXTENSIONS):
+                    yield source, info.filename
+    else:
+        raise ValueError(f"{source} is neither a directory nor a zip archive")
+
+# Archives opened by this worker process, reused across files
+_archives: Dict[str, zipfile.ZipFile] = {}
+
+def _init_worker() -> None:
+    # Each worker already is one process of the pool; don't nest another pool per PDF
+    resume_parsar.PDF_EXTRACT_WORKERS = 1
+
+def _read(source: str, member: Optional[str]) -> bytes:
+    if member is None:
+        with open(source, "rb") as f:
+            return f.read()
+    archive = _archives.get(source)
+    if archive is None:
+        archive = _archives[source] = zipfile.ZipFile(source)
+    return archive.read(member)
+
+def process_resume(source: str, member: Optional[str] = None, include_text: bool = False) -> Dict:
+    """
+    Run one resume through the extraction pipeline.
+
+    Returns:
+        dict: Result record; "status" is "ok" or "error" and "timings"
+        holds the seconds spent in each stage that ran
+    """
+    name = member if member is not None else source
+    record = {"file": name, "status": "ok", "error": None, "timings": {}}
+    timings = record["timings"]
+
+    try:
+        start = time.perf_counter()
+        upload = NamedBytesIO(_read(source, member), os.path.basename(name))
+        timings["read"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        text = resume_parsar.extract_resume_text(upload) or ""
+        timings["extract"] = time.perf_counter() - start
+        if not text.strip():
+            raise ValueError("No text could be extracted")
+
+        start = time.perf_counter()
+        record["skills"] = resume_parsar.extract_skills(text)
+        timings["skills"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        record["experience_years"] = resume_parsar.extract_experience_duration(text)
+        timings["experience"] = time.perf_counter() - start
+
+        record["text_chars"] = len(text)
+        if include_text:
+            record["text"] = text
+    except Exception as e:
+        record["status"] = "error"
+        record["error"] = str(e)
+    return record
+
+class JsonlWriter:
+    """Append records to a JSON Lines file, one line per resume."""
+
+    def __init__(self, path: str):
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, records: List[Dict]) -> None:
+        for record in records:
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+class ParquetWriter:
+    """Write records to a Parquet file, one row group per batch (requires pyarrow)."""
+
+    def __init__(self, path: str, include_text: bool = False):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet output requires pyarrow (pip install pyarrow)")
+
+        self._pa = pa
+        fields = [
+            pa.field("file", pa.string()),
+            pa.field("status", pa.string()),
+            pa.field("error", pa.string()),
+            pa.field("text_chars", pa.int64()),
+            pa.field("skills", pa.list_(pa.string())),
+            pa.field("experience_years", pa.int64()),
+        ]
+        if include_text:
+            fields.append(pa.field("text", pa.string()))
+        fields += [pa.field(f"{stage}_seconds", pa.float64()) for stage in STAGES]
+        self._schema = pa.schema(fields)
+        self._writer = pq.ParquetWriter(path, self._schema)
+
+    def write(self, records: List[Dict]) -> None:
+        rows = []
+        for record in records:
+            row = {key: value for key, value in record.items() if key != "timings"}
+            for stage in STAGES:
+                row[f"{stage}_seconds"] = record["timings"].get(stage)
+            rows.append(row)
+        self._writer.write_table(self._pa.Table.from_pylist(rows, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+class IngestStats:
+    """Running totals for the progress and summary reports."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+        self.processed = 0
+        self.failed = 0
+        self.stage_seconds = defaultdict(float)
+        self.errors = defaultdict(int)
+
+    def add(self, record: Dict) -> None:
+        self.processed += 1
+        if record["status"] != "ok":
+            self.failed += 1
+            self.errors[record["error"]] += 1
+        for stage, seconds in record["timings"].items():
+            self.stage_seconds[stage] += seconds
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.perf_counter()) - self.started
+
+    def finish(self) -> None:
+        self.finished = time.perf_counter()
+
+    def progress_line(self) -> str:
+        rate = self.processed / self.elapsed if self.elapsed else 0.0
+        return f"{self.processed} processed, {self.failed} failed, {rate:.1f} docs/sec"
+
+    def summary(self) -> str:
+        lines = [
+            f"Processed {self.processed} resumes in {self.elapsed:.1f}s "
+            f"({self.processed / self.elapsed if self.elapsed else 0.0:.1f} docs/sec)",
+            f"Succeeded: {self.processed - self.failed}, failed: {self.failed}",
+            "Mean time per resume by stage (worker time):",
+        ]
+        for stage in STAGES:
+            mean = self.stage_seconds[stage] / self.processed if self.processed else 0.0
+            lines.append(f"  {stage:<10} {mean * 1000:8.2f} ms")
+        if self.errors:
+            lines.append("Most common failures:")
+            for error, count in sorted(self.errors.items(), key=lambda item: -item[1])[:5]:
+                lines.append(f"  {count:>5}  {error}")
+        return "\n".join(lines)
+
+def ingest(source: str, output: str, output_format: str = "jsonl", workers: Optional[int] = None,
+           batch_size: int = 100, include_text: bool = False, log=sys.stderr) -> IngestStats:
+    """
+    Process every resume in a directory or zip archive.
+
+    At most ``workers * 4`` files are in flight at once, so memory stays
+    bounded however large the source is; results are written every
+    ``batch_size`` records, in completion order.
+
+    Returns:
+        IngestStats: Totals for the run
+    """
+    workers = workers or os.cpu_count() or 1
+    writer = ParquetWriter(output, include_text) if output_format == "parquet" else JsonlWriter(output)
+    stats = IngestStats()
+    batch: List[Dict] = []
+    last_progress = time.perf_counter()
+
+    def collect(done) -> None:
+        nonlocal last_progress
+        for future in done:
+            record = future.result()
+            stats.add(record)
+            batch.append(record)
+        if len(batch) >= batch_size:
+            writer.write(batch)
+            batch.clear()
+        if time.perf_counter() - last_progress >= PROGRESS_INTERVAL:
+            print(stats.progress_line(), file=log)
+            last_progress = time.perf_counter()
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            pending = set()
+            for file_source, member in iter_source(source):
+                if len(pending) >= workers * 4:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending.add(pool.submit(process_resume, file_source, member, include_text))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+        if batch:
+            writer.write(batch)
+    finally:
+        writer.close()
+        stats.finish()
+
+    return stats
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Stream resumes from a directory (searched recursively) or a .zip archive
+    through text extraction, skill extraction and experience estimation in a
+    pool of worker processes, writing one record per file incrementally.
+
+        python -m utils.batch_ingest resumes/ -o results.jsonl
+        python -m utils.batch_ingest resumes.zip -o results.parquet --workers 8
+    """
+    parser = argparse.ArgumentParser(description="Extract text, skills and experience from a batch of resumes.")
+    parser.add_argument("source", help="Directory of resumes or a .zip archive")
+    parser.add_argument("-o", "--output", required=True, help="Output file (.jsonl or .parquet)")
+    parser.add_argument("--format", choices=("jsonl", "parquet"),
+                        help="Output format (default: from the output file extension)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=100, help="Records per write")
+    parser.add_argument("--include-text", action="store_true", help="Store the extracted text in each record")
+    args = parser.parse_args(argv)
+
+    output_format = args.format or ("parquet" if args.output.endswith(".parquet") else "jsonl")
+
+    try:
+        stats = ingest(args.source, args.output, output_format, args.workers, args.batch_size, args.include_text)
+    except (ValueError, RuntimeError, OSError) as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        return 1
+
+    print(stats.summary(), file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,40 +2,37 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from utils.openai_utils import get_openai_client
-import json
+from utils.openai_utils import request_json_completion
+from utils.skill_taxonomy import get_taxonomy
+
+# Skills shown in an industry's "Top Skills in Demand" chart
+TOP_SKILLS_COUNT = 8
 
 # Sample job market data - In a real application, this would come from an API or database
 SAMPLE_JOB_TRENDS = {
     "Technology": {
         "growing_roles": ["Data Scientist", "AI Engineer", "Cloud Architect", "DevOps Engineer", "Cybersecurity Specialist"],
-        "declining_roles": ["Basic Web Developer", "System Administrator", "Desktop Support"],
-        "top_skills": ["Python", "AWS", "Machine Learning", "Kubernetes", "React", "JavaScript", "Azure", "Data Analysis"]
+        "declining_roles": ["Basic Web Developer", "System Administrator", "Desktop Support"]
     },
     "Healthcare": {
         "growing_roles": ["Telemedicine Physician", "Health Informatics Specialist", "Nurse Practitioner", "Mental Health Counselor"],
-        "declining_roles": ["Medical Transcriptionist", "Medical Records Clerk"],
-        "top_skills": ["Telehealth", "Electronic Health Records", "Patient Care", "Healthcare Management", "Medical Coding"]
+        "declining_roles": ["Medical Transcriptionist", "Medical Records Clerk"]
     },
     "Finance": {
         "growing_roles": ["Financial Analyst", "Risk Manager", "FinTech Developer", "ESG Specialist", "Financial Planner"],
-        "declining_roles": ["Bank Teller", "Data Entry Clerk", "Loan Processor"],
-        "top_skills": ["Financial Analysis", "Python", "SQL", "Risk Assessment", "Blockchain", "Regulatory Compliance"]
+        "declining_roles": ["Bank Teller", "Data Entry Clerk", "Loan Processor"]
     },
     "Education": {
         "growing_roles": ["Instructional Designer", "EdTech Specialist", "Virtual Tutor", "Learning Experience Designer"],
-        "declining_roles": ["Traditional Textbook Publisher", "Library Assistant"],
-        "top_skills": ["Online Learning Platforms", "Digital Curriculum Development", "Educational Technology", "Student Engagement"]
+        "declining_roles": ["Traditional Textbook Publisher", "Library Assistant"]
     },
     "Manufacturing": {
         "growing_roles": ["Automation Engineer", "Supply Chain Analyst", "IoT Specialist", "Robotics Technician"],
-        "declining_roles": ["Assembly Line Worker", "Quality Control Inspector"],
-        "top_skills": ["Lean Manufacturing", "Automation", "Six Sigma", "IoT", "Supply Chain Management", "CAD"]
+        "declining_roles": ["Assembly Line Worker", "Quality Control Inspector"]
     },
     "Retail": {
         "growing_roles": ["E-commerce Manager", "Digital Marketing Specialist", "Supply Chain Coordinator", "Customer Experience Manager"],
-        "declining_roles": ["Cashier", "In-store Sales Associate", "Inventory Clerk"],
-        "top_skills": ["E-commerce Platforms", "Digital Marketing", "Inventory Management", "Customer Experience", "Omnichannel Strategy"]
+        "declining_roles": ["Cashier", "In-store Sales Associate", "Inventory Clerk"]
     }
 }
 
@@ -49,11 +46,12 @@ def get_job_market_insights(industry):
     Returns:
         dict: Job market insights data
     """
-    if industry in SAMPLE_JOB_TRENDS:
-        return SAMPLE_JOB_TRENDS[industry]
-    else:
+    if industry not in SAMPLE_JOB_TRENDS:
         # Default to Technology if industry not found
-        return SAMPLE_JOB_TRENDS["Technology"]
+        industry = "Technology"
+    
+    # In-demand skills come from the skill taxonomy's industry tags
+    return {**SAMPLE_JOB_TRENDS[industry], "top_skills": get_taxonomy().skills_for_industry(industry, TOP_SKILLS_COUNT)}
 
 def get_skill_gap_analysis(user_skills, target_role, industry="Technology"):
     """
@@ -67,8 +65,6 @@ def get_skill_gap_analysis(user_skills, target_role, industry="Technology"):
     Returns:
         dict: Skill gap analysis results
     """
-    client = get_openai_client()
-    
     # Convert skills list to comma-separated string
     skills_str = ", ".join(user_skills) if user_skills else "None provided"
     
@@ -95,17 +91,14 @@ def get_skill_gap_analysis(user_skills, target_role, industry="Technology"):
     """
     
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o",
+        result = request_json_completion(
             messages=[
                 {"role": "system", "content": "You are an expert in career development and skills analysis."},
                 {"role": "user", "content": prompt}
             ],
-            response_format={"type": "json_object"},
-            temperature=0.5
+            temperature=0.5,
+            call_site="skill_gap"
         )
-        
-        result = json.loads(response.choices[0].message.content)
         return result
     except Exception as e:
         return {
@@ -128,6 +121,11 @@ def generate_skills_radar_chart(user_skills, required_skills):
     Returns:
         plotly.graph_objects.Figure: Radar chart figure
     """
+    # Compare canonical names so different spellings of a skill share one axis
+    taxonomy = get_taxonomy()
+    user_skills = taxonomy.canonicalize_all(user_skills)
+    required_skills = taxonomy.canonicalize_all(required_skills)
+    
     # Create a set of all skills
     all_skills = list(set(user_skills + required_skills))
     
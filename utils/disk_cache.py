@@ -0,0 +1,182 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+# Default location for all on-disk caches (overridable per deployment)
+CACHE_DIR = os.getenv(
+    "CAREER_ADVISOR_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".career_advisor_cache")
+)
+
+# A hit only rewrites an entry's access time when the stored one is older
+# than this, so most reads need no write transaction
+ACCESS_UPDATE_INTERVAL = 60.0
+
+# Running total of the entries' sizes, kept in step by triggers so writers in
+# every process see the same figure without summing the table
+_SCHEMA = """
+BEGIN IMMEDIATE;
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries (last_access);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (name, value) SELECT 'total_bytes', COALESCE(SUM(size), 0) FROM entries;
+CREATE TRIGGER IF NOT EXISTS entries_size_insert AFTER INSERT ON entries BEGIN
+    UPDATE meta SET value = value + new.size WHERE name = 'total_bytes';
+END;
+CREATE TRIGGER IF NOT EXISTS entries_size_delete AFTER DELETE ON entries BEGIN
+    UPDATE meta SET value = value - old.size WHERE name = 'total_bytes';
+END;
+CREATE TRIGGER IF NOT EXISTS entries_size_update AFTER UPDATE OF size ON entries BEGIN
+    UPDATE meta SET value = value + new.size - old.size WHERE name = 'total_bytes';
+END;
+COMMIT;
+"""
+
+class DiskCache:
+    """
+    SQLite-backed key/value cache with per-entry TTLs and LRU eviction by size.
+
+    Entries survive process restarts and the same file can be shared by
+    several Streamlit workers (the database runs in WAL mode). The total
+    size is kept in a meta row, so a write only scans the table when the
+    cache is over budget; access times are recorded to within
+    ACCESS_UPDATE_INTERVAL.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        """
+        Args:
+            path: Location of the SQLite database file
+            max_bytes: Total size of stored values above which the least
+                recently used entries are evicted
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._connect().executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[str]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Cache key
+            allow_stale: Return the value even if its TTL has expired
+
+        Returns:
+            str: Cached value, or None on a miss
+        """
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT value, expires_at, last_access FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        value, expires_at, last_access = row
+        now = time.time()
+        if expires_at is not None and expires_at < now and not allow_stale:
+            return None
+
+        if now - last_access >= ACCESS_UPDATE_INTERVAL:
+            with conn:
+                conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+        return value
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting least recently used entries if over budget.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds until the entry expires (None keeps it until evicted)
+        """
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        size = len(value.encode("utf-8"))
+
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT INTO entries (key, value, size, expires_at, last_access) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value, size = excluded.size, "
+                "expires_at = excluded.expires_at, last_access = excluded.last_access",
+                (key, value, size, expires_at, now)
+            )
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop expired entries, then the least recently used ones, until under max_bytes."""
+        if self._total_bytes(conn) <= self.max_bytes:
+            return
+
+        conn.execute("DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at < ?", (time.time(),))
+        total = self._total_bytes(conn)
+
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return
+
+        freed = 0
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY last_access"):
+            victims.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+
+    @staticmethod
+    def _total_bytes(conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT value FROM meta WHERE name = 'total_bytes'").fetchone()[0]
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry."""
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM entries")
+
+    def stats(self) -> Dict:
+        """
+        Summarize the cache contents.
+
+        Returns:
+            dict: {"entries": int, "bytes": int, "max_bytes": int}
+        """
+        conn = self._connect()
+        count = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return {"entries": count, "bytes": self._total_bytes(conn), "max_bytes": self.max_bytes}
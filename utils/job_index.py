@@ -0,0 +1,277 @@
+import csv
+import json
+import math
+import os
+import re
+import threading
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+import numpy as np
+
+from utils.nlp_utils import regex_tokenize
+from utils.nltk_resources import get_stopwords
+from utils.skill_taxonomy import get_taxonomy
+
+# Job postings file (JSON Lines or CSV) the search index is built from
+JOB_POSTINGS_PATH = os.getenv(
+    "JOB_POSTINGS_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "job_postings.jsonl")
+)
+
+# BM25 parameters and per-field weights (a title hit counts three description hits)
+BM25_K1 = 1.2
+BM25_B = 0.75
+FIELD_WEIGHTS = {"title": 3.0, "required_skills": 2.0, "description": 1.0}
+
+POSTING_FIELDS = (
+    "id", "title", "company", "location", "industry", "experience_level", "job_type",
+    "salary_range", "description", "company_description", "required_skills", "posted_date", "url",
+)
+
+# Used when the NLTK stopword corpus is not installed
+_FALLBACK_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "into", "is", "it",
+    "of", "on", "or", "our", "the", "to", "we", "with", "you", "your", "will",
+})
+
+_WORD_PATTERN = re.compile(r"\w")
+
+def load_stopwords() -> frozenset:
+    """NLTK English stopwords, or a short built-in list when the corpus is unavailable."""
+    try:
+        return get_stopwords()
+    except LookupError:
+        return _FALLBACK_STOPWORDS
+
+def index_terms(text: str, stopwords: frozenset) -> List[str]:
+    """Lowercase word tokens of a text, without stopwords and punctuation."""
+    return [
+        token for token in regex_tokenize(text.lower())
+        if token not in stopwords and _WORD_PATTERN.search(token)
+    ]
+
+def weighted_terms(posting: Dict, stopwords: frozenset) -> Counter:
+    """Term frequencies of a posting, each occurrence counted with its field's weight."""
+    weighted = Counter()
+    for field, weight in FIELD_WEIGHTS.items():
+        value = posting[field]
+        text = " ".join(value) if isinstance(value, list) else value
+        for term in index_terms(text, stopwords):
+            weighted[term] += weight
+    return weighted
+
+def _split_skills(value) -> List[str]:
+    if isinstance(value, list):
+        return [str(skill).strip() for skill in value if str(skill).strip()]
+    return [skill.strip() for skill in re.split(r"[;,|]", str(value or "")) if skill.strip()]
+
+def normalize_posting(raw: Dict, index: int) -> Dict:
+    """Map a raw posting onto the fields the job search page displays."""
+    # Values may be numbers (JSON) or anything else; the index works on text
+    posting = {field: str(raw.get(field) or "") for field in POSTING_FIELDS}
+    posting["id"] = str(raw.get("id") or index)
+    posting["required_skills"] = get_taxonomy().canonicalize_all(_split_skills(raw.get("required_skills")))
+    return posting
+
+def load_postings(path: str) -> List[Dict]:
+    """
+    Read job postings from a JSON Lines or CSV file.
+
+    In CSV files, required_skills is a list separated by ';', ',' or '|'.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If a line is not valid JSON
+    """
+    postings = []
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.lower().endswith(".csv"):
+            rows: Iterable[Dict] = csv.DictReader(f)
+        else:
+            rows = (json.loads(line) for line in f if line.strip())
+        for index, row in enumerate(rows):
+            postings.append(normalize_posting(row, index))
+    return postings
+
+class SearchResults(NamedTuple):
+    """One page of search results."""
+    jobs: List[Dict]  # Postings on this page, each with a "score"
+    total: int  # Postings matching the query and filters
+    page: int
+    page_size: int
+
+    @property
+    def page_count(self) -> int:
+        return max(1, math.ceil(self.total / self.page_size))
+
+class JobIndex:
+    """
+    Inverted index over job postings with BM25 ranking.
+
+    Each term's postings list stores its precomputed BM25 contribution per
+    document, so a query is a handful of vectorized gathers and adds.
+    """
+
+    def __init__(self, postings: List[Dict]):
+        """
+        Args:
+            postings: Normalized postings (see normalize_posting)
+        """
+        self.postings = postings
+        stopwords = load_stopwords()
+
+        doc_ids: Dict[str, array] = {}
+        term_freqs: Dict[str, array] = {}
+        lengths = np.zeros(len(postings), dtype=np.float32)
+
+        for doc_id, posting in enumerate(postings):
+            weighted = weighted_terms(posting, stopwords)
+            lengths[doc_id] = sum(weighted.values())
+            for term, freq in weighted.items():
+                ids = doc_ids.get(term)
+                if ids is None:
+                    ids = doc_ids[term] = array("i")
+                    term_freqs[term] = array("f")
+                ids.append(doc_id)
+                term_freqs[term].append(freq)
+
+        doc_count = len(postings)
+        average_length = float(lengths.mean()) if doc_count else 0.0
+        norms = BM25_K1 * (1 - BM25_B + BM25_B * lengths / (average_length or 1.0))
+
+        # term -> (document ids, BM25 contribution in each)
+        self._postings: Dict[str, tuple] = {}
+        for term, ids in doc_ids.items():
+            ids = np.frombuffer(ids, dtype=np.int32)
+            freqs = np.frombuffer(term_freqs[term], dtype=np.float32)
+            idf = math.log(1 + (doc_count - len(ids) + 0.5) / (len(ids) + 0.5))
+            impacts = (idf * freqs * (BM25_K1 + 1) / (freqs + norms[ids])).astype(np.float32)
+            self._postings[term] = (ids, impacts)
+
+        # Filter value -> document ids
+        self._by_industry = self._group("industry")
+        self._by_level = self._group("experience_level")
+        self._by_location = self._group("location")
+        self._stopwords = stopwords
+        self._by_id = {posting["id"]: posting for posting in postings}
+
+    def __len__(self) -> int:
+        return len(self.postings)
+
+    def get(self, posting_id: str) -> Optional[Dict]:
+        """Posting with the given id, or None."""
+        return self._by_id.get(posting_id)
+
+    def _group(self, field: str) -> Dict[str, np.ndarray]:
+        groups: Dict[str, List[int]] = {}
+        for doc_id, posting in enumerate(self.postings):
+            groups.setdefault(posting[field].strip().lower(), []).append(doc_id)
+        return {value: np.array(ids, dtype=np.int32) for value, ids in groups.items()}
+
+    @staticmethod
+    def _matching(groups: Dict[str, np.ndarray], wanted: str) -> np.ndarray:
+        """Documents whose value contains the wanted text, so "New York" finds "New York, NY"."""
+        wanted = wanted.strip().lower()
+        matches = [ids for value, ids in groups.items() if wanted in value]
+        return np.concatenate(matches) if matches else np.zeros(0, dtype=np.int32)
+
+    def _filter_mask(self, industry: Optional[str], location: Optional[str],
+                     experience_level: Optional[str]) -> Optional[np.ndarray]:
+        """Boolean mask of postings passing the filters, or None if no filter is set."""
+        mask = None
+
+        def restrict(ids: np.ndarray) -> None:
+            nonlocal mask
+            allowed = np.zeros(len(self.postings), dtype=bool)
+            allowed[ids] = True
+            mask = allowed if mask is None else mask & allowed
+
+        if industry:
+            restrict(self._matching(self._by_industry, industry))
+        if experience_level and experience_level != "Any":
+            restrict(self._by_level.get(experience_level.strip().lower(), np.zeros(0, dtype=np.int32)))
+        if location:
+            restrict(self._matching(self._by_location, location))
+        return mask
+
+    def search(self, query: str, industry: Optional[str] = None, location: Optional[str] = None,
+               experience_level: Optional[str] = None, page: int = 1, page_size: int = 10) -> SearchResults:
+        """
+        Rank postings for a free-text query.
+
+        Args:
+            query: Search terms, e.g. a job title plus skills
+            industry: Only postings whose industry contains this text
+            location: Only postings whose location contains this text
+            experience_level: Only postings at this level ('Any' disables the filter)
+            page: 1-based page number
+            page_size: Results per page
+
+        Returns:
+            SearchResults: The requested page, best matches first
+        """
+        page = max(1, page)
+        scores = np.zeros(len(self.postings), dtype=np.float32)
+        for term in set(index_terms(query, self._stopwords)):
+            entry = self._postings.get(term)
+            if entry is not None:
+                ids, impacts = entry
+                scores[ids] += impacts
+
+        matched = scores > 0 if query.strip() else np.ones(len(self.postings), dtype=bool)
+        mask = self._filter_mask(industry, location, experience_level)
+        if mask is not None:
+            matched &= mask
+
+        candidates = np.flatnonzero(matched)
+        total = len(candidates)
+        end = page * page_size
+        if end - page_size >= total:
+            return SearchResults([], total, page, page_size)
+
+        # Partial sort: only the results up to this page need ordering. Every
+        # posting tied with the last one kept is included before the cut, so
+        # ties are broken by position and pages never overlap or skip one.
+        candidate_scores = scores[candidates]
+        if end < total:
+            threshold = -np.partition(-candidate_scores, end - 1)[end - 1]
+            top = np.flatnonzero(candidate_scores >= threshold)
+        else:
+            top = np.arange(total)
+        top = top[np.lexsort((candidates[top], -candidate_scores[top]))][:end]
+
+        jobs = []
+        for position in top[end - page_size:end]:
+            doc_id = candidates[position]
+            jobs.append({**self.postings[doc_id], "score": float(scores[doc_id])})
+        return SearchResults(jobs, total, page, page_size)
+
+    @classmethod
+    def from_file(cls, path: str) -> "JobIndex":
+        return cls(load_postings(path))
+
+_index: Optional[JobIndex] = None
+_index_source = None  # (path, mtime) the index was built from
+_index_lock = threading.Lock()
+
+def get_job_index() -> Optional[JobIndex]:
+    """
+    Index of JOB_POSTINGS_PATH, rebuilt when the file changes.
+
+    Returns:
+        JobIndex: The index, or None if there is no postings file
+    """
+    global _index, _index_source
+
+    try:
+        source = (JOB_POSTINGS_PATH, os.path.getmtime(JOB_POSTINGS_PATH))
+    except OSError:
+        return None
+
+    with _index_lock:
+        if _index is None or _index_source != source:
+            _index = JobIndex.from_file(JOB_POSTINGS_PATH)
+            _index_source = source
+        return _index
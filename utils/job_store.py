@@ -0,0 +1,349 @@
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Saved jobs, search history and tracked applications for every user
+JOB_STORE_PATH = os.getenv(
+    "JOB_STORE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "user_data.sqlite3")
+)
+
+APPLICATION_STATUSES = ["Applied", "Screening", "Interview", "Technical Test", "Offer", "Rejected", "Accepted"]
+CLOSED_STATUSES = ("Rejected", "Accepted")
+
+# Application columns callers may set
+APPLICATION_FIELDS = ("company", "title", "application_date", "status", "notes", "last_updated")
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS saved_jobs (
+    id INTEGER PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    job_key TEXT NOT NULL,
+    data TEXT NOT NULL,
+    saved_date TEXT NOT NULL,
+    UNIQUE (user_id, job_key)
+);
+CREATE TABLE IF NOT EXISTS applications (
+    id INTEGER PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    job_key TEXT NOT NULL,
+    company TEXT NOT NULL,
+    title TEXT NOT NULL,
+    application_date TEXT,
+    status TEXT NOT NULL,
+    notes TEXT NOT NULL DEFAULT '',
+    last_updated TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_applications_user_status ON applications (user_id, status);
+CREATE INDEX IF NOT EXISTS idx_applications_user_key ON applications (user_id, job_key);
+CREATE INDEX IF NOT EXISTS idx_applications_user_updated ON applications (user_id, last_updated);
+CREATE TABLE IF NOT EXISTS search_history (
+    id INTEGER PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    job_title TEXT NOT NULL,
+    industry TEXT NOT NULL DEFAULT '',
+    location TEXT NOT NULL DEFAULT '',
+    experience_level TEXT NOT NULL DEFAULT '',
+    timestamp TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_search_history_user ON search_history (user_id, id);
+"""
+
+def job_key(job: Dict) -> Tuple[str, str]:
+    """
+    Normalized identity of a job: case- and whitespace-insensitive (company, title).
+
+    Args:
+        job: A job posting, saved job or application
+
+    Returns:
+        tuple: (company, title)
+    """
+    return (
+        " ".join((job.get("company") or "").lower().split()),
+        " ".join((job.get("title") or "").lower().split())
+    )
+
+def _key_column(job: Dict) -> str:
+    return "\x1f".join(job_key(job))
+
+def parse_user_id(value) -> Optional[str]:
+    """
+    Validate a user id taken from outside (e.g. the page URL).
+
+    Returns:
+        str: The id in canonical form, or None if it is not a UUID
+    """
+    try:
+        return str(uuid.UUID(str(value)))
+    except (TypeError, ValueError):
+        return None
+
+def resolve_user_id(session_state, query_params) -> str:
+    """
+    Id the session's saved jobs, searches and applications are stored under.
+
+    The id is kept in the page URL (?uid=...) so the data survives a reload:
+    an id already in the session wins, then a valid one from the URL, else a
+    new one is made. The URL is updated to match.
+
+    Args:
+        session_state: The Streamlit session state
+        query_params: The Streamlit query parameters
+
+    Returns:
+        str: The user id
+    """
+    if "user_id" not in session_state:
+        session_state["user_id"] = parse_user_id(query_params.get("uid")) or str(uuid.uuid4())
+    if query_params.get("uid") != session_state["user_id"]:
+        query_params["uid"] = session_state["user_id"]
+    return session_state["user_id"]
+
+def now_timestamp() -> str:
+    return datetime.now().strftime(TIMESTAMP_FORMAT)
+
+class JobStore:
+    """
+    SQLite repository for each user's saved jobs, searches and applications.
+
+    The database runs in WAL mode, so several Streamlit workers can read
+    while one writes. Every method takes the user_id and only touches that
+    user's rows; methods that accept several rows write them in one
+    transaction.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Location of the SQLite database file
+        """
+        self.path = path
+        self._local = threading.local()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Group several writes into one commit (rolled back on error)."""
+        conn = self._connect()
+        with conn:
+            yield conn
+
+    # Saved jobs
+
+    def list_saved_jobs(self, user_id: str) -> List[Dict]:
+        """
+        Saved jobs, oldest first.
+
+        Returns:
+            list: Job dicts as saved, with "id" replaced by the saved row id
+            (the posting id is kept as "posting_id") and "saved_date"
+        """
+        rows = self._connect().execute(
+            "SELECT id, data, saved_date FROM saved_jobs WHERE user_id = ? ORDER BY id", (user_id,)
+        ).fetchall()
+        jobs = []
+        for row in rows:
+            job = json.loads(row["data"])
+            if "id" in job:
+                job["posting_id"] = job["id"]
+            job["id"] = row["id"]
+            job["saved_date"] = row["saved_date"]
+            jobs.append(job)
+        return jobs
+
+    def save_job(self, user_id: str, job: Dict) -> bool:
+        """
+        Save a job unless one with the same job_key() is already saved.
+
+        Returns:
+            bool: True if the job was added
+        """
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO saved_jobs (user_id, job_key, data, saved_date) VALUES (?, ?, ?, ?)",
+                (user_id, _key_column(job), json.dumps(job), now_timestamp())
+            )
+        return cursor.rowcount > 0
+
+    def remove_saved_job(self, user_id: str, saved_id: int) -> None:
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM saved_jobs WHERE user_id = ? AND id = ?", (user_id, saved_id))
+
+    # Applications
+
+    def list_applications(self, user_id: str) -> List[Dict]:
+        """
+        Tracked applications, most recently applied first.
+
+        Returns:
+            list: Application dicts with their "id"
+        """
+        rows = self._connect().execute(
+            "SELECT id, company, title, application_date, status, notes, last_updated "
+            "FROM applications WHERE user_id = ? ORDER BY application_date DESC, id DESC",
+            (user_id,)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_application(self, user_id: str, application_id: int) -> Optional[Dict]:
+        row = self._connect().execute(
+            "SELECT id, company, title, application_date, status, notes, last_updated "
+            "FROM applications WHERE user_id = ? AND id = ?",
+            (user_id, application_id)
+        ).fetchone()
+        return dict(row) if row is not None else None
+
+    def add_applications(self, user_id: str, applications: Iterable[Dict], skip_tracked: bool = False) -> List[int]:
+        """
+        Add applications in a single transaction.
+
+        Args:
+            user_id: Owner of the applications
+            applications: Dicts with APPLICATION_FIELDS; "status" defaults to
+                Applied and "last_updated" to now
+            skip_tracked: Skip applications whose job_key() already has one
+
+        Returns:
+            list: Ids of the added applications
+        """
+        ids = []
+        with self.transaction() as conn:
+            for application in applications:
+                key = _key_column(application)
+                if skip_tracked and conn.execute(
+                    "SELECT 1 FROM applications WHERE user_id = ? AND job_key = ? LIMIT 1", (user_id, key)
+                ).fetchone():
+                    continue
+                cursor = conn.execute(
+                    "INSERT INTO applications "
+                    "(user_id, job_key, company, title, application_date, status, notes, last_updated) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        user_id, key,
+                        application.get("company") or "",
+                        application.get("title") or "",
+                        application.get("application_date"),
+                        application.get("status") or "Applied",
+                        application.get("notes") or "",
+                        application.get("last_updated") or now_timestamp(),
+                    )
+                )
+                ids.append(cursor.lastrowid)
+        return ids
+
+    def update_application(self, user_id: str, application_id: int, **fields) -> None:
+        """
+        Change fields of an application; "last_updated" is set to now unless given.
+
+        Raises:
+            ValueError: If a field is not one of APPLICATION_FIELDS
+        """
+        unknown = set(fields) - set(APPLICATION_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown application fields: {', '.join(sorted(unknown))}")
+        fields.setdefault("last_updated", now_timestamp())
+
+        assignments = [f"{field} = ?" for field in fields]
+        values = list(fields.values())
+        if "company" in fields or "title" in fields:
+            current = self.get_application(user_id, application_id) or {}
+            assignments.append("job_key = ?")
+            values.append(_key_column({**current, **fields}))
+
+        with self.transaction() as conn:
+            conn.execute(
+                f"UPDATE applications SET {', '.join(assignments)} WHERE user_id = ? AND id = ?",
+                (*values, user_id, application_id)
+            )
+
+    def delete_application(self, user_id: str, application_id: int) -> None:
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM applications WHERE user_id = ? AND id = ?", (user_id, application_id))
+
+    def applications_version(self, user_id: str) -> Tuple:
+        """
+        Cheap fingerprint of a user's applications, to notice writes made elsewhere.
+
+        Adds and updates move the latest last_updated and deletes change the
+        count; only changes within the same second as the latest update can
+        go unnoticed.
+
+        Returns:
+            tuple: (count, latest last_updated)
+        """
+        return tuple(self._connect().execute(
+            "SELECT COUNT(*), MAX(last_updated) FROM applications WHERE user_id = ?", (user_id,)
+        ).fetchone())
+
+    # Search history
+
+    def add_search(self, user_id: str, search: Dict) -> None:
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT INTO search_history (user_id, job_title, industry, location, experience_level, timestamp) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    user_id,
+                    search.get("job_title") or "",
+                    search.get("industry") or "",
+                    search.get("location") or "",
+                    search.get("experience_level") or "",
+                    search.get("timestamp") or now_timestamp(),
+                )
+            )
+
+    def list_searches(self, user_id: str, limit: int = 50) -> List[Dict]:
+        """Most recent searches, newest first."""
+        rows = self._connect().execute(
+            "SELECT job_title, industry, location, experience_level, timestamp "
+            "FROM search_history WHERE user_id = ? ORDER BY id DESC LIMIT ?",
+            (user_id, limit)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def clear_searches(self, user_id: str) -> None:
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM search_history WHERE user_id = ?", (user_id,))
+
+_job_store: Optional[JobStore] = None
+_job_store_lock = threading.Lock()
+
+def get_job_store() -> JobStore:
+    """
+    Get the shared job store, opening it on first use.
+
+    Raises:
+        sqlite3.Error, OSError: If the database cannot be opened
+    """
+    global _job_store
+
+    if _job_store is None:
+        with _job_store_lock:
+            if _job_store is None:
+                _job_store = JobStore(JOB_STORE_PATH)
+    return _job_store
@@ -0,0 +1,340 @@
+import json
+import math
+import os
+import sys
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.disk_cache import CACHE_DIR
+from utils.job_index import JOB_POSTINGS_PATH, get_job_index, index_terms, load_stopwords, weighted_terms
+
+# Where the posting vectors are stored between runs
+JOB_VECTORS_DIR = os.getenv("JOB_VECTORS_DIR", os.path.join(CACHE_DIR, "job_vectors"))
+
+# Embedding size and vocabulary limits for the TF-IDF/SVD model
+VECTOR_DIMENSIONS = int(os.getenv("JOB_VECTOR_DIMENSIONS", "128"))
+MAX_VOCABULARY = 50_000
+SVD_OVERSAMPLES = 10
+SVD_POWER_ITERATIONS = 2
+
+# Rows scored per matrix product in top_k; bounds the temporary score array
+SEARCH_BATCH_ROWS = 65_536
+
+# Nonzeros multiplied at once while building; small enough for the temporary
+# dense block to stay in CPU cache, which is several times faster than large chunks
+_BUILD_CHUNK_NONZEROS = 4_096
+
+def _sparse_dot(indptr: np.ndarray, indices: np.ndarray, data: np.ndarray, dense: np.ndarray) -> np.ndarray:
+    """Product of a CSR matrix and a dense matrix, in row chunks to bound memory."""
+    rows = len(indptr) - 1
+    out = np.zeros((rows, dense.shape[1]), dtype=np.float32)
+    start_row = 0
+    while start_row < rows:
+        end_row = max(start_row + 1, int(np.searchsorted(indptr, indptr[start_row] + _BUILD_CHUNK_NONZEROS)) - 1)
+        end_row = min(end_row, rows)
+        starts = indptr[start_row:end_row]
+        nonempty = indptr[start_row + 1:end_row + 1] > starts
+        if nonempty.any():
+            begin, end = indptr[start_row], indptr[end_row]
+            products = data[begin:end, None] * dense[indices[begin:end]]
+            out[start_row:end_row][nonempty] = np.add.reduceat(products, starts[nonempty] - begin)
+        start_row = end_row
+    return out
+
+def _transpose(indptr: np.ndarray, indices: np.ndarray, data: np.ndarray,
+               columns: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """CSR arrays of the transposed matrix."""
+    rows = np.repeat(np.arange(len(indptr) - 1, dtype=np.int32), np.diff(indptr))
+    order = np.argsort(indices, kind="stable")
+    transposed_indptr = np.zeros(columns + 1, dtype=np.int64)
+    np.cumsum(np.bincount(indices, minlength=columns), out=transposed_indptr[1:])
+    return transposed_indptr, rows[order], data[order]
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+class JobVectorIndex:
+    """
+    Dense embeddings of job postings for resume-to-job matching.
+
+    Postings are embedded with latent semantic analysis: a TF-IDF matrix
+    (title, skills and description weighted as in the search index) reduced
+    with a randomized truncated SVD, so related terms such as "pandas" and
+    "data analysis" land close together. Rows are L2-normalized, making the
+    dot product with an embedded resume its cosine similarity.
+
+    Saved indexes are opened with the vector matrix memory-mapped, so
+    Streamlit workers share the pages instead of each loading a copy.
+    """
+
+    def __init__(self, vocabulary: Dict[str, int], idf: np.ndarray, components: np.ndarray,
+                 vectors: np.ndarray, ids: List[str]):
+        """
+        Args:
+            vocabulary: Term -> column of the TF-IDF matrix
+            idf: Inverse document frequency per column
+            components: SVD projection, dimensions x vocabulary
+            vectors: Normalized posting embeddings, postings x dimensions
+            ids: Posting id per row
+        """
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.components = components
+        self.vectors = vectors
+        self.ids = ids
+        self.rows = {posting_id: row for row, posting_id in enumerate(ids)}
+        self._stopwords = load_stopwords()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def build(cls, postings: List[Dict], dimensions: int = VECTOR_DIMENSIONS, seed: int = 0) -> "JobVectorIndex":
+        """
+        Fit the TF-IDF/SVD model to postings and embed them.
+
+        Args:
+            postings: Normalized postings (see utils.job_index.normalize_posting)
+            dimensions: Embedding size
+            seed: Seed for the randomized SVD
+        """
+        stopwords = load_stopwords()
+        documents = [weighted_terms(posting, stopwords) for posting in postings]
+
+        # Vocabulary: terms in at least two postings (unless the corpus is tiny), most frequent first
+        document_freqs = Counter()
+        for terms in documents:
+            document_freqs.update(terms.keys())
+        min_df = 2 if len(documents) >= 100 else 1
+        terms = [term for term, df in document_freqs.most_common(MAX_VOCABULARY) if df >= min_df]
+        vocabulary = {term: column for column, term in enumerate(terms)}
+        idf = np.array(
+            [math.log((1 + len(documents)) / (1 + document_freqs[term])) + 1 for term in terms],
+            dtype=np.float32
+        )
+
+        # Sublinear TF-IDF rows in CSR form, L2-normalized
+        indptr = np.zeros(len(documents) + 1, dtype=np.int64)
+        indices: List[int] = []
+        data: List[float] = []
+        for row, counts in enumerate(documents):
+            for term, freq in counts.items():
+                column = vocabulary.get(term)
+                if column is not None:
+                    indices.append(column)
+                    data.append((1 + math.log(freq)) * idf[column])
+            indptr[row + 1] = len(indices)
+        indices = np.array(indices, dtype=np.int32)
+        data = np.array(data, dtype=np.float32)
+        row_of = np.repeat(np.arange(len(documents)), np.diff(indptr))
+        row_norms = np.sqrt(np.bincount(row_of, weights=data ** 2, minlength=len(documents)))
+        data /= row_norms[row_of].astype(np.float32)
+
+        # Randomized truncated SVD (Halko et al.) of the TF-IDF matrix
+        transposed = _transpose(indptr, indices, data, len(terms))
+        sketch = min(dimensions + SVD_OVERSAMPLES, len(documents), len(terms))
+        dimensions = min(dimensions, sketch)
+        rng = np.random.default_rng(seed)
+        basis = _sparse_dot(indptr, indices, data, rng.standard_normal((len(terms), sketch)).astype(np.float32))
+        for _ in range(SVD_POWER_ITERATIONS):
+            basis, _ = np.linalg.qr(basis)
+            basis = _sparse_dot(indptr, indices, data, _sparse_dot(*transposed, basis))
+        basis, _ = np.linalg.qr(basis)
+        projected = _sparse_dot(*transposed, basis).T  # sketch x vocabulary
+        left, singular_values, components = np.linalg.svd(projected, full_matrices=False)
+
+        vectors = (basis @ left[:, :dimensions]) * singular_values[:dimensions]
+        return cls(
+            vocabulary,
+            idf,
+            np.ascontiguousarray(components[:dimensions], dtype=np.float32),
+            _normalize_rows(vectors).astype(np.float32),
+            [posting["id"] for posting in postings],
+        )
+
+    def embed(self, text: str) -> np.ndarray:
+        """
+        Embed free text (a resume, or a list of skills) in the posting space.
+
+        Returns:
+            np.ndarray: Normalized vector; all zeros if no term is known
+        """
+        counts = Counter(index_terms(text, self._stopwords))
+        columns = []
+        weights = []
+        for term, freq in counts.items():
+            column = self.vocabulary.get(term)
+            if column is not None:
+                columns.append(column)
+                weights.append((1 + math.log(freq)) * self.idf[column])
+        vector = np.zeros(self.components.shape[0], dtype=np.float32)
+        if columns:
+            vector = self.components[:, columns] @ np.array(weights, dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            if norm:
+                vector /= norm
+        return vector
+
+    def similarity(self, query: np.ndarray, posting_ids: Sequence[str]) -> Dict[str, float]:
+        """
+        Cosine similarity between a query vector and specific postings.
+
+        Returns:
+            dict: Posting id -> similarity, for the ids in the index
+        """
+        known = [posting_id for posting_id in posting_ids if posting_id in self.rows]
+        if not known:
+            return {}
+        scores = self.vectors[[self.rows[posting_id] for posting_id in known]] @ query
+        return dict(zip(known, scores.tolist()))
+
+    def top_k(self, query: np.ndarray, k: int = 20) -> List[Tuple[str, float]]:
+        """
+        Postings most similar to a query vector.
+
+        The memory-mapped matrix is scored in batches of SEARCH_BATCH_ROWS,
+        keeping each batch's k best before a final merge.
+
+        Returns:
+            list: (posting id, similarity) pairs, best first; postings with
+            no positive similarity (e.g. for an all-zero query) are left out
+        """
+        candidate_rows = []
+        candidate_scores = []
+        for start in range(0, len(self.ids), SEARCH_BATCH_ROWS):
+            scores = self.vectors[start:start + SEARCH_BATCH_ROWS] @ query
+            if len(scores) > k:
+                best = np.argpartition(-scores, k - 1)[:k]
+            else:
+                best = np.arange(len(scores))
+            candidate_rows.append(best + start)
+            candidate_scores.append(scores[best])
+        if not candidate_rows:
+            return []
+
+        rows = np.concatenate(candidate_rows)
+        scores = np.concatenate(candidate_scores)
+        order = np.argsort(-scores, kind="stable")[:k]
+        return [(self.ids[rows[i]], float(scores[i])) for i in order if scores[i] > 0]
+
+    def save(self, directory: str, source=None) -> None:
+        """
+        Write the index to a directory; the metadata file is written last.
+
+        Args:
+            directory: Output directory, created if needed
+            source: JSON-serializable description of the postings the index was built from
+        """
+        os.makedirs(directory, exist_ok=True)
+        for name, array in (("vectors.npy", self.vectors), ("components.npy", self.components),
+                            ("idf.npy", self.idf)):
+            temp_path = os.path.join(directory, name + ".tmp")
+            with open(temp_path, "wb") as f:
+                np.save(f, array)
+            os.replace(temp_path, os.path.join(directory, name))
+
+        meta = {
+            "source": source,
+            "terms": sorted(self.vocabulary, key=self.vocabulary.get),
+            "ids": self.ids,
+        }
+        temp_path = os.path.join(directory, "meta.json.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(temp_path, os.path.join(directory, "meta.json"))
+
+    @classmethod
+    def load(cls, directory: str) -> Tuple["JobVectorIndex", object]:
+        """
+        Open a saved index with its vectors memory-mapped.
+
+        Returns:
+            tuple: (index, source recorded by save())
+
+        Raises:
+            FileNotFoundError: If the directory holds no saved index
+        """
+        with open(os.path.join(directory, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        index = cls(
+            {term: column for column, term in enumerate(meta["terms"])},
+            np.load(os.path.join(directory, "idf.npy")),
+            np.load(os.path.join(directory, "components.npy")),
+            np.load(os.path.join(directory, "vectors.npy"), mmap_mode="r"),
+            meta["ids"],
+        )
+        return index, meta["source"]
+
+_vectors: Optional[JobVectorIndex] = None
+_vectors_source = None
+_vectors_lock = threading.Lock()
+
+def _postings_source() -> Optional[List]:
+    try:
+        stat = os.stat(JOB_POSTINGS_PATH)
+    except OSError:
+        return None
+    return [os.path.abspath(JOB_POSTINGS_PATH), stat.st_mtime_ns, stat.st_size]
+
+def get_job_vectors() -> Optional[JobVectorIndex]:
+    """
+    Vector index of the job postings file.
+
+    Reuses the copy saved in JOB_VECTORS_DIR when it was built from the
+    current postings file; otherwise builds the index and saves it.
+
+    Returns:
+        JobVectorIndex: The index, or None if there is no postings file
+    """
+    global _vectors, _vectors_source
+
+    source = _postings_source()
+    if source is None:
+        return None
+
+    with _vectors_lock:
+        if _vectors is not None and _vectors_source == source:
+            return _vectors
+
+        try:
+            vectors, saved_source = JobVectorIndex.load(JOB_VECTORS_DIR)
+        except (OSError, ValueError, KeyError):
+            vectors, saved_source = None, None
+
+        if vectors is None or saved_source != source:
+            job_index = get_job_index()
+            if job_index is None:
+                return None
+            vectors = JobVectorIndex.build(job_index.postings)
+            try:
+                vectors.save(JOB_VECTORS_DIR, source)
+            except OSError:
+                pass  # Still usable from memory; the next process rebuilds it
+
+        _vectors, _vectors_source = vectors, source
+        return _vectors
+
+def main(argv: Sequence[str]) -> int:
+    """
+    Build the posting vectors ahead of time, so the first match does not wait for it.
+
+        python -m utils.job_vectors build
+    """
+    if argv != ["build"]:
+        print(main.__doc__)
+        return 2
+
+    vectors = get_job_vectors()
+    if vectors is None:
+        print(f"No job postings file at {JOB_POSTINGS_PATH}")
+        return 1
+    print(f"Wrote {len(vectors)} posting vectors to {JOB_VECTORS_DIR}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,277 @@
+import os
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Priority classes (lower value is served first)
+PRIORITY_INTERACTIVE = 0  # Chat and other user-facing requests
+PRIORITY_STANDARD = 1     # Analyses the user explicitly asked for
+PRIORITY_BACKGROUND = 2   # Refreshable content such as industry trends
+
+PRIORITY_NAMES = {
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_STANDARD: "standard",
+    PRIORITY_BACKGROUND: "background",
+}
+
+# Maximum number of upstream LLM calls in flight per process
+MAX_CONCURRENCY = int(os.getenv("LLM_GATEWAY_MAX_CONCURRENCY", "16"))
+
+# Threads for pages that start several independent LLM requests at once
+FETCH_WORKERS = 8
+
+class PrioritySemaphore:
+    """
+    Asyncio semaphore that hands free slots to the highest-priority waiter.
+
+    Waiters of equal priority are served first-come, first-served. Must only
+    be used from the event loop that owns it.
+    """
+
+    def __init__(self, value: int):
+        self._value = value
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of callers currently waiting for a slot."""
+        return sum(1 for _, _, fut in self._waiters if not fut.done())
+
+    async def acquire(self, priority: int = PRIORITY_STANDARD) -> None:
+        """Wait for a slot, ahead of any waiter with a lower priority."""
+        if self._value > 0 and not self._waiters:
+            self._value -= 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # A slot handed over just before cancellation must be passed on
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Give the slot to the next waiter, or return it to the pool."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._value += 1
+
+class LLMGateway:
+    """
+    Single entry point for upstream LLM calls with bounded concurrency.
+
+    The gateway runs its own event loop on a daemon thread. Blocking client
+    calls are executed on a worker pool once a slot is granted, so callers on
+    any thread (including Streamlit script threads) share one global limit and
+    one priority queue.
+    """
+
+    def __init__(self, max_concurrency: int = MAX_CONCURRENCY):
+        self.max_concurrency = max_concurrency
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._semaphore: Optional[PrioritySemaphore] = None
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="llm-gateway")
+        self._start_lock = threading.Lock()
+        self._metrics_lock = threading.Lock()
+        self._in_flight = 0
+        self._wait_stats = {
+            name: {"requests": 0, "total_wait": 0.0, "max_wait": 0.0}
+            for name in PRIORITY_NAMES.values()
+        }
+        self._call_site_counts: Dict[str, int] = {}
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the gateway event loop thread on first use."""
+        if self._loop is None:
+            with self._start_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    ready = threading.Event()
+
+                    def run_loop():
+                        asyncio.set_event_loop(loop)
+                        self._semaphore = PrioritySemaphore(self.max_concurrency)
+                        ready.set()
+                        loop.run_forever()
+
+                    self._thread = threading.Thread(target=run_loop, name="llm-gateway-loop", daemon=True)
+                    self._thread.start()
+                    ready.wait()
+                    self._loop = loop
+        return self._loop
+
+    async def _run(self, fn: Callable, args: tuple, kwargs: dict, priority: int, call_site: str) -> Any:
+        """Wait for a slot, then run the blocking call on the worker pool."""
+        enqueued_at = time.perf_counter()
+        await self._semaphore.acquire(priority)
+        self._record_wait(priority, call_site, time.perf_counter() - enqueued_at)
+
+        with self._metrics_lock:
+            self._in_flight += 1
+        try:
+            return await self._loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+        finally:
+            with self._metrics_lock:
+                self._in_flight -= 1
+            self._semaphore.release()
+
+    def _record_wait(self, priority: int, call_site: str, wait: float) -> None:
+        with self._metrics_lock:
+            stats = self._wait_stats[PRIORITY_NAMES.get(priority, "standard")]
+            stats["requests"] += 1
+            stats["total_wait"] += wait
+            stats["max_wait"] = max(stats["max_wait"], wait)
+            self._call_site_counts[call_site] = self._call_site_counts.get(call_site, 0) + 1
+
+    def submit(self, fn: Callable, *args, priority: int = PRIORITY_STANDARD,
+               call_site: str = "default", **kwargs) -> Future:
+        """
+        Schedule a blocking call without waiting for it.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the call's return value
+        """
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(
+            self._run(fn, args, kwargs, priority, call_site), loop
+        )
+
+    def call(self, fn: Callable, *args, priority: int = PRIORITY_STANDARD,
+             call_site: str = "default", **kwargs) -> Any:
+        """
+        Run a blocking call through the gateway and wait for its result.
+
+        Raises:
+            RuntimeError: If called from the gateway's own event loop
+            Exception: Whatever the wrapped call raised
+        """
+        self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("Use 'await gateway.acall(...)' inside the gateway loop")
+        return self.submit(fn, *args, priority=priority, call_site=call_site, **kwargs).result()
+
+    async def acall(self, fn: Callable, *args, priority: int = PRIORITY_STANDARD,
+                    call_site: str = "default", **kwargs) -> Any:
+        """Awaitable variant of call(), usable from any event loop."""
+        loop = self._ensure_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is loop:
+            return await self._run(fn, args, kwargs, priority, call_site)
+        return await asyncio.wrap_future(
+            self.submit(fn, *args, priority=priority, call_site=call_site, **kwargs)
+        )
+
+    @contextmanager
+    def slot(self, priority: int = PRIORITY_STANDARD, call_site: str = "default") -> Iterator[None]:
+        """
+        Hold a concurrency slot while the caller's own thread does the work.
+
+        For calls that outlive a single blocking request, such as reading a
+        streamed response: the slot is held until the block exits.
+
+        Raises:
+            RuntimeError: If used from the gateway's own event loop
+        """
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("Slots cannot be held on the gateway loop")
+
+        enqueued_at = time.perf_counter()
+        acquired = asyncio.run_coroutine_threadsafe(self._semaphore.acquire(priority), loop)
+        try:
+            acquired.result()
+        except BaseException:
+            # Interrupted while waiting: withdraw, or give back a slot granted meanwhile
+            if not acquired.cancel() and not acquired.cancelled() and acquired.exception() is None:
+                loop.call_soon_threadsafe(self._semaphore.release)
+            raise
+        self._record_wait(priority, call_site, time.perf_counter() - enqueued_at)
+
+        with self._metrics_lock:
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._metrics_lock:
+                self._in_flight -= 1
+            loop.call_soon_threadsafe(self._semaphore.release)
+
+    def metrics(self) -> Dict:
+        """
+        Snapshot of gateway load for monitoring and capacity planning.
+
+        Returns:
+            dict: {
+                "max_concurrency": int,
+                "in_flight": int,
+                "queue_depth": int,
+                "wait_seconds": {priority: {"requests", "avg_wait", "max_wait"}},
+                "requests_by_call_site": {call_site: int}
+            }
+        """
+        queue_depth = self._semaphore.queue_depth if self._semaphore is not None else 0
+        with self._metrics_lock:
+            wait_seconds = {
+                name: {
+                    "requests": stats["requests"],
+                    "avg_wait": stats["total_wait"] / stats["requests"] if stats["requests"] else 0.0,
+                    "max_wait": stats["max_wait"],
+                }
+                for name, stats in self._wait_stats.items()
+            }
+            return {
+                "max_concurrency": self.max_concurrency,
+                "in_flight": self._in_flight,
+                "queue_depth": queue_depth,
+                "wait_seconds": wait_seconds,
+                "requests_by_call_site": dict(self._call_site_counts),
+            }
+
+_gateway: Optional[LLMGateway] = None
+_gateway_lock = threading.Lock()
+
+def get_gateway() -> LLMGateway:
+    """Get the process-wide gateway, creating it on first use."""
+    global _gateway
+
+    if _gateway is None:
+        with _gateway_lock:
+            if _gateway is None:
+                _gateway = LLMGateway()
+    return _gateway
+
+_fetch_executor: Optional[ThreadPoolExecutor] = None
+_fetch_executor_lock = threading.Lock()
+
+def get_fetch_executor() -> ThreadPoolExecutor:
+    """
+    Get the process-wide pool pages use to run independent LLM requests in parallel.
+
+    Kept here rather than in a page because Streamlit re-executes page
+    scripts on every rerun. The gateway still bounds upstream concurrency.
+    """
+    global _fetch_executor
+
+    if _fetch_executor is None:
+        with _fetch_executor_lock:
+            if _fetch_executor is None:
+                _fetch_executor = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="page-fetch")
+    return _fetch_executor
@@ -0,0 +1,236 @@
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+
+# Retry and circuit breaker settings shared by all LLM call sites
+RETRY_MAX_ATTEMPTS = int(os.getenv("LLM_RETRY_MAX_ATTEMPTS", "3"))
+RETRY_BASE_DELAY = float(os.getenv("LLM_RETRY_BASE_DELAY", "0.5"))  # Seconds before the first retry
+RETRY_MAX_DELAY = float(os.getenv("LLM_RETRY_MAX_DELAY", "20"))  # Longest single wait, incl. Retry-After
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("LLM_BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RESET_TIMEOUT = float(os.getenv("LLM_BREAKER_RESET_TIMEOUT", "30"))  # Seconds before a probe
+
+# HTTP statuses worth retrying (timeouts, conflicts, rate limits, server errors)
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected because the endpoint's breaker is open."""
+
+def is_retryable_error(error: BaseException) -> bool:
+    """
+    Decide whether an upstream error is transient.
+
+    Connection problems, timeouts, rate limits and 5xx responses are retried;
+    client errors such as bad requests or authentication failures are not.
+    """
+    if isinstance(error, CircuitOpenError):
+        return False
+
+    status = getattr(error, "status_code", None)
+    if status is not None:
+        return status in RETRYABLE_STATUS_CODES
+
+    # openai.APIConnectionError / APITimeoutError carry no status code
+    return type(error).__name__ in {"APIConnectionError", "APITimeoutError"} or isinstance(
+        error, (ConnectionError, TimeoutError)
+    )
+
+def get_retry_after(error: BaseException) -> Optional[float]:
+    """
+    Extract the server-requested delay from an error's response headers.
+
+    Returns:
+        float: Seconds to wait, or None if the server did not say
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000)
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breaker.
+
+    After ``failure_threshold`` consecutive transient failures the breaker
+    opens and calls fail fast. Once ``reset_timeout`` has passed a single
+    probe call is let through; its outcome closes or re-opens the breaker.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+                 reset_timeout: float = BREAKER_RESET_TIMEOUT):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._total_failures = 0
+        self._rejected = 0
+
+    def before_call(self) -> None:
+        """
+        Admit or reject a call.
+
+        Raises:
+            CircuitOpenError: If the breaker is open (or a probe is already running)
+        """
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+
+            if self._state == self.CLOSED:
+                return
+            if self._state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+
+            self._rejected += 1
+            raise CircuitOpenError(f"LLM endpoint '{self.name}' is temporarily unavailable")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            self._total_failures += 1
+            self._probe_in_flight = False
+            if self._state == self.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def snapshot(self) -> Dict:
+        """
+        Current breaker state for monitoring.
+
+        Returns:
+            dict: {"state", "consecutive_failures", "total_failures", "rejected_calls", "retry_in"}
+        """
+        with self._lock:
+            retry_in = 0.0
+            if self._state == self.OPEN:
+                retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+            return {
+                "state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+                "total_failures": self._total_failures,
+                "rejected_calls": self._rejected,
+                "retry_in": retry_in,
+            }
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter that honours Retry-After headers.
+    """
+
+    def __init__(self, max_attempts: int = RETRY_MAX_ATTEMPTS, base_delay: float = RETRY_BASE_DELAY,
+                 max_delay: float = RETRY_MAX_DELAY, sleep: Callable[[float], None] = time.sleep):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._sleep = sleep
+
+    def compute_delay(self, attempt: int, error: BaseException) -> Optional[float]:
+        """
+        Delay before retrying after the given (zero-based) failed attempt.
+
+        Returns:
+            float: Seconds to wait, or None if the server asked for a longer
+            wait than ``max_delay`` and the call should fail now instead
+        """
+        retry_after = get_retry_after(error)
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_delay else None
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def call(self, fn: Callable[[], Any], breaker: Optional[CircuitBreaker] = None) -> Any:
+        """
+        Run ``fn`` with retries, guarded by an optional circuit breaker.
+
+        Raises:
+            CircuitOpenError: If the breaker rejects the call
+            Exception: The last error once retries are exhausted or the
+                error is not retryable
+        """
+        for attempt in range(self.max_attempts):
+            if breaker is not None:
+                breaker.before_call()
+
+            try:
+                result = fn()
+            except Exception as e:
+                transient = is_retryable_error(e)
+                if breaker is not None:
+                    if transient:
+                        breaker.record_failure()
+                    else:
+                        # The endpoint answered; a bad request says nothing about its health
+                        breaker.record_success()
+
+                if not transient or attempt == self.max_attempts - 1:
+                    raise
+                delay = self.compute_delay(attempt, e)
+                if delay is None:
+                    raise
+                self._sleep(delay)
+                continue
+
+            if breaker is not None:
+                breaker.record_success()
+            return result
+
+# Policy shared by every LLM call site
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+def get_circuit_breaker(endpoint: str) -> CircuitBreaker:
+    """Get the breaker for an endpoint (call site), creating it on first use."""
+    with _breakers_lock:
+        breaker = _breakers.get(endpoint)
+        if breaker is None:
+            breaker = _breakers[endpoint] = CircuitBreaker(endpoint)
+        return breaker
+
+def get_circuit_breaker_states() -> Dict[str, Dict]:
+    """
+    Snapshot every breaker for monitoring.
+
+    Returns:
+        dict: {endpoint: CircuitBreaker.snapshot()}
+    """
+    with _breakers_lock:
+        breakers = list(_breakers.items())
+    return {name: breaker.snapshot() for name, breaker in breakers}
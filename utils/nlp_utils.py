@@ -1,20 +1,224 @@
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-from collections import Counter
+from collections import Counter, OrderedDict
+from functools import cached_property
+import hashlib
+import re
 import string
 import os
+import threading
+from utils.nltk_resources import word_tokenize, get_stopwords
 
-# Download required NLTK data if not already present
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords', quiet=True)
+# Word pattern approximating NLTK's Treebank tokenizer for keyword purposes:
+# clitics are split off ("don't" -> "do", "n't"; "team's" -> "team", "'s"),
+# hyphenated, dotted and slashed terms and trailing '+' stay whole
+# ("problem-solving", "node.js", "ci/cd", "c++"), and every other punctuation
+# character is its own token.
+_TOKEN_PATTERN = re.compile(r"""
+    \w+(?=n't\b)                     # "do" in "don't"
+  | n't\b                            # negation clitic
+  | '(?:s|re|ve|ll|d|m)\b            # other clitics
+  | \d{1,3}(?:,\d{3})+(?:\.\d+)?\+*  # numbers with thousands separators
+  | \w+\+*(?:[-./]\w+\+*)*           # words, incl. "c++" and hyphenated/dotted/slashed terms
+  | [^\w\s]                          # any other single punctuation character
+""", re.VERBOSE)
 
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt', quiet=True)
+def regex_tokenize(text):
+    """
+    Tokenize text with a precompiled regular expression.
+    
+    Much faster than NLTK's Punkt/Treebank pipeline and produces the same
+    tokens once stopwords, punctuation and short tokens are filtered out.
+    
+    Args:
+        text (str): The text to tokenize
+    
+    Returns:
+        list: List of tokens
+    """
+    return _TOKEN_PATTERN.findall(text)
+
+# Available tokenizer backends
+TOKENIZERS = {
+    "regex": regex_tokenize,
+    "nltk": word_tokenize,
+}
+
+# Active backend, overridable with the NLP_TOKENIZER environment variable
+_tokenizer_backend = os.getenv("NLP_TOKENIZER", "regex")
+
+def set_tokenizer(name):
+    """
+    Select the tokenizer backend used by this module.
+    
+    Args:
+        name (str): A key of TOKENIZERS ('regex' or 'nltk')
+    """
+    global _tokenizer_backend
+    
+    if name not in TOKENIZERS:
+        raise ValueError(f"Unknown tokenizer '{name}'. Choose from: {', '.join(TOKENIZERS)}")
+    _tokenizer_backend = name
+
+def tokenize(text):
+    """
+    Tokenize text with the active backend.
+    
+    Args:
+        text (str): The text to tokenize
+    
+    Returns:
+        list: List of tokens
+    """
+    return TOKENIZERS[_tokenizer_backend](text)
+
+# Word lists for the simple rule-based sentiment analysis
+POSITIVE_WORDS = frozenset({
+    'good', 'great', 'excellent', 'outstanding', 'exceptional', 'amazing', 'fantastic',
+    'wonderful', 'positive', 'skilled', 'proficient', 'experienced', 'expert', 'accomplished',
+    'successful', 'impressive', 'stellar', 'excellent', 'strong', 'innovative', 'creative',
+    'talented', 'dedicated', 'committed', 'professional', 'enthusiastic', 'passionate',
+    'achieve', 'achievement', 'success', 'improve', 'improvement', 'growth', 'develop'
+})
+
+NEGATIVE_WORDS = frozenset({
+    'bad', 'poor', 'terrible', 'horrible', 'awful', 'inadequate', 'insufficient',
+    'limited', 'weak', 'lacking', 'mediocre', 'subpar', 'unsuccessful', 'failure',
+    'failed', 'struggle', 'struggled', 'problem', 'issue', 'concern', 'difficulty',
+    'difficult', 'challenging', 'unfortunately', 'disappointment', 'disappointing'
+})
+
+# Common action verbs used in resumes
+ACTION_VERBS = frozenset({
+    'achieved', 'implemented', 'developed', 'managed', 'led', 'created', 'designed',
+    'coordinated', 'organized', 'supervised', 'trained', 'researched', 'analyzed',
+    'evaluated', 'improved', 'increased', 'decreased', 'reduced', 'negotiated',
+    'established', 'launched', 'delivered', 'generated', 'produced', 'streamlined',
+    'optimized', 'maintained', 'directed', 'oversaw', 'guided', 'facilitated',
+    'prepared', 'presented', 'authored', 'initiated', 'pioneered', 'spearheaded'
+})
+
+# Number of analyzed texts kept in memory for reuse across reruns
+ANALYSIS_CACHE_SIZE = 64
+
+class TextAnalysis:
+    """
+    Word-level analysis of one text, tokenized exactly once.
+    
+    Keywords, action verbs, sentiment and section statistics are computed
+    lazily from the shared token list. Use TextAnalysis.for_text() to reuse
+    the analysis of a text that was already seen.
+    """
+    
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()
+    
+    def __init__(self, text):
+        """
+        Args:
+            text (str): The text to analyze
+        """
+        self.text = text or ""
+        self.tokens = tokenize(self.text.lower())
+    
+    @classmethod
+    def for_text(cls, text):
+        """
+        Get the (memoized) analysis of a text.
+        
+        Args:
+            text (str): The text to analyze
+        
+        Returns:
+            TextAnalysis: Analysis shared by every caller passing the same text
+        """
+        text = text or ""
+        key = (_tokenizer_backend, hashlib.sha256(text.encode("utf-8")).hexdigest())
+        
+        with cls._cache_lock:
+            analysis = cls._cache.get(key)
+            if analysis is not None:
+                cls._cache.move_to_end(key)
+                return analysis
+        
+        analysis = cls(text)
+        
+        with cls._cache_lock:
+            cls._cache[key] = analysis
+            while len(cls._cache) > ANALYSIS_CACHE_SIZE:
+                cls._cache.popitem(last=False)
+        return analysis
+    
+    @cached_property
+    def content_tokens(self):
+        """Tokens left after removing stopwords, punctuation and short words."""
+        stop_words = get_stopwords()
+        return [token for token in self.tokens if token not in stop_words and token not in string.punctuation and len(token) > 2]
+    
+    @cached_property
+    def keyword_counts(self):
+        """Counter of content token frequencies."""
+        return Counter(self.content_tokens)
+    
+    def keywords(self, top_n=10):
+        """
+        Most frequent keywords.
+        
+        Args:
+            top_n (int): Number of top keywords to return
+        
+        Returns:
+            list: List of (keyword, frequency) tuples
+        """
+        return self.keyword_counts.most_common(top_n)
+    
+    @cached_property
+    def action_verbs(self):
+        """Unique action verbs, in order of first appearance."""
+        return list(dict.fromkeys(token for token in self.tokens if token in ACTION_VERBS))
+    
+    @cached_property
+    def sentiment(self):
+        """Rule-based sentiment results (see analyze_text_sentiment)."""
+        # Count positive and negative words
+        positive_count = sum(1 for token in self.tokens if token in POSITIVE_WORDS)
+        negative_count = sum(1 for token in self.tokens if token in NEGATIVE_WORDS)
+        
+        # Calculate sentiment score (-1 to 1)
+        total = positive_count + negative_count
+        sentiment_score = 0
+        if total > 0:
+            sentiment_score = (positive_count - negative_count) / total
+        
+        # Determine overall sentiment
+        if sentiment_score > 0.1:
+            sentiment = "positive"
+        elif sentiment_score < -0.1:
+            sentiment = "negative"
+        else:
+            sentiment = "neutral"
+        
+        return {
+            "score": sentiment_score,
+            "sentiment": sentiment,
+            "positive_words": positive_count,
+            "negative_words": negative_count
+        }
+    
+    @cached_property
+    def section_stats(self):
+        """
+        Size of each resume section found in the text.
+        
+        Returns:
+            dict: {section: {"words": int, "characters": int}} for non-empty sections
+        """
+        # Imported here so plain text analysis does not load the document parsers
+        from utils.resume_parsar import extract_sections
+        
+        return {
+            section: {"words": len(content.split()), "characters": len(content)}
+            for section, content in extract_sections(self.text).items()
+            if content.strip()
+        }
 
 def extract_keywords(text, top_n=10):
     """
@@ -30,18 +234,7 @@ def extract_keywords(text, top_n=10):
     if not text:
         return []
     
-    # Tokenize text
-    tokens = word_tokenize(text.lower())
-    
-    # Remove stopwords and punctuation
-    stop_words = set(stopwords.words('english'))
-    tokens = [token for token in tokens if token not in stop_words and token not in string.punctuation and len(token) > 2]
-    
-    # Count frequencies
-    word_freq = Counter(tokens)
-    
-    # Return top N keywords
-    return word_freq.most_common(top_n)
+    return TextAnalysis.for_text(text).keywords(top_n)
 
 def analyze_text_sentiment(text):
     """
@@ -55,49 +248,7 @@ def analyze_text_sentiment(text):
     """
     # This is a very simplistic approach - in a real app, we'd use NLTK's sentiment analyzers
     # or a pre-trained model, but this gives us a basic example
-    
-    positive_words = {
-        'good', 'great', 'excellent', 'outstanding', 'exceptional', 'amazing', 'fantastic',
-        'wonderful', 'positive', 'skilled', 'proficient', 'experienced', 'expert', 'accomplished',
-        'successful', 'impressive', 'stellar', 'excellent', 'strong', 'innovative', 'creative',
-        'talented', 'dedicated', 'committed', 'professional', 'enthusiastic', 'passionate',
-        'achieve', 'achievement', 'success', 'improve', 'improvement', 'growth', 'develop'
-    }
-    
-    negative_words = {
-        'bad', 'poor', 'terrible', 'horrible', 'awful', 'inadequate', 'insufficient',
-        'limited', 'weak', 'lacking', 'mediocre', 'subpar', 'unsuccessful', 'failure',
-        'failed', 'struggle', 'struggled', 'problem', 'issue', 'concern', 'difficulty',
-        'difficult', 'challenging', 'unfortunately', 'disappointment', 'disappointing'
-    }
-    
-    # Tokenize and convert to lowercase
-    tokens = word_tokenize(text.lower())
-    
-    # Count positive and negative words
-    positive_count = sum(1 for token in tokens if token in positive_words)
-    negative_count = sum(1 for token in tokens if token in negative_words)
-    
-    # Calculate sentiment score (-1 to 1)
-    total = positive_count + negative_count
-    sentiment_score = 0
-    if total > 0:
-        sentiment_score = (positive_count - negative_count) / total
-    
-    # Determine overall sentiment
-    if sentiment_score > 0.1:
-        sentiment = "positive"
-    elif sentiment_score < -0.1:
-        sentiment = "negative"
-    else:
-        sentiment = "neutral"
-    
-    return {
-        "score": sentiment_score,
-        "sentiment": sentiment,
-        "positive_words": positive_count,
-        "negative_words": negative_count
-    }
+    return dict(TextAnalysis.for_text(text).sentiment)
 
 def compare_job_descriptions(description1, description2):
     """
@@ -110,18 +261,9 @@ def compare_job_descriptions(description1, description2):
     Returns:
         dict: Comparison results
     """
-    # Tokenize and remove stopwords
-    stop_words = set(stopwords.words('english'))
-    
-    tokens1 = word_tokenize(description1.lower())
-    tokens1 = [token for token in tokens1 if token not in stop_words and token not in string.punctuation and len(token) > 2]
-    
-    tokens2 = word_tokenize(description2.lower())
-    tokens2 = [token for token in tokens2 if token not in stop_words and token not in string.punctuation and len(token) > 2]
-    
-    # Find unique terms in each description
-    set1 = set(tokens1)
-    set2 = set(tokens2)
+    # Find unique terms in each description (stopwords and punctuation removed)
+    set1 = set(TextAnalysis.for_text(description1).content_tokens)
+    set2 = set(TextAnalysis.for_text(description2).content_tokens)
     
     common = set1.intersection(set2)
     unique1 = set1 - set2
@@ -147,21 +289,4 @@ def extract_action_verbs(text):
     Returns:
         list: List of action verbs found
     """
-    # Common action verbs used in resumes
-    action_verbs = {
-        'achieved', 'implemented', 'developed', 'managed', 'led', 'created', 'designed',
-        'coordinated', 'organized', 'supervised', 'trained', 'researched', 'analyzed',
-        'evaluated', 'improved', 'increased', 'decreased', 'reduced', 'negotiated',
-        'established', 'launched', 'delivered', 'generated', 'produced', 'streamlined',
-        'optimized', 'maintained', 'directed', 'oversaw', 'guided', 'facilitated',
-        'prepared', 'presented', 'authored', 'initiated', 'pioneered', 'spearheaded'
-    }
-    
-    # Tokenize and convert to lowercase
-    tokens = word_tokenize(text.lower())
-    
-    # Find action verbs
-    found_verbs = [token for token in tokens if token in action_verbs]
-    
-    # Return unique verbs
-    return list(set(found_verbs))
+    return list(TextAnalysis.for_text(text).action_verbs)
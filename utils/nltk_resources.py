@@ -0,0 +1,149 @@
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, FrozenSet, List
+
+# Writable directory NLTK packages are downloaded into
+NLTK_DATA_DIR = os.getenv("NLTK_DATA_DIR", os.path.join(os.path.expanduser("~"), "nltk_data"))
+
+# Read-only directory with packages shipped alongside the app (checked first)
+NLTK_VENDOR_DIR = os.getenv(
+    "NLTK_VENDOR_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "nltk_data")
+)
+
+# Set NLTK_OFFLINE=1 to never attempt downloads (e.g. air-gapped deployments)
+NLTK_OFFLINE = os.getenv("NLTK_OFFLINE", "").lower() in ("1", "true", "yes")
+DOWNLOAD_TIMEOUT = float(os.getenv("NLTK_DOWNLOAD_TIMEOUT", "30"))  # Seconds per package
+
+# Where each package lives inside an nltk_data directory
+RESOURCE_PATHS = {
+    "punkt": "tokenizers/punkt",
+    "punkt_tab": "tokenizers/punkt_tab",
+    "stopwords": "corpora/stopwords",
+    "wordnet": "corpora/wordnet",
+    "averaged_perceptron_tagger": "taggers/averaged_perceptron_tagger",
+}
+
+class NLTKResourceError(LookupError):
+    """Raised when an NLTK package is missing and cannot be downloaded."""
+
+_lock = threading.Lock()
+_paths_configured = False
+_resolution_times: Dict[str, float] = {}  # Package -> seconds spent resolving it
+_failures: Dict[str, str] = {}  # Package -> reason, so a missing package fails fast afterwards
+
+def _configure_paths() -> None:
+    """Put the vendored and download directories at the front of NLTK's search path."""
+    global _paths_configured
+
+    if _paths_configured:
+        return
+
+    import nltk
+
+    for directory in (NLTK_DATA_DIR, NLTK_VENDOR_DIR):
+        if directory not in nltk.data.path:
+            nltk.data.path.insert(0, directory)
+    _paths_configured = True
+
+def _download(package: str) -> bool:
+    """Download a package, giving up after DOWNLOAD_TIMEOUT seconds."""
+    import nltk
+
+    result = {"ok": False}
+
+    def run():
+        try:
+            os.makedirs(NLTK_DATA_DIR, exist_ok=True)
+            result["ok"] = nltk.download(package, download_dir=NLTK_DATA_DIR, quiet=True, raise_on_error=True)
+        except Exception as e:
+            result["error"] = str(e)
+
+    # nltk.download has no timeout of its own and can hang without network
+    worker = threading.Thread(target=run, name=f"nltk-download-{package}", daemon=True)
+    worker.start()
+    worker.join(DOWNLOAD_TIMEOUT)
+    return bool(result["ok"]) and not worker.is_alive()
+
+def ensure_resource(package: str) -> None:
+    """
+    Make sure an NLTK package is available, resolving it at most once per process.
+
+    The vendored directory and NLTK_DATA_DIR are searched first; the package
+    is downloaded only if it is missing and NLTK_OFFLINE is not set.
+
+    Args:
+        package: Package name, e.g. 'punkt' or 'stopwords'
+
+    Raises:
+        NLTKResourceError: If the package is unavailable
+    """
+    if package in _resolution_times:
+        return
+
+    with _lock:
+        if package in _resolution_times:
+            return
+        if package in _failures:
+            raise NLTKResourceError(_failures[package])
+
+        import nltk
+
+        start = time.perf_counter()
+        _configure_paths()
+        resource_path = RESOURCE_PATHS.get(package, package)
+
+        try:
+            nltk.data.find(resource_path)
+        except LookupError:
+            if NLTK_OFFLINE or not _download(package):
+                reason = (
+                    f"NLTK package '{package}' is not installed"
+                    + (" and downloads are disabled" if NLTK_OFFLINE else " and could not be downloaded")
+                    + f". Install it into {NLTK_VENDOR_DIR} or {NLTK_DATA_DIR}."
+                )
+                _failures[package] = reason
+                raise NLTKResourceError(reason)
+
+        _resolution_times[package] = time.perf_counter() - start
+
+def get_resolution_times() -> Dict[str, float]:
+    """
+    Seconds spent resolving each package so far in this process.
+
+    Returns:
+        dict: {package: seconds}
+    """
+    return dict(_resolution_times)
+
+@lru_cache(maxsize=1)
+def _punkt_package() -> str:
+    """Name of the Punkt package the installed NLTK tokenizes with."""
+    import nltk.tokenize
+
+    # NLTK 3.8.2+ loads the pickle-free 'punkt_tab' models instead of 'punkt'
+    return "punkt_tab" if hasattr(nltk.tokenize, "_get_punkt_tokenizer") else "punkt"
+
+def word_tokenize(text: str) -> List[str]:
+    """NLTK word_tokenize, resolving the Punkt models on first use."""
+    ensure_resource(_punkt_package())
+
+    from nltk.tokenize import word_tokenize as nltk_word_tokenize
+
+    return nltk_word_tokenize(text)
+
+@lru_cache(maxsize=None)
+def get_stopwords(language: str = "english") -> FrozenSet[str]:
+    """
+    Stopword set for a language, loaded once per process.
+
+    Raises:
+        NLTKResourceError: If the stopwords corpus is unavailable
+    """
+    ensure_resource("stopwords")
+
+    from nltk.corpus import stopwords
+
+    return frozenset(stopwords.words(language))
@@ -1,20 +1,92 @@
 import os
 import json
+import copy
+import hashlib
+import sqlite3
+import threading
+import httpx
 from openai import OpenAI
 from dotenv import load_dotenv
-from typing import Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+from utils.disk_cache import CACHE_DIR, DiskCache
+from utils.llm_gateway import get_gateway, PRIORITY_INTERACTIVE, PRIORITY_STANDARD, PRIORITY_BACKGROUND
+from utils.llm_resilience import DEFAULT_RETRY_POLICY, RETRY_MAX_ATTEMPTS, get_circuit_breaker
 
 # Load environment variables from .env file
 load_dotenv()
 
 # Configuration
 MODEL = "gpt-4o"  # Default to GPT-4o model
-MAX_RETRIES = 3  # Number of retry attempts for API calls
+MAX_RETRIES = RETRY_MAX_ATTEMPTS  # Attempts per API call, with backoff (see utils/llm_resilience.py)
 TIMEOUT = 30  # Timeout in seconds
 
+# Connection pool settings for the shared client (sized for concurrent Streamlit sessions)
+MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "100"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "20"))
+KEEPALIVE_EXPIRY = float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", "60"))  # Seconds an idle socket is kept
+
+# Response cache settings for structured (JSON) completions
+RESPONSE_CACHE_PATH = os.getenv("OPENAI_CACHE_PATH", os.path.join(CACHE_DIR, "openai_responses.sqlite3"))
+RESPONSE_CACHE_MAX_BYTES = int(os.getenv("OPENAI_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# Time-to-live in seconds for each cached call site (call sites not listed are not cached)
+CACHE_TTLS = {
+    "career_paths": 24 * 3600,
+    "interview_prep": 7 * 24 * 3600,
+    "resume_analysis": 7 * 24 * 3600,
+    "role_analysis": 7 * 24 * 3600,
+    "industry_trends": 24 * 3600,
+    "skill_gap": 3 * 24 * 3600,
+    "assessment": 24 * 3600,
+    "job_search": 3600,
+    "job_search_enrich": 7 * 24 * 3600,
+}
+
+# Process-wide client shared by every call site
+_client: Optional[OpenAI] = None
+_client_lock = threading.Lock()
+
 def get_openai_client() -> OpenAI:
     """
-    Get the OpenAI client instance with proper API key configuration.
+    Get the shared OpenAI client, creating it on first use.
+    
+    All call sites reuse the same client so HTTP connections (and their TLS
+    sessions) are pooled per process instead of being rebuilt per request.
+    
+    Returns:
+        OpenAI: Authenticated OpenAI client instance
+        
+    Raises:
+        ValueError: If API key is not properly configured
+    """
+    global _client
+    
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = create_openai_client()
+    return _client
+
+def set_openai_client(client: Optional[OpenAI]) -> None:
+    """
+    Replace the shared client, e.g. with a local stand-in during tests.
+    
+    Args:
+        client: Object exposing ``chat.completions.create``, or None to
+            drop the current client so the next call builds a fresh one
+    """
+    global _client
+    
+    with _client_lock:
+        previous, _client = _client, client
+    
+    # Release the pooled sockets of a client we created ourselves
+    if previous is not None and previous is not client and isinstance(previous, OpenAI):
+        previous.close()
+
+def create_openai_client() -> OpenAI:
+    """
+    Build a new OpenAI client with a pooled, keep-alive HTTP transport.
     
     Returns:
         OpenAI: Authenticated OpenAI client instance
@@ -34,10 +106,220 @@ def get_openai_client() -> OpenAI:
             "3. Or replace 'your-api-key-here' with your actual key (not recommended for production)"
         )
     
+    http_client = httpx.Client(
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY
+        ),
+        timeout=TIMEOUT
+    )
+    
     return OpenAI(
         api_key=api_key,
-        timeout=TIMEOUT
+        timeout=TIMEOUT,
+        max_retries=0,  # Retries and backoff are handled by llm_resilience
+        http_client=http_client
+    )
+
+_response_cache: Optional[DiskCache] = None
+_response_cache_lock = threading.Lock()
+
+class SingleFlight:
+    """
+    Collapse concurrent identical requests into a single upstream call.
+    
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for it and receive their own copy of its result (or
+    the same exception).
+    """
+    
+    class _Call:
+        def __init__(self):
+            self.done = threading.Event()
+            self.result: Any = None
+            self.error: Optional[BaseException] = None
+            self.followers = 0
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, "SingleFlight._Call"] = {}
+        self.coalesced = 0  # Requests served by another caller's upstream call
+    
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        Run ``fn`` once per key among concurrent callers.
+        
+        Args:
+            key: Identity of the request
+            fn: Zero-argument function performing the request
+            
+        Returns:
+            Any: The function's result (deep-copied for waiting callers)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = SingleFlight._Call()
+            else:
+                call.followers += 1
+                self.coalesced += 1
+        
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+        
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        
+        # Followers copy the result concurrently, so the leader keeps its own copy too
+        return copy.deepcopy(call.result) if call.followers else call.result
+
+# In-flight JSON completions keyed by their cache key
+_inflight_requests = SingleFlight()
+
+def get_response_cache() -> Optional[DiskCache]:
+    """
+    Get the shared on-disk response cache, opening it on first use.
+    
+    Returns:
+        DiskCache: The cache, or None if it could not be opened
+    """
+    global _response_cache
+    
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                try:
+                    _response_cache = DiskCache(RESPONSE_CACHE_PATH, RESPONSE_CACHE_MAX_BYTES)
+                except (OSError, sqlite3.Error) as e:
+                    print(f"Response cache disabled: {str(e)}")
+                    return None
+    return _response_cache
+
+def make_cache_key(model: str, messages: List[Dict], temperature: float,
+                   response_format: Optional[Dict] = None) -> str:
+    """
+    Build a content-addressed cache key for a chat completion request.
+    
+    Returns:
+        str: SHA-256 hex digest of the canonical request parameters
+    """
+    payload = json.dumps(
+        {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "response_format": response_format
+        },
+        sort_keys=True,
+        separators=(",", ":")
     )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def _create_completion(call_site: str, priority: int, **request) -> Any:
+    """
+    Send a chat completion request through the gateway under the shared
+    retry policy and the call site's circuit breaker.
+    
+    Raises:
+        CircuitOpenError: If the call site's breaker is open
+        Exception: The last API error once retries are exhausted
+    """
+    client = get_openai_client()
+    return DEFAULT_RETRY_POLICY.call(
+        lambda: get_gateway().call(
+            client.chat.completions.create,
+            priority=priority,
+            call_site=call_site,
+            **request
+        ),
+        breaker=get_circuit_breaker(call_site)
+    )
+
+def request_json_completion(messages: List[Dict], temperature: float = 0.7,
+                            call_site: str = "default", priority: int = PRIORITY_STANDARD,
+                            model: str = MODEL) -> Dict:
+    """
+    Request a JSON-mode chat completion through the LLM gateway, served from
+    the response cache when possible.
+    
+    Transient failures are retried with backoff. If the call site's circuit
+    breaker is open or retries are exhausted, an expired cached response is
+    returned when one exists.
+    
+    Args:
+        messages: Chat messages to send
+        temperature: Sampling temperature
+        call_site: Name of the calling feature; selects the cache TTL from
+            CACHE_TTLS and labels gateway metrics
+        priority: Gateway priority class
+        model: Model name
+        
+    Returns:
+        dict: Parsed JSON response
+        
+    Raises:
+        Exception: Any API, circuit breaker or JSON decoding error, for the
+            caller to fall back to degraded content
+    """
+    response_format = {"type": "json_object"}
+    cache_ttl = CACHE_TTLS.get(call_site)
+    cache = get_response_cache() if cache_ttl is not None else None
+    key = make_cache_key(model, messages, temperature, response_format)
+    
+    if cache is not None:
+        try:
+            cached = cache.get(key)
+            if cached is not None:
+                return json.loads(cached)
+        except (sqlite3.Error, ValueError):
+            pass  # Treat an unreadable entry as a miss
+    
+    def fetch() -> Dict:
+        response = _create_completion(
+            call_site,
+            priority,
+            model=model,
+            messages=messages,
+            response_format=response_format,
+            temperature=temperature
+        )
+        content = response.choices[0].message.content
+        result = json.loads(content)
+        
+        if cache is not None:
+            try:
+                cache.set(key, content, ttl=cache_ttl)
+            except sqlite3.Error:
+                pass  # Caching is best-effort
+        
+        return result
+    
+    try:
+        # Identical requests already in flight share one upstream call
+        return _inflight_requests.do(key, fetch)
+    except Exception:
+        # Fall back to an expired cached answer rather than failing outright
+        if cache is not None:
+            try:
+                stale = cache.get(key, allow_stale=True)
+                if stale is not None:
+                    return json.loads(stale)
+            except (sqlite3.Error, ValueError):
+                pass
+        raise
+
 def get_career_path_recommendations(profile: Dict) -> Dict:
     """
     Generate career path recommendations based on user profile
@@ -57,8 +339,6 @@ def get_career_path_recommendations(profile: Dict) -> Dict:
             ]
         }
     """
-    client = get_openai_client()
-    
     prompt = f"""Analyze this career profile and suggest suitable career paths:
     {json.dumps(profile, indent=2)}
     
@@ -72,8 +352,7 @@ def get_career_path_recommendations(profile: Dict) -> Dict:
     """
     
     try:
-        response = client.chat.completions.create(
-            model=MODEL,
+        return request_json_completion(
             messages=[
                 {
                     "role": "system", 
@@ -81,10 +360,9 @@ def get_career_path_recommendations(profile: Dict) -> Dict:
                 },
                 {"role": "user", "content": prompt}
             ],
-            response_format={"type": "json_object"},
-            temperature=0.7
+            temperature=0.7,
+            call_site="career_paths"
         )
-        return json.loads(response.choices[0].message.content)
     except Exception as e:
         return {
             "error": f"Failed to generate recommendations: {str(e)}",
@@ -101,8 +379,6 @@ def get_interview_prep(job_title: str, experience_level: str) -> Dict:
     Returns:
         dict: Structured preparation content or error message
     """
-    client = get_openai_client()
-    
     prompt = f"""Generate interview preparation for a {experience_level} level {job_title} position.
     Include these sections in JSON format:
     1. general_tips: List of general interview tips
@@ -121,8 +397,7 @@ def get_interview_prep(job_title: str, experience_level: str) -> Dict:
     """
     
     try:
-        response = client.chat.completions.create(
-            model=MODEL,
+        return request_json_completion(
             messages=[
                 {
                     "role": "system",
@@ -130,10 +405,9 @@ def get_interview_prep(job_title: str, experience_level: str) -> Dict:
                 },
                 {"role": "user", "content": prompt}
             ],
-            response_format={"type": "json_object"},
-            temperature=0.7
+            temperature=0.7,
+            call_site="interview_prep"
         )
-        return json.loads(response.choices[0].message.content)
     except Exception as e:
         return {
             "error": f"Failed to generate content: {str(e)}",
@@ -143,19 +417,21 @@ def get_interview_prep(job_title: str, experience_level: str) -> Dict:
             "behavioral_questions": [],
             "questions_to_ask_interviewer": []
         }
-def get_ai_response(user_prompt: str, context: Optional[Dict] = None) -> str:
+def get_ai_response(user_prompt: str, context: Optional[Dict] = None,
+                    stream: bool = False) -> Union[str, Iterator[str]]:
     """
     Get a response from the OpenAI API with robust error handling.
     
     Args:
         user_prompt: The user's question or prompt
         context: Optional context information
+        stream: If True, return a generator yielding text chunks as the
+            model produces them instead of waiting for the full answer
         
     Returns:
         str: The AI-generated response or error message
+        Iterator[str]: Response chunks, when ``stream`` is True
     """
-    client = get_openai_client()
-    
     # Build system message with context
     system_message = """You are an AI Career Advisor providing professional career guidance.
     Be supportive, informative, and provide specific, actionable advice."""
@@ -178,20 +454,57 @@ def get_ai_response(user_prompt: str, context: Optional[Dict] = None) -> str:
     
     messages.append({"role": "user", "content": user_prompt})
     
-    for attempt in range(MAX_RETRIES):
+    if stream:
+        return _stream_ai_response(messages)
+    
+    try:
+        response = _create_completion(
+            "chat",
+            PRIORITY_INTERACTIVE,
+            model=MODEL,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=1024
+        )
+        return response.choices[0].message.content
+    except Exception as e:
+        return f"I encountered an error: {str(e)}. Please try again later."
+
+def _stream_ai_response(messages: List[Dict]) -> Iterator[str]:
+    """
+    Yield response text chunks from a streaming chat completion.
+    
+    The stream holds a gateway slot until it is exhausted or closed, so
+    streaming chats count against the concurrency limit while they are
+    read. Opening the stream follows the shared retry policy; once chunks
+    have been yielded a failure is reported inline instead of restarting.
+    """
+    with get_gateway().slot(PRIORITY_INTERACTIVE, call_site="chat"):
         try:
-            response = client.chat.completions.create(
-                model=MODEL,
-                messages=messages,
-                temperature=0.7,
-                max_tokens=1024
+            response_stream = DEFAULT_RETRY_POLICY.call(
+                lambda: get_openai_client().chat.completions.create(
+                    model=MODEL,
+                    messages=messages,
+                    temperature=0.7,
+                    max_tokens=1024,
+                    stream=True
+                ),
+                breaker=get_circuit_breaker("chat")
             )
-            return response.choices[0].message.content
-            
         except Exception as e:
-            if attempt == MAX_RETRIES - 1:  # Last attempt failed
-                return f"I encountered an error: {str(e)}. Please try again later."
-            continue
+            yield f"I encountered an error: {str(e)}. Please try again later."
+            return
+        
+        try:
+            for chunk in response_stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            yield f"\n\nI encountered an error: {str(e)}. Please try again later."
+        finally:
+            close = getattr(response_stream, "close", None)
+            if close is not None:
+                close()
 
 def analyze_resume(resume_text: str) -> Dict:
     """
@@ -203,11 +516,15 @@ def analyze_resume(resume_text: str) -> Dict:
     Returns:
         dict: Analysis results or error information
     """
-    client = get_openai_client()
+    # Imported here so the client module does not load the document parsers
+    from utils.resume_prompt import build_resume_prompt_text
+    
+    # Section-aware compression to the prompt token budget, instead of a blind character cut
+    resume_content = build_resume_prompt_text(resume_text)
     
     prompt = f"""
     Analyze this resume and provide structured JSON feedback:
-    {resume_text[:15000]}  # Truncate to avoid token limits
+    {resume_content}
     
     Include:
     - strengths
@@ -219,17 +536,14 @@ def analyze_resume(resume_text: str) -> Dict:
     """
     
     try:
-        response = client.chat.completions.create(
-            model=MODEL,
+        result = request_json_completion(
             messages=[
                 {"role": "system", "content": "You are an expert resume analyst."},
                 {"role": "user", "content": prompt}
             ],
-            response_format={"type": "json_object"},
-            temperature=0.5
+            temperature=0.5,
+            call_site="resume_analysis"
         )
-        
-        result = json.loads(response.choices[0].message.content)
         return result
         
     except Exception as e:
@@ -0,0 +1,146 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from typing import Callable, Dict, Optional
+
+from utils.disk_cache import CACHE_DIR, DiskCache
+from utils.resume_parsar import (
+    extract_experience_duration,
+    extract_resume_text,
+    extract_sections,
+    extract_skills,
+)
+
+# Parsed resumes keyed by the SHA-256 of the uploaded bytes
+RESUME_CACHE_PATH = os.getenv("RESUME_CACHE_PATH", os.path.join(CACHE_DIR, "resumes.sqlite3"))
+RESUME_CACHE_MAX_BYTES = int(os.getenv("RESUME_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+# Bump when extraction or parsing changes, so older cached results are not served
+PARSER_VERSION = 1
+
+_resume_cache = None
+_resume_cache_lock = threading.Lock()
+
+def get_resume_cache() -> Optional[DiskCache]:
+    """
+    Get the on-disk parsed resume cache, opening it on first use.
+
+    Returns:
+        DiskCache: The cache, or None if it could not be opened
+    """
+    global _resume_cache
+
+    if _resume_cache is None:
+        with _resume_cache_lock:
+            if _resume_cache is None:
+                try:
+                    _resume_cache = DiskCache(RESUME_CACHE_PATH, RESUME_CACHE_MAX_BYTES)
+                except (OSError, sqlite3.Error) as e:
+                    print(f"Resume cache disabled: {str(e)}")
+                    return None
+    return _resume_cache
+
+def hash_upload(uploaded_file) -> str:
+    """
+    SHA-256 of an upload's bytes, read from its buffer without copying.
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    if hasattr(uploaded_file, "getbuffer"):
+        with uploaded_file.getbuffer() as view:
+            digest.update(view)
+    else:
+        uploaded_file.seek(0)
+        for chunk in iter(lambda: uploaded_file.read(1024 * 1024), b""):
+            digest.update(chunk)
+        uploaded_file.seek(0)
+    return digest.hexdigest()
+
+def _cache_key(content_hash: str, file_ext: str) -> str:
+    # The same bytes parse differently depending on the format they were uploaded as
+    return f"resume:v{PARSER_VERSION}:{file_ext}:{content_hash}"
+
+def _store(parsed: Dict) -> None:
+    cache = get_resume_cache()
+    if cache is None:
+        return
+    try:
+        cache.set(parsed["cache_key"], json.dumps(parsed))
+    except sqlite3.Error as e:
+        print(f"Resume cache write failed: {str(e)}")
+
+def load_resume(uploaded_file, progress_callback: Optional[Callable[[int, int], None]] = None) -> Optional[Dict]:
+    """
+    Parse an uploaded resume, or return the cached result for identical bytes.
+
+    Args:
+        uploaded_file: File-like object containing the resume
+        progress_callback: Called with (pages_done, page_count) while a PDF is extracted
+
+    Returns:
+        dict: {"content_hash", "cache_key", "text", "sections", "skills",
+        "experience_years", "analysis"}; "analysis" is None until
+        get_resume_analysis() has run. None if no text could be extracted.
+
+    Raises:
+        RuntimeError: If the file cannot be processed
+    """
+    if uploaded_file is None:
+        return None
+
+    file_ext = os.path.splitext(uploaded_file.name)[1].lower()
+    content_hash = hash_upload(uploaded_file)
+    cache_key = _cache_key(content_hash, file_ext)
+
+    cache = get_resume_cache()
+    if cache is not None:
+        try:
+            cached = cache.get(cache_key)
+        except sqlite3.Error:
+            cached = None
+        if cached is not None:
+            return json.loads(cached)
+
+    text = extract_resume_text(uploaded_file, progress_callback)
+    if not text:
+        return None
+
+    parsed = {
+        "content_hash": content_hash,
+        "cache_key": cache_key,
+        "text": text,
+        "sections": extract_sections(text),
+        "skills": extract_skills(text),
+        "experience_years": extract_experience_duration(text),
+        "analysis": None,
+    }
+    _store(parsed)
+    return parsed
+
+def get_resume_analysis(parsed: Dict) -> Dict:
+    """
+    LLM analysis of a parsed resume, computed once and cached alongside it.
+
+    Failed analyses are returned but not cached, so the next upload retries.
+
+    Args:
+        parsed: Result of load_resume()
+
+    Returns:
+        dict: Result of analyze_resume()
+    """
+    if parsed.get("analysis") is not None:
+        return parsed["analysis"]
+
+    # Imported here so parsing does not pull in the OpenAI client
+    from utils.openai_utils import analyze_resume
+
+    analysis = analyze_resume(parsed["text"])
+    if "error" not in analysis:
+        parsed["analysis"] = analysis
+        _store(parsed)
+    return analysis
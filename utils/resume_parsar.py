@@ -3,60 +3,143 @@ import re
 import shutil
 import PyPDF2
 import io
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-from typing import Optional, Dict, List
-from docx import Document
+import multiprocessing
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from xml.etree import ElementTree
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from utils.nltk_resources import ensure_resource
+from utils.skill_taxonomy import get_taxonomy
 
 # ======================
 # NLTK INITIALIZATION
 # ======================
 def initialize_nltk():
-    """Initialize NLTK with proper data download and path configuration"""
-    # Create a custom directory for NLTK data in user's home folder
-    nltk_dir = os.path.join(os.path.expanduser("~"), "nltk_data")
-    
-    # Create directory if it doesn't exist
-    os.makedirs(nltk_dir, exist_ok=True)
-    
-    # Set the NLTK data path to our custom directory
-    nltk.data.path = [nltk_dir]
-    
-    # List of required NLTK packages
-    required_packages = ['punkt', 'stopwords', 'wordnet', 'averaged_perceptron_tagger']
+    """
+    Resolve every NLTK package the parser relies on.
     
-    for package in required_packages:
+    Not run at import time: packages are resolved lazily on first use, so
+    call this only to warm up a worker ahead of traffic.
+    """
+    for package in ['punkt', 'stopwords', 'wordnet', 'averaged_perceptron_tagger']:
         try:
-            # Check if the package is already downloaded
-            nltk.data.find(f'tokenizers/{package}' if package == 'punkt' else 
-                          f'taggers/{package}' if package == 'averaged_perceptron_tagger' else 
-                          f'corpora/{package}')
-        except LookupError:
-            try:
-                # Download the package to our custom directory
-                nltk.download(package, download_dir=nltk_dir)
-            except Exception as e:
-                print(f"Error downloading {package}: {str(e)}")
-                # Try one more time with fresh download
-                try:
-                    nltk.download(package, download_dir=nltk_dir, force=True)
-                except Exception as e:
-                    print(f"Failed to download {package} after retry: {str(e)}")
-                    continue
-
-# Initialize NLTK when module loads
-initialize_nltk()
+            ensure_resource(package)
+        except LookupError as e:
+            print(str(e))
 
 # ======================
 # TEXT EXTRACTION
 # ======================
-def extract_resume_text(uploaded_file) -> Optional[str]:
+# Uploads larger than this are rejected before any parsing
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(25 * 1024 * 1024)))
+
+# PDFs with at least this many pages are extracted by a pool of worker processes
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "16"))
+PDF_EXTRACT_WORKERS = int(os.getenv("PDF_EXTRACT_WORKERS", str(min(8, os.cpu_count() or 1))))
+
+_pdf_pool = None
+_pdf_pool_lock = threading.Lock()
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """
+    Process pool shared by all PDF extractions, started on first use.
+    
+    Workers are spawned rather than forked: the Streamlit server has live
+    threads and connections whose locks a forked child could inherit held.
+    """
+    global _pdf_pool
+    
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            _pdf_pool = ProcessPoolExecutor(
+                max_workers=PDF_EXTRACT_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _pdf_pool
+
+def _upload_size(uploaded_file) -> int:
+    """Size of an upload in bytes, without reading it."""
+    size = getattr(uploaded_file, "size", None)  # Streamlit UploadedFile
+    if size is None:
+        position = uploaded_file.tell()
+        size = uploaded_file.seek(0, io.SEEK_END)
+        uploaded_file.seek(position)
+    return size
+
+def _spool_to_temp_file(uploaded_file, suffix: str) -> str:
+    """Copy an upload to a temporary file in chunks, so worker processes can open it by path."""
+    uploaded_file.seek(0)
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as spool:
+        shutil.copyfileobj(uploaded_file, spool)
+    return spool.name
+
+def _extract_page_range(pdf_path: str, start: int, end: int) -> List[str]:
+    """Extract the text of pages [start, end) in a worker process."""
+    with open(pdf_path, "rb") as pdf_file:
+        pdf_reader = PyPDF2.PdfReader(pdf_file)
+        return [pdf_reader.pages[index].extract_text() or "" for index in range(start, end)]
+
+def iter_pdf_pages(pdf_file) -> Iterator[Tuple[int, int, str]]:
+    """
+    Extract PDF pages incrementally, in page order.
+    
+    Documents with PDF_PARALLEL_MIN_PAGES pages or more are spooled to a
+    temporary file and split into page ranges extracted by a process pool;
+    smaller ones are read serially, straight from the file object.
+    
+    Args:
+        pdf_file: File-like object containing PDF data
+        
+    Yields:
+        tuple: (page_number, page_count, page_text), page_number starting at 1
+    """
+    pdf_file.seek(0)
+    pdf_reader = PyPDF2.PdfReader(pdf_file)
+    page_count = len(pdf_reader.pages)
+    
+    if page_count < PDF_PARALLEL_MIN_PAGES or PDF_EXTRACT_WORKERS < 2:
+        for index, page in enumerate(pdf_reader.pages):
+            yield index + 1, page_count, page.extract_text() or ""
+        return
+    
+    # Workers read the spooled file rather than receiving a pickled copy of the upload each
+    pdf_path = _spool_to_temp_file(pdf_file, ".pdf")
+    # Several ranges per worker keeps the pool busy and progress updates frequent
+    chunk_size = max(1, -(-page_count // (PDF_EXTRACT_WORKERS * 4)))
+    pool = _get_pdf_pool()
+    futures = [
+        pool.submit(_extract_page_range, pdf_path, start, min(start + chunk_size, page_count))
+        for start in range(0, page_count, chunk_size)
+    ]
+    page_number = 0
+    try:
+        for future in futures:
+            for page_text in future.result():
+                page_number += 1
+                yield page_number, page_count, page_text
+    finally:
+        for future in futures:
+            future.cancel()
+        os.remove(pdf_path)
+
+def decode_text_upload(uploaded_file) -> str:
+    """Decode a UTF-8 text upload from its buffer without copying the bytes first."""
+    if hasattr(uploaded_file, "getbuffer"):
+        with uploaded_file.getbuffer() as view:
+            return str(view, 'utf-8')
+    uploaded_file.seek(0)
+    return uploaded_file.read().decode('utf-8')
+
+def extract_resume_text(uploaded_file, progress_callback: Optional[Callable[[int, int], None]] = None) -> Optional[str]:
     """
     Extract text content from a resume file with robust error handling.
     
     Args:
         uploaded_file: File-like object containing the resume
+        progress_callback: Called with (pages_done, page_count) while a PDF is extracted
         
     Returns:
         str: Extracted text or None if error occurs
@@ -67,48 +150,119 @@ def extract_resume_text(uploaded_file) -> Optional[str]:
     try:
         file_ext = os.path.splitext(uploaded_file.name)[1].lower()
         
+        size = _upload_size(uploaded_file)
+        if size > MAX_UPLOAD_BYTES:
+            raise ValueError(
+                f"File is too large ({size / 2**20:.1f} MB); the limit is {MAX_UPLOAD_BYTES / 2**20:.0f} MB"
+            )
+        
         if file_ext == '.pdf':
-            return extract_from_pdf(uploaded_file)
+            return extract_from_pdf(uploaded_file, progress_callback)
         elif file_ext == '.docx':
             return extract_from_docx(uploaded_file)
         elif file_ext == '.txt':
-            return uploaded_file.getvalue().decode('utf-8')
+            return decode_text_upload(uploaded_file)
         else:
             raise ValueError(f"Unsupported file format: {file_ext}")
     except Exception as e:
         raise RuntimeError(f"Error processing resume: {str(e)}")
 
-def extract_from_pdf(pdf_file) -> str:
+def extract_from_pdf(pdf_file, progress_callback: Optional[Callable[[int, int], None]] = None) -> str:
     """
     Extract text from PDF with improved error handling.
     
     Args:
         pdf_file: File-like object containing PDF data
+        progress_callback: Called with (pages_done, page_count) after each page
         
     Returns:
         str: Extracted and cleaned text
     """
     try:
-        pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_file.getvalue()))
-        text = ""
+        page_texts = []
         
-        for page in pdf_reader.pages:
-            page_text = page.extract_text()
+        for page_number, page_count, page_text in iter_pdf_pages(pdf_file):
             if page_text:  # Only add if text was extracted
-                text += page_text + "\n"
+                page_texts.append(page_text)
+            if progress_callback:
+                progress_callback(page_number, page_count)
         
+        text = "".join(page_text + "\n" for page_text in page_texts)
         if not text.strip():
             raise ValueError("PDF appears to be image-based or contains no extractable text")
             
         return clean_text(text)
-    except PyPDF2.PdfReadError:
+    except PyPDF2.errors.PdfReadError:
         raise ValueError("Invalid or corrupted PDF file")
     except Exception as e:
         raise RuntimeError(f"PDF processing failed: {str(e)}")
 
+# WordprocessingML element tags
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_P, _W_T, _W_TAB, _W_BR, _W_CR, _W_BODY = (_W + tag for tag in ("p", "t", "tab", "br", "cr", "body"))
+_W_NO_BREAK_HYPHEN = _W + "noBreakHyphen"
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+def iter_docx_paragraphs(docx_file) -> Iterator[str]:
+    """
+    Stream the paragraphs of a DOCX file in document order.
+    
+    word/document.xml is parsed incrementally straight from the zip, and each
+    top-level block is discarded once read, so memory stays bounded. Table
+    cells and text boxes are included, every paragraph in them yielded as
+    its own line.
+    
+    Args:
+        docx_file: File-like object containing DOCX data
+        
+    Yields:
+        str: Text of each paragraph (possibly empty)
+    """
+    docx_file.seek(0)
+    with zipfile.ZipFile(docx_file) as archive, archive.open("word/document.xml") as document:
+        paragraphs: List[List[str]] = []  # Text of each open paragraph (text boxes nest them)
+        fallback_depth = 0  # Inside mc:Fallback, which repeats text boxes for old readers
+        body = None
+        depth = 0
+        
+        for event, elem in ElementTree.iterparse(document, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                depth += 1
+                if tag == _W_P:
+                    paragraphs.append([])
+                elif tag == _MC_FALLBACK:
+                    fallback_depth += 1
+                elif tag == _W_BODY:
+                    body = elem
+                continue
+            
+            depth -= 1
+            if tag == _MC_FALLBACK:
+                fallback_depth -= 1
+            elif paragraphs and not fallback_depth:
+                if tag == _W_T:
+                    paragraphs[-1].append(elem.text or "")
+                elif tag == _W_TAB:
+                    paragraphs[-1].append("\t")
+                elif tag in (_W_BR, _W_CR):
+                    if elem.get(_W + "type") != "page":
+                        paragraphs[-1].append("\n")
+                elif tag == _W_NO_BREAK_HYPHEN:
+                    paragraphs[-1].append("-")
+            
+            if tag == _W_P:
+                text = "".join(paragraphs.pop())
+                if not fallback_depth:
+                    yield text
+            
+            # A finished paragraph or table directly under <w:body> is no longer needed
+            if depth == 2 and body is not None:
+                body.clear()
+
 def extract_from_docx(docx_file) -> str:
     """
-    Extract text from DOCX files using python-docx.
+    Extract text from DOCX files, including tables and text boxes.
     
     Args:
         docx_file: File-like object containing DOCX data
@@ -117,20 +271,24 @@ def extract_from_docx(docx_file) -> str:
         str: Extracted and cleaned text
     """
     try:
-        doc = Document(io.BytesIO(docx_file.getvalue()))
-        full_text = []
-        
-        for para in doc.paragraphs:
-            if para.text.strip():
-                full_text.append(para.text)
-        
+        full_text = [text for text in iter_docx_paragraphs(docx_file) if text.strip()]
         return clean_text("\n".join(full_text))
+    except zipfile.BadZipFile:
+        raise ValueError("Invalid or corrupted DOCX file")
     except Exception as e:
         raise RuntimeError(f"DOCX processing failed: {str(e)}")
 
 # ======================
 # TEXT PROCESSING
 # ======================
+# Normalization patterns, compiled once. Runs of spaces/tabs only match when
+# there is something to collapse, so single spaces are never rewritten.
+_WHITESPACE_RUN_PATTERN = re.compile(r'\t[ \t]*| [ \t]+')
+_BLANK_LINES_PATTERN = re.compile(r'\n{3,}')
+_SPECIAL_CHAR_PATTERN = re.compile(r'[^\w\s.,;:()\-\'"/]')  # Keeps meaningful punctuation
+# Common resume artifacts; the lookahead lets the engine skip most positions cheaply
+_ARTIFACT_PATTERN = re.compile(r'\b(?=[peh])(?:page|phone|email|http[s]?://\S+)\b', re.IGNORECASE)
+
 def clean_text(text: str) -> str:
     """
     Clean and normalize extracted text with enhanced processing.
@@ -145,21 +303,105 @@ def clean_text(text: str) -> str:
         return ""
     
     # Normalize line endings and remove excessive whitespace
-    text = re.sub(r'\r\n', '\n', text)  # Standardize line endings
-    text = re.sub(r'[ \t]+', ' ', text)  # Collapse multiple spaces/tabs
-    text = re.sub(r'\n{3,}', '\n\n', text)  # Limit consecutive newlines
+    text = text.replace('\r\n', '\n')  # Standardize line endings
+    text = _WHITESPACE_RUN_PATTERN.sub(' ', text)  # Collapse multiple spaces/tabs
+    if '\n\n\n' in text:
+        text = _BLANK_LINES_PATTERN.sub('\n\n', text)  # Limit consecutive newlines
     
     # Remove special characters but preserve meaningful punctuation
-    text = re.sub(r'[^\w\s.,;:()\-\'"/]', '', text)
+    text = _SPECIAL_CHAR_PATTERN.sub('', text)
     
     # Remove common resume artifacts
-    text = re.sub(r'\b(?:page|phone|email|http[s]?://\S+)\b', '', text, flags=re.IGNORECASE)
+    text = _ARTIFACT_PATTERN.sub('', text)
     
     return text.strip()
 
 # ======================
 # SECTION EXTRACTION
 # ======================
+# Section headings, matched as whole lines in one pass over the text. A heading
+# may carry a qualifier ("Work Experience", "Technical Skills") and inline
+# content after a colon ("Skills: Python, SQL").
+_HEADING_PATTERN = re.compile(r"""
+    ^[ \t]*(?:[#*\-][ \t]*)?
+    (?:(?:professional|work|technical|core|key|career|relevant)[ \t]+)?
+    (?:
+        (?P<contact>contact[ \t]*information|contact|personal[ \t]*details)
+      | (?P<summary>summary|profile|objective)
+      | (?P<education>education|academic[ \t]*background|qualifications)
+      | (?P<experience>experience|work[ \t]*history|employment(?:[ \t]*history)?)
+      | (?P<skills>skills|competencies)
+      | (?P<projects>projects)
+      | (?P<certifications>certifications|licenses)
+    )
+    [ \t]*(?::|$)
+""", re.IGNORECASE | re.MULTILINE | re.VERBOSE)
+
+SECTION_NAMES = ('contact', 'summary', 'education', 'experience', 'skills', 'projects', 'certifications')
+
+class ResumeSegments(NamedTuple):
+    """
+    Section boundaries of a resume as offsets into the original text.
+    
+    ``spans`` maps each section found to its (start, end) content offsets;
+    ``other`` lists the spans outside any recognized section.
+    """
+    text: str
+    spans: Dict[str, Tuple[int, int]]
+    other: Tuple[Tuple[int, int], ...]
+    
+    def raw(self, section: str) -> str:
+        """Uncleaned content of a section ('' if absent)."""
+        span = self.spans.get(section)
+        return self.text[span[0]:span[1]] if span else ''
+
+@lru_cache(maxsize=32)
+def segment_resume(resume_text: str) -> ResumeSegments:
+    """
+    Split a resume into sections in a single pass.
+    
+    A section runs from its heading line to the next heading. If a heading
+    repeats, the first occurrence wins and later ones count as other content.
+    Memoized, so every extractor working on the same text shares one result.
+    
+    Args:
+        resume_text: Cleaned resume text
+        
+    Returns:
+        ResumeSegments: Section offsets into resume_text
+    """
+    headings = [(match.lastgroup, match.start(), match.end()) for match in _HEADING_PATTERN.finditer(resume_text)]
+    
+    spans = {}
+    other = []
+    position = 0  # Start of the text not yet assigned to a section
+    for index, (section, heading_start, content_start) in enumerate(headings):
+        content_end = headings[index + 1][1] if index + 1 < len(headings) else len(resume_text)
+        if section in spans:
+            continue
+        if heading_start > position:
+            other.append((position, heading_start))
+        spans[section] = (content_start, content_end)
+        position = content_end
+    if position < len(resume_text):
+        other.append((position, len(resume_text)))
+    
+    return ResumeSegments(resume_text, spans, tuple(other))
+
+def get_section(resume_text: str, section: str) -> str:
+    """
+    Cleaned content of one resume section.
+    
+    Args:
+        resume_text: Cleaned resume text
+        section: One of SECTION_NAMES
+        
+    Returns:
+        str: Section content, or '' if the resume has no such section
+    """
+    content = segment_resume(resume_text).raw(section).strip()
+    return clean_section_content(content) if content else ''
+
 def extract_sections(resume_text: str) -> Dict[str, str]:
     """
     Extract common resume sections with improved pattern matching.
@@ -170,25 +412,10 @@ def extract_sections(resume_text: str) -> Dict[str, str]:
     Returns:
         dict: Dictionary with section names as keys and content as values
     """
-    section_patterns = {
-        'contact': r'(?i)(contact\s*information|personal\s*details)(.*?)(?=\n\s*\n|$)',
-        'summary': r'(?i)(summary|profile|objective)(.*?)(?=\n\s*\n|$)',
-        'education': r'(?i)(education|academic\s*background|qualifications)(.*?)(?=\n\s*\n|$)',
-        'experience': r'(?i)(experience|work\s*history|employment)(.*?)(?=\n\s*\n|$)',
-        'skills': r'(?i)(skills|technical\s*skills|competencies)(.*?)(?=\n\s*\n|$)',
-        'projects': r'(?i)(projects|key\s*projects)(.*?)(?=\n\s*\n|$)',
-        'certifications': r'(?i)(certifications|licenses)(.*?)(?=\n\s*\n|$)'
-    }
-    
-    sections = {section: '' for section in section_patterns}
-    sections['other'] = resume_text  # Default content
-    
-    for section, pattern in section_patterns.items():
-        match = re.search(pattern, resume_text, re.DOTALL)
-        if match:
-            sections[section] = clean_section_content(match.group(2).strip())
-            # Remove extracted section from 'other' content
-            sections['other'] = sections['other'].replace(match.group(0), '')
+    segments = segment_resume(resume_text)
+    
+    sections = {section: get_section(resume_text, section) for section in SECTION_NAMES}
+    sections['other'] = ''.join(resume_text[start:end] for start, end in segments.other)
     
     return sections
 
@@ -200,6 +427,12 @@ def clean_section_content(text: str) -> str:
 # ======================
 # SKILL EXTRACTION
 # ======================
+# Additional pattern matching for skills not in the taxonomy
+SKILL_PATTERNS = [
+    re.compile(r'\b([A-Z][a-z]*[ /-]+[A-Z][a-z]*)\b'),  # Matches "Machine Learning" style terms
+    re.compile(r'\b[A-Z]{2,}\b'),  # Matches acronyms like "AWS", "SQL"
+]
+
 def extract_skills(resume_text: str) -> List[str]:
     """
     Extract skills from resume text with comprehensive matching.
@@ -210,40 +443,19 @@ def extract_skills(resume_text: str) -> List[str]:
     Returns:
         list: Sorted list of unique skills found
     """
-    # Enhanced skill database
-    skill_db = {
-        'Programming': ['python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust', 'swift', 'kotlin'],
-        'Web': ['html', 'css', 'react', 'angular', 'vue', 'node.js', 'django', 'flask', 'express', 'spring'],
-        'Data': ['sql', 'mysql', 'postgresql', 'mongodb', 'hadoop', 'spark', 'pandas', 'numpy', 'pytorch', 'tensorflow'],
-        'Cloud': ['aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform', 'ansible', 'jenkins', 'ci/cd'],
-        'Tools': ['git', 'linux', 'bash', 'jira', 'tableau', 'power bi', 'excel', 'selenium'],
-        'Methodologies': ['agile', 'scrum', 'kanban', 'devops', 'tdd', 'oop', 'microservices'],
-        'Soft Skills': ['leadership', 'communication', 'teamwork', 'problem solving', 'critical thinking']
-    }
-    
     # Get skills from dedicated section first
-    sections = extract_sections(resume_text)
-    skill_text = sections['skills'].lower() if sections['skills'] else resume_text.lower()
-    
-    found_skills = set()
+    skills_section = get_section(resume_text, 'skills')
+    skill_text = skills_section.lower() if skills_section else resume_text.lower()
     
-    # Match against skill database
-    for category, skills in skill_db.items():
-        for skill in skills:
-            if re.search(r'\b' + re.escape(skill) + r'\b', skill_text):
-                found_skills.add(skill.title())
-    
-    # Additional pattern matching for skills not in database
-    skill_patterns = [
-        r'\b([A-Z][a-z]*[ /-]+[A-Z][a-z]*)\b',  # Matches "Machine Learning" style terms
-        r'\b[A-Z]{2,}\b',  # Matches acronyms like "AWS", "SQL"
-    ]
+    # Match names and aliases from the skill taxonomy in a single pass over the text
+    taxonomy = get_taxonomy()
+    found_skills = taxonomy.find_skills(skill_text)
     
-    for pattern in skill_patterns:
-        for match in re.finditer(pattern, resume_text):
+    for pattern in SKILL_PATTERNS:
+        for match in pattern.finditer(resume_text):
             potential_skill = match.group(1) if match.groups() else match.group(0)
             if len(potential_skill) > 2:  # Filter out very short matches
-                found_skills.add(potential_skill.lower())
+                found_skills.add(taxonomy.canonicalize(potential_skill.lower()))
     
     return sorted(found_skills, key=lambda x: (x not in skill_text, x))  # Sort by relevance
 
@@ -258,8 +470,7 @@ def extract_experience_duration(resume_text: str) -> Optional[int]:
         int: Estimated total years of experience or None if not found
     """
     # Look for duration patterns in experience section
-    sections = extract_sections(resume_text)
-    exp_text = sections['experience']
+    exp_text = get_section(resume_text, 'experience')
     
     # Pattern for "Jan 2020 - Present (3 years 5 months)" style
     duration_pattern = r'(\d+)\s*years?'
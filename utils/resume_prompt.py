@@ -0,0 +1,204 @@
+import os
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from utils.resume_parsar import segment_resume
+
+# Token budget for the resume content sent to analyze_resume
+RESUME_TOKEN_BUDGET = int(os.getenv("RESUME_PROMPT_TOKEN_BUDGET", "2500"))
+
+# Sections in prompt order with their weight when the budget must be shared
+SECTION_WEIGHTS = [
+    ("summary", 2),
+    ("experience", 6),
+    ("skills", 3),
+    ("projects", 2),
+    ("education", 2),
+    ("certifications", 1),
+    ("contact", 0.5),
+    ("other", 1),
+]
+
+SECTION_TITLES = {
+    "summary": "Summary",
+    "experience": "Experience",
+    "skills": "Skills",
+    "projects": "Projects",
+    "education": "Education",
+    "certifications": "Certifications",
+    "contact": "Contact",
+    "other": "Other",
+}
+
+# Lines that carry no information for an analysis
+BOILERPLATE_PATTERN = re.compile(
+    r'^(?:references?\s+(?:are\s+)?available\s+(?:up)?on\s+request'
+    r'|curriculum\s+vitae|resume|cv|confidential'
+    r'|(?:page\s+)?\d+\s*(?:of|/)\s*\d+)\.?$',
+    re.IGNORECASE
+)
+
+# Room left for the "[N more lines omitted]" note in a truncated section
+OMISSION_MARKER_TOKENS = 8
+
+@lru_cache(maxsize=1)
+def _get_encoder():
+    """
+    tiktoken's encoding for the configured model, or None if it is unavailable.
+
+    tiktoken downloads the encoding on first use, so without network access
+    (and no cached copy) this is None as well.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    from utils.openai_utils import MODEL
+
+    try:
+        try:
+            return tiktoken.encoding_for_model(MODEL)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        print(f"Token counts are estimated, tiktoken encoding unavailable: {str(e)}")
+        return None
+
+def count_tokens(text: str) -> int:
+    """
+    Number of tokens the model will see for a text.
+
+    Uses tiktoken when it is installed; otherwise estimates about four
+    characters per token, which is close for English prose.
+    """
+    encoding = _get_encoder()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return (len(text) + 3) // 4
+
+def _truncate_text(text: str, tokens: int) -> str:
+    """Longest prefix of a text within a token count, cut back to a word boundary."""
+    encoding = _get_encoder()
+    if encoding is not None:
+        prefix = encoding.decode(encoding.encode(text)[:tokens])
+    else:
+        prefix = text[:tokens * 4]
+    if len(prefix) < len(text) and " " in prefix:
+        prefix = prefix.rsplit(" ", 1)[0]
+    return prefix
+
+def _normalize_line(line: str) -> str:
+    return " ".join(line.lower().split())
+
+def _section_lines(resume_text: str) -> Dict[str, List[str]]:
+    """
+    Split a resume into the lines of each section, as written.
+
+    Lines are taken from the raw section spans rather than the cleaned
+    sections, whose leading digits would cost dates like "2019 - 2021".
+    Boilerplate lines are dropped, and so are page headers and footers: PDF
+    extraction loses the page breaks, so a line counts as a running header
+    or footer when it repeats in more than one section, and only its first
+    occurrence is kept. Lines repeated within a section (the same bullet
+    under two roles) are kept.
+    """
+    segments = segment_resume(resume_text)
+    chunks = sorted(
+        [(start, end, section) for section, (start, end) in segments.spans.items()]
+        + [(start, end, "other") for start, end in segments.other]
+    )
+
+    entries = []  # (section, line, key) in document order
+    sections_of = {}
+    for start, end, section in chunks:
+        for line in resume_text[start:end].split("\n"):
+            key = _normalize_line(line)
+            if not key or BOILERPLATE_PATTERN.match(key):
+                continue
+            entries.append((section, line.strip(), key))
+            sections_of.setdefault(key, set()).add(section)
+
+    lines = {section: [] for section, _ in SECTION_WEIGHTS}
+    seen = set()
+    for section, line, key in entries:
+        if len(sections_of[key]) > 1:
+            if key in seen:
+                continue
+            seen.add(key)
+        lines[section].append(line)
+    return lines
+
+def _allocate(sizes: Dict[str, int], budget: int) -> Dict[str, int]:
+    """
+    Share a token budget between sections by weight.
+
+    Sections smaller than their share keep their full size and the unused
+    tokens are redistributed among the remaining sections.
+    """
+    weights = {section: weight for section, weight in SECTION_WEIGHTS if sizes.get(section)}
+    allocation = {}
+    remaining = budget
+    # Visit sections in order of how much of their share they need
+    for section in sorted(weights, key=lambda name: sizes[name] / weights[name]):
+        share = remaining * weights[section] / sum(weights[name] for name in weights if name not in allocation)
+        allocation[section] = min(sizes[section], int(share))
+        remaining -= allocation[section]
+    return allocation
+
+def _truncate_lines(lines: List[str], budget: int) -> Tuple[List[str], int]:
+    """Keep leading lines (most recent roles come first) that fit in the budget."""
+    costs = [count_tokens(line) + 1 for line in lines]  # +1 for the newline
+    if sum(costs) > budget:
+        budget -= OMISSION_MARKER_TOKENS
+    kept = []
+    used = 0
+    for line, cost in zip(lines, costs):
+        if used + cost > budget:
+            if not kept and budget > 8:
+                # A single overlong line: keep its beginning (and its newline)
+                kept.append(_truncate_text(line, budget - 1))
+            break
+        kept.append(line)
+        used += cost
+    return kept, len(lines) - len(kept)
+
+def build_resume_prompt_text(resume_text: str, token_budget: Optional[int] = None) -> str:
+    """
+    Compress a resume to fit a token budget while keeping the most informative content.
+
+    The resume is split into sections, boilerplate and page headers and
+    footers are dropped (see _section_lines), and if the rest is still over
+    budget each section is cut to its weighted share, keeping its first
+    lines. Experience gets the largest share.
+
+    Args:
+        resume_text: Cleaned resume text
+        token_budget: Maximum tokens for the result (default RESUME_TOKEN_BUDGET)
+
+    Returns:
+        str: The resume as titled sections, within the budget
+    """
+    budget = token_budget or RESUME_TOKEN_BUDGET
+    sections = _section_lines(resume_text)
+
+    # Section titles and blank lines between sections
+    overhead = sum(count_tokens(SECTION_TITLES[name]) + 3 for name, lines in sections.items() if lines)
+    sizes = {name: sum(count_tokens(line) + 1 for line in lines) for name, lines in sections.items() if lines}
+    if sum(sizes.values()) + overhead <= budget:
+        allocation = sizes
+    else:
+        allocation = _allocate(sizes, max(0, budget - overhead))
+
+    parts = []
+    for section, _ in SECTION_WEIGHTS:
+        if not sizes.get(section):
+            continue
+        lines, omitted = _truncate_lines(sections[section], allocation[section])
+        if not lines:
+            continue
+        if omitted:
+            lines.append(f"[{omitted} more lines omitted]")
+        parts.append(f"{SECTION_TITLES[section]}:\n" + "\n".join(lines))
+    return "\n\n".join(parts)
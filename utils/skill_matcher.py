@@ -0,0 +1,111 @@
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+def _is_word_char(ch: str) -> bool:
+    """Equivalent of the regex ``\\w`` class for a single character."""
+    return ch.isalnum() or ch == "_"
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton matching many skill names in a single pass.
+
+    A match is reported only where ``re.search(r'\\b' + re.escape(skill) + r'\\b', text)``
+    would match, so results are identical to checking each skill with its own
+    regex, but the text is scanned once regardless of the number of skills.
+    Patterns are matched case-sensitively; lowercase both sides for
+    case-insensitive matching.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Args:
+            patterns: Skill names to match (duplicates are ignored)
+        """
+        self.patterns: List[str] = list(dict.fromkeys(p for p in patterns if p))
+
+        # State 0 is the root; goto[state] maps a character to the next state
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[Tuple[int, ...]] = [()]
+
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                transitions = goto[state]
+                next_state = transitions.get(ch)
+                if next_state is None:
+                    next_state = transitions[ch] = len(goto)
+                    goto.append({})
+                    outputs.append(())
+                state = next_state
+            outputs[state] += (index,)
+
+        # Breadth-first pass computing failure links and merged outputs
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and ch not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(ch, 0)
+                if target == next_state:
+                    target = 0
+                fail[next_state] = target
+                if outputs[target]:
+                    outputs[next_state] += outputs[target]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = outputs
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """
+        Yield every word-bounded occurrence of any pattern.
+
+        Yields:
+            tuple: (start, end, pattern) for each match, ordered by end offset
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        patterns = self.patterns
+        length = len(text)
+        state = 0
+
+        for position, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+
+            if not output[state]:
+                continue
+
+            end = position + 1
+            # \b after the match: word-ness changes between text[end - 1] and text[end]
+            after_is_word = end < length and _is_word_char(text[end])
+            if _is_word_char(ch) == after_is_word:
+                continue
+
+            for index in output[state]:
+                pattern = patterns[index]
+                start = end - len(pattern)
+                before_is_word = start > 0 and _is_word_char(text[start - 1])
+                if _is_word_char(pattern[0]) != before_is_word:
+                    yield start, end, pattern
+
+    def find(self, text: str) -> Set[str]:
+        """
+        Return the set of patterns occurring in the text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            set: Patterns found at least once
+        """
+        return {pattern for _, _, pattern in self.finditer(text)}
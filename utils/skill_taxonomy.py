@@ -0,0 +1,417 @@
+import json
+import os
+import sqlite3
+import sys
+import threading
+from functools import cached_property
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from utils.skill_matcher import SkillMatcher
+
+# SQLite taxonomy file; the built-in taxonomy is used when it does not exist
+TAXONOMY_PATH = os.getenv(
+    "SKILL_TAXONOMY_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "skill_taxonomy.sqlite3")
+)
+
+class Skill(NamedTuple):
+    """One taxonomy entry."""
+    name: str  # Canonical display name, e.g. "Node.js"
+    category: str
+    aliases: Tuple[str, ...] = ()  # Alternative spellings matched to the same skill
+    industries: Tuple[str, ...] = ()  # Industries the skill is in demand in
+
+# Built-in taxonomy: (name, category, aliases)
+_BUILTIN_SKILLS = [
+    # Programming
+    ("Python", "Programming", ()),
+    ("Java", "Programming", ()),
+    ("JavaScript", "Programming", ()),
+    ("TypeScript", "Programming", ()),
+    ("C++", "Programming", ("cpp",)),
+    ("C#", "Programming", ("csharp",)),
+    ("Go", "Programming", ("golang",)),
+    ("Rust", "Programming", ()),
+    ("Swift", "Programming", ()),
+    ("Kotlin", "Programming", ()),
+    # Web
+    ("HTML", "Web", ("html5",)),
+    ("CSS", "Web", ("css3",)),
+    ("React", "Web", ("react.js", "reactjs")),
+    ("Angular", "Web", ("angularjs",)),
+    ("Vue", "Web", ("vue.js", "vuejs")),
+    ("Node.js", "Web", ("nodejs",)),
+    ("Django", "Web", ()),
+    ("Flask", "Web", ()),
+    ("Express", "Web", ("express.js",)),
+    ("Spring", "Web", ("spring boot",)),
+    # Data
+    ("SQL", "Data", ()),
+    ("MySQL", "Data", ()),
+    ("PostgreSQL", "Data", ("postgres",)),
+    ("MongoDB", "Data", ()),
+    ("Hadoop", "Data", ()),
+    ("Spark", "Data", ("apache spark", "pyspark")),
+    ("Pandas", "Data", ()),
+    ("NumPy", "Data", ()),
+    ("PyTorch", "Data", ()),
+    ("TensorFlow", "Data", ()),
+    ("Machine Learning", "Data", ("ml",)),
+    ("Data Analysis", "Data", ("data analytics",)),
+    # Cloud
+    ("AWS", "Cloud", ("amazon web services",)),
+    ("Azure", "Cloud", ("microsoft azure",)),
+    ("GCP", "Cloud", ("google cloud", "google cloud platform")),
+    ("Docker", "Cloud", ()),
+    ("Kubernetes", "Cloud", ("k8s",)),
+    ("Terraform", "Cloud", ()),
+    ("Ansible", "Cloud", ()),
+    ("Jenkins", "Cloud", ()),
+    ("CI/CD", "Cloud", ("cicd",)),
+    # Tools
+    ("Git", "Tools", ()),
+    ("Linux", "Tools", ()),
+    ("Bash", "Tools", ()),
+    ("Jira", "Tools", ()),
+    ("Tableau", "Tools", ()),
+    ("Power BI", "Tools", ("powerbi",)),
+    ("Excel", "Tools", ("microsoft excel", "ms excel")),
+    ("Selenium", "Tools", ()),
+    # Methodologies
+    ("Agile", "Methodologies", ()),
+    ("Scrum", "Methodologies", ()),
+    ("Kanban", "Methodologies", ()),
+    ("DevOps", "Methodologies", ()),
+    ("TDD", "Methodologies", ("test-driven development",)),
+    ("OOP", "Methodologies", ("object-oriented programming",)),
+    ("Microservices", "Methodologies", ()),
+    # Soft Skills
+    ("Leadership", "Soft Skills", ()),
+    ("Communication", "Soft Skills", ()),
+    ("Teamwork", "Soft Skills", ()),
+    ("Problem Solving", "Soft Skills", ("problem-solving",)),
+    ("Critical Thinking", "Soft Skills", ()),
+    # Industry domain skills
+    ("Telehealth", "Healthcare", ("telemedicine",)),
+    ("Electronic Health Records", "Healthcare", ("ehr", "emr")),
+    ("Patient Care", "Healthcare", ()),
+    ("Healthcare Management", "Healthcare", ()),
+    ("Medical Coding", "Healthcare", ()),
+    ("Financial Analysis", "Finance", ()),
+    ("Risk Assessment", "Finance", ("risk analysis",)),
+    ("Blockchain", "Finance", ()),
+    ("Regulatory Compliance", "Finance", ()),
+    ("Online Learning Platforms", "Education", ("lms",)),
+    ("Digital Curriculum Development", "Education", ()),
+    ("Educational Technology", "Education", ("edtech",)),
+    ("Student Engagement", "Education", ()),
+    ("Lean Manufacturing", "Manufacturing", ()),
+    ("Automation", "Manufacturing", ()),
+    ("Six Sigma", "Manufacturing", ()),
+    ("IoT", "Manufacturing", ("internet of things",)),
+    ("Supply Chain Management", "Manufacturing", ()),
+    ("CAD", "Manufacturing", ()),
+    ("E-commerce Platforms", "Retail", ()),
+    ("Digital Marketing", "Retail", ()),
+    ("Inventory Management", "Retail", ()),
+    ("Customer Experience", "Retail", ("cx",)),
+    ("Omnichannel Strategy", "Retail", ()),
+]
+
+# Skills in highest demand per industry, most in-demand first
+_BUILTIN_INDUSTRY_SKILLS = {
+    "Technology": ["Python", "AWS", "Machine Learning", "Kubernetes", "React", "JavaScript", "Azure", "Data Analysis"],
+    "Healthcare": ["Telehealth", "Electronic Health Records", "Patient Care", "Healthcare Management", "Medical Coding"],
+    "Finance": ["Financial Analysis", "Python", "SQL", "Risk Assessment", "Blockchain", "Regulatory Compliance"],
+    "Education": ["Online Learning Platforms", "Digital Curriculum Development", "Educational Technology", "Student Engagement"],
+    "Manufacturing": ["Lean Manufacturing", "Automation", "Six Sigma", "IoT", "Supply Chain Management", "CAD"],
+    "Retail": ["E-commerce Platforms", "Digital Marketing", "Inventory Management", "Customer Experience", "Omnichannel Strategy"],
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS skills (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    category TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS aliases (
+    alias TEXT PRIMARY KEY,
+    skill_id INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS industry_skills (
+    industry TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    skill_id INTEGER NOT NULL,
+    PRIMARY KEY (industry, rank)
+) WITHOUT ROWID;
+"""
+
+class SkillTaxonomy:
+    """
+    Skill vocabulary with canonical names, aliases, categories and industry tags.
+
+    Every name and alias is matched case-insensitively and resolves to the
+    skill's canonical name, so "postgres", "PostgreSQL" and "postgresql" are
+    all reported as "PostgreSQL".
+    """
+
+    def __init__(self, skills: Iterable[Skill], industry_skills: Optional[Dict[str, List[str]]] = None):
+        """
+        Args:
+            skills: Taxonomy entries; later entries with the same name replace earlier ones
+            industry_skills: {industry: [canonical name, ...]} ranked by demand.
+                Derived from each skill's ``industries`` when omitted.
+        """
+        self._skills: Dict[str, Skill] = {}
+        for skill in skills:
+            self._skills[skill.name] = skill
+
+        # Lowercase name or alias -> canonical name
+        self._index: Dict[str, str] = {}
+        for skill in self._skills.values():
+            for alias in skill.aliases:
+                self._index.setdefault(alias.lower(), skill.name)
+        for skill in self._skills.values():
+            # Canonical names win over aliases of other skills
+            self._index[skill.name.lower()] = skill.name
+
+        if industry_skills is None:
+            industry_skills = {}
+            for skill in self._skills.values():
+                for industry in skill.industries:
+                    industry_skills.setdefault(industry, []).append(skill.name)
+        self._industry_skills = {
+            industry: [self.canonicalize(name) for name in names]
+            for industry, names in industry_skills.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._skills)
+
+    def __iter__(self) -> Iterator[Skill]:
+        return iter(self._skills.values())
+
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self._index
+
+    @property
+    def industries(self) -> List[str]:
+        return list(self._industry_skills)
+
+    def get(self, name: str) -> Optional[Skill]:
+        """Look up a skill by canonical name or alias (case-insensitive)."""
+        canonical = self._index.get(name.strip().lower())
+        return self._skills[canonical] if canonical else None
+
+    def canonicalize(self, name: str) -> str:
+        """
+        Canonical name of a skill, or the stripped input if it is not in the taxonomy.
+        """
+        name = name.strip()
+        return self._index.get(name.lower(), name)
+
+    def canonicalize_all(self, names: Iterable[str]) -> List[str]:
+        """Canonicalize a list of skills, dropping duplicates but keeping order."""
+        return list(dict.fromkeys(self.canonicalize(name) for name in names if name and name.strip()))
+
+    def category_of(self, name: str) -> Optional[str]:
+        skill = self.get(name)
+        return skill.category if skill else None
+
+    def skills_for_industry(self, industry: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Canonical names of the industry's in-demand skills, most in-demand first.
+
+        Args:
+            industry: Industry name
+            limit: Return at most this many skills (all when None)
+        """
+        return list(self._industry_skills.get(industry, [])[:limit])
+
+    def match_skills(self, user_skills: Iterable[str], required_skills: Iterable[str]) -> List[str]:
+        """
+        Required skills the user has, compared by canonical name.
+
+        Args:
+            user_skills: Skills the user listed, in any spelling
+            required_skills: Skills a job or role asks for
+
+        Returns:
+            list: Canonical names of the matching skills, in required_skills order
+        """
+        user = set(self.canonicalize_all(user_skills))
+        return [skill for skill in self.canonicalize_all(required_skills) if skill in user]
+
+    @cached_property
+    def matcher(self) -> SkillMatcher:
+        """Single-pass matcher over every lowercase name and alias (built on first use)."""
+        return SkillMatcher(self._index)
+
+    def find_skills(self, text: str) -> Set[str]:
+        """
+        Canonical names of the taxonomy skills mentioned in a text.
+
+        Args:
+            text: Text to scan (matched case-insensitively)
+
+        Returns:
+            set: Canonical skill names
+        """
+        index = self._index
+        return {index[term] for term in self.matcher.find(text.lower())}
+
+    @classmethod
+    def builtin(cls) -> "SkillTaxonomy":
+        """The taxonomy shipped with the app."""
+        industries: Dict[str, List[str]] = {}
+        for industry, names in _BUILTIN_INDUSTRY_SKILLS.items():
+            for name in names:
+                industries.setdefault(name, []).append(industry)
+        skills = [
+            Skill(name, category, aliases, tuple(industries.get(name, ())))
+            for name, category, aliases in _BUILTIN_SKILLS
+        ]
+        return cls(skills, _BUILTIN_INDUSTRY_SKILLS)
+
+    @classmethod
+    def load(cls, path: str) -> "SkillTaxonomy":
+        """
+        Load a taxonomy written by save().
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            sqlite3.DatabaseError: If it is not a taxonomy database
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            rows = conn.execute("SELECT id, name, category FROM skills").fetchall()
+            names = {skill_id: name for skill_id, name, _ in rows}
+
+            aliases: Dict[int, List[str]] = {}
+            for alias, skill_id in conn.execute("SELECT alias, skill_id FROM aliases"):
+                aliases.setdefault(skill_id, []).append(alias)
+
+            industry_skills: Dict[str, List[str]] = {}
+            skill_industries: Dict[int, List[str]] = {}
+            for industry, skill_id in conn.execute(
+                "SELECT industry, skill_id FROM industry_skills ORDER BY industry, rank"
+            ):
+                industry_skills.setdefault(industry, []).append(names[skill_id])
+                skill_industries.setdefault(skill_id, []).append(industry)
+        finally:
+            conn.close()
+
+        skills = [
+            Skill(name, category, tuple(aliases.get(skill_id, ())), tuple(skill_industries.get(skill_id, ())))
+            for skill_id, name, category in rows
+        ]
+        return cls(skills, industry_skills)
+
+    def save(self, path: str) -> None:
+        """Write the taxonomy to a SQLite file, replacing any existing one."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = path + ".tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+        conn = sqlite3.connect(tmp_path)
+        try:
+            conn.executescript(_SCHEMA)
+            ids = {name: skill_id for skill_id, name in enumerate(self._skills, start=1)}
+            conn.executemany(
+                "INSERT INTO skills (id, name, category) VALUES (?, ?, ?)",
+                ((ids[skill.name], skill.name, skill.category) for skill in self._skills.values())
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO aliases (alias, skill_id) VALUES (?, ?)",
+                ((alias, ids[skill.name]) for skill in self._skills.values() for alias in skill.aliases)
+            )
+            conn.executemany(
+                "INSERT INTO industry_skills (industry, rank, skill_id) VALUES (?, ?, ?)",
+                (
+                    (industry, rank, ids[name])
+                    for industry, names in self._industry_skills.items()
+                    for rank, name in enumerate(names)
+                    if name in ids
+                )
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def from_jsonl(cls, path: str) -> "SkillTaxonomy":
+        """
+        Read a taxonomy from JSON Lines, one skill per line:
+        {"name": ..., "category": ..., "aliases": [...], "industries": [...]}
+        """
+        skills = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                skills.append(Skill(
+                    entry["name"],
+                    entry.get("category", "Other"),
+                    tuple(entry.get("aliases", ())),
+                    tuple(entry.get("industries", ()))
+                ))
+        return cls(skills)
+
+_taxonomy: Optional[SkillTaxonomy] = None
+_taxonomy_lock = threading.Lock()
+
+def get_taxonomy() -> SkillTaxonomy:
+    """
+    Process-wide taxonomy, loaded from TAXONOMY_PATH on first use.
+
+    Falls back to the built-in taxonomy when the file is missing or unreadable.
+    """
+    global _taxonomy
+
+    if _taxonomy is None:
+        with _taxonomy_lock:
+            if _taxonomy is None:
+                try:
+                    _taxonomy = SkillTaxonomy.load(TAXONOMY_PATH)
+                except (OSError, sqlite3.Error):
+                    _taxonomy = SkillTaxonomy.builtin()
+    return _taxonomy
+
+def set_taxonomy(taxonomy: Optional[SkillTaxonomy]) -> None:
+    """Replace the process-wide taxonomy (None reloads it on next use)."""
+    global _taxonomy
+
+    with _taxonomy_lock:
+        _taxonomy = taxonomy
+
+def main(argv: Sequence[str]) -> int:
+    """
+    Build a taxonomy file.
+
+        python -m utils.skill_taxonomy build skills.jsonl [out.sqlite3]
+        python -m utils.skill_taxonomy export-builtin [out.sqlite3]
+    """
+    if len(argv) >= 2 and argv[0] == "build":
+        taxonomy = SkillTaxonomy.from_jsonl(argv[1])
+        out = argv[2] if len(argv) > 2 else TAXONOMY_PATH
+    elif argv and argv[0] == "export-builtin":
+        taxonomy = SkillTaxonomy.builtin()
+        out = argv[1] if len(argv) > 1 else TAXONOMY_PATH
+    else:
+        print(main.__doc__)
+        return 2
+
+    taxonomy.save(out)
+    print(f"Wrote {len(taxonomy)} skills to {out}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))